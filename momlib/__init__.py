@@ -32,26 +32,43 @@ from ._errors import (
     RectangularMatrixError,
     DimensionMismatchError,
 )
+from ._blocked import get_strassen_cutoff, set_strassen_cutoff
 from ._matrix import Matrix
 from ._vector import Vector
+from ._float_matrix import FloatMatrix
+from ._float_vector import FloatVector
+from ._modular import ModularMatrix
+from ._stack import MatrixStack
+from ._echelon import EchelonForm
+from ._lu import LUFactorization
+from ._policy import get_float_policy, set_float_policy
 from ._linalg import (
     cross,
     determinant,
     distance,
+    gram,
     homogenous,
     identity,
     inverse,
+    is_singular,
     join_vectors,
     laplace_expansion,
     limit_denominator,
+    lu,
     magnitude,
     matrix_power,
+    memory_saved,
+    multi_dot,
     normalize,
     orthogonalize,
+    product_rows,
     rank,
     row_reduce,
+    solve,
     transpose,
     split_vectors,
+    verify_inverse,
+    verify_product,
 )
 
 __all__ = (
@@ -60,21 +77,40 @@ __all__ = (
     "DimensionMismatchError",
     "Matrix",
     "Vector",
+    "FloatMatrix",
+    "FloatVector",
+    "ModularMatrix",
+    "MatrixStack",
+    "EchelonForm",
+    "LUFactorization",
+    "get_float_policy",
+    "set_float_policy",
+    "get_strassen_cutoff",
+    "set_strassen_cutoff",
     "cross",
     "determinant",
     "distance",
+    "gram",
     "homogenous",
     "identity",
     "inverse",
+    "is_singular",
     "join_vectors",
     "laplace_expansion",
     "limit_denominator",
+    "lu",
     "magnitude",
     "matrix_power",
+    "memory_saved",
+    "multi_dot",
     "normalize",
     "orthogonalize",
+    "product_rows",
     "rank",
     "row_reduce",
+    "solve",
     "transpose",
     "split_vectors",
+    "verify_inverse",
+    "verify_product",
 )
@@ -0,0 +1,445 @@
+"""
+Provides the multiplication engine that `Matrix` objects use for
+    products of integer numerators. Large products recursively apply
+    the Strassen-Winograd scheme (7 block products instead of 8) until
+    the blocks are smaller than a tunable cutoff, and blocks of small
+    enough integers are multiplied by Kronecker substitution.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from operator import (
+    mul as mul_operator,
+    add as add_operator,
+    sub as sub_operator,
+)
+from typing import Iterable, Iterator, Sequence
+
+__all__ = (
+    "get_strassen_cutoff",
+    "integer_gram",
+    "integer_product",
+    "integer_row_products",
+    "set_strassen_cutoff",
+)
+
+IntRows = Sequence[Sequence[int]]
+
+_strassen_cutoff: int = 64
+
+# Gram products with at most this many vectors compute their triangle
+# directly rather than splitting it into smaller triangles and blocks.
+GRAM_MIN_SPLIT = 64
+
+# Kronecker substitution packs a whole row of the result into a single
+# integer, which only pays off for wide enough results whose elements
+# fit in a few machine words.
+KRONECKER_MIN_COLS = 16
+KRONECKER_MAX_BITS = 512
+
+
+def get_strassen_cutoff() -> int:
+    """
+    Returns the smallest dimension at which matrix products switch to
+        Strassen-Winograd recursion.
+    """
+    return _strassen_cutoff
+
+
+def set_strassen_cutoff(
+    cutoff: int,
+) -> None:
+    """
+    Sets the smallest dimension at which matrix products switch to
+        Strassen-Winograd recursion.
+
+    Arguments
+    - cutoff: The new cutoff, products with any dimension below it use
+        plain dot products.
+
+    Possible Errors
+    - ValueError: If the cutoff is less than 2.
+
+    Notes
+    - Each level of recursion saves one eighth of the multiplications
+        at the cost of extra additions, so the best cutoff is lower for
+        elements with many digits.
+    - Products of small enough integers never recurse, since Kronecker
+        substitution is faster for them.
+    """
+    global _strassen_cutoff
+    if cutoff < 2:
+        raise ValueError("the Strassen cutoff must be at least 2")
+    _strassen_cutoff = cutoff
+
+
+def integer_product(
+    left: IntRows,
+    right: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the matrix product of two integer matrices, given as
+        lists of rows.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix, which must have as
+        many rows as `left` has columns.
+
+    Notes
+    - Strassen-Winograd recursion is only used for elements too large
+        for Kronecker substitution, which is faster whenever it applies.
+    - Odd dimensions are handled by peeling off the last row, column or
+        inner index and fixing up the result with dot products.
+    """
+    rows = len(left)
+    inner = len(right)
+    cols = len(right[0])
+    if (
+        min(rows, inner, cols) < _strassen_cutoff
+        or _digit_bits(left, right) <= KRONECKER_MAX_BITS
+    ):
+        return _dot_product(left, right)
+
+    even_rows = rows - rows % 2
+    even_inner = inner - inner % 2
+    even_cols = cols - cols % 2
+    result = _winograd(
+        [row[:even_inner] for row in left[:even_rows]],
+        [row[:even_cols] for row in right[:even_inner]],
+    )
+    if even_inner != inner:
+        last_right = right[-1][:even_cols]
+        for row, left_row in zip(result, left):
+            factor = left_row[-1]
+            if factor:
+                row[:] = [
+                    item + factor * right_item
+                    for item, right_item in zip(row, last_right)
+                ]
+    if even_cols != cols:
+        last_col = [row[-1] for row in right]
+        for row, left_row in zip(result, left):
+            row.append(sum(map(mul_operator, left_row, last_col)))
+    if even_rows != rows:
+        result.extend(_dot_product(left[even_rows:], right))
+    return result
+
+
+def integer_gram(
+    vectors: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the dot product of every pair of integer vectors, which
+        is the product of the matrix with the vectors as rows and its
+        transpose.
+
+    Arguments
+    - vectors: The vectors, which must all have the same length.
+
+    Notes
+    - The result is symmetric, so large results are split into two
+        smaller triangles and one off-diagonal block, which is mirrored
+        rather than calculated twice.
+    - Small results are calculated whole by Kronecker substitution if
+        it applies, since it is faster than half as many dot products.
+        Otherwise only the dot products on and above the diagonal are
+        calculated.
+    """
+    count = len(vectors)
+    if count > GRAM_MIN_SPLIT:
+        half = count // 2
+        top = integer_gram(vectors[:half])
+        bottom = integer_gram(vectors[half:])
+        block = integer_product(vectors[:half], list(zip(*vectors[half:])))
+        return [row + block_row for row, block_row in zip(top, block)] + [
+            list(block_col) + row
+            for block_col, row in zip(zip(*block), bottom)
+        ]
+
+    if count >= KRONECKER_MIN_COLS:
+        digit_bits = _digit_bits(vectors, vectors)
+        if digit_bits <= KRONECKER_MAX_BITS:
+            return _kronecker_product(
+                vectors, list(zip(*vectors)), (digit_bits + 7) // 8
+            )
+    result = [[0] * count for _ in range(count)]
+    for index, vector in enumerate(vectors):
+        row = result[index]
+        for other_index in range(index, count):
+            item = sum(map(mul_operator, vector, vectors[other_index]))
+            row[other_index] = item
+            result[other_index][index] = item
+    return result
+
+
+def integer_row_products(
+    left: Iterable[Sequence[int]],
+    right: IntRows,
+) -> Iterator[list[int]]:
+    """
+    Lazily calculates the matrix product of two integer matrices, one
+        row at a time.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix, which are only
+        consumed as the rows of the product are.
+    - right: The rows of the right-hand-side matrix.
+
+    Notes
+    - The right-hand-side matrix is only prepared once (transposed, or
+        packed for Kronecker substitution) and shared by every row.
+    - Packings are kept per element width, since the width needed
+        depends on the magnitude of each left-hand-side row.
+    """
+    kronecker = len(right[0]) >= KRONECKER_MIN_COLS
+    fixed_bits = (
+        len(right).bit_length()
+        + max(map(abs, chain.from_iterable(right))).bit_length()
+        + 1
+    )
+    packings: dict[int, tuple[list[int], int]] = {}
+    cols: list[tuple[int, ...]] | None = None
+    for row in left:
+        digit_bits = fixed_bits + max(map(abs, row), default=0).bit_length()
+        if kronecker and digit_bits <= KRONECKER_MAX_BITS:
+            digit_bytes = (digit_bits + 7) // 8
+            packing = packings.get(digit_bytes)
+            if packing is None:
+                packing = packings[digit_bytes] = _kronecker_pack(
+                    right, digit_bytes
+                )
+            yield _kronecker_row(row, *packing, digit_bytes)
+        else:
+            if cols is None:
+                cols = list(zip(*right))
+            yield [sum(map(mul_operator, row, col)) for col in cols]
+
+
+def _winograd(
+    left: IntRows,
+    right: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the matrix product of two integer matrices with even
+        dimensions by one level of Strassen-Winograd recursion.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    """
+    half_rows = len(left) // 2
+    half_inner = len(right) // 2
+    half_cols = len(right[0]) // 2
+    a11, a12, a21, a22 = _quarters(left, half_rows, half_inner)
+    b11, b12, b21, b22 = _quarters(right, half_inner, half_cols)
+
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    m1 = integer_product(a11, b11)
+    m2 = integer_product(a12, b21)
+    m3 = integer_product(s4, b22)
+    m4 = integer_product(a22, t4)
+    m5 = integer_product(s1, t1)
+    m6 = integer_product(s2, t2)
+    m7 = integer_product(s3, t3)
+
+    u2 = _add(m1, m6)
+    u3 = _add(u2, m7)
+    c11 = _add(m1, m2)
+    c12 = _add(_add(u2, m5), m3)
+    c21 = _sub(u3, m4)
+    c22 = _add(u3, m5)
+    return [top + bottom for top, bottom in zip(c11, c12)] + [
+        top + bottom for top, bottom in zip(c21, c22)
+    ]
+
+
+def _dot_product(
+    left: IntRows,
+    right: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the matrix product of two integer matrices directly,
+        either by Kronecker substitution or as the dot product of every
+        row with every column.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    """
+    if len(right[0]) >= KRONECKER_MIN_COLS:
+        digit_bits = _digit_bits(left, right)
+        if digit_bits <= KRONECKER_MAX_BITS:
+            return _kronecker_product(left, right, (digit_bits + 7) // 8)
+    cols = list(zip(*right))
+    return [[sum(map(mul_operator, row, col)) for col in cols] for row in left]
+
+
+def _digit_bits(
+    left: IntRows,
+    right: IntRows,
+) -> int:
+    """
+    Calculates how many bits are needed to hold any element of the
+        product of two integer matrices, including its sign.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    """
+    return (
+        len(right).bit_length()
+        + max(map(abs, chain.from_iterable(left))).bit_length()
+        + max(map(abs, chain.from_iterable(right))).bit_length()
+        + 1
+    )
+
+
+def _kronecker_product(
+    left: IntRows,
+    right: IntRows,
+    digit_bytes: int,
+) -> list[list[int]]:
+    """
+    Calculates the matrix product of two integer matrices by Kronecker
+        substitution.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    - digit_bytes: The width of each packed element, which must hold
+        twice the magnitude of any element of the product.
+
+    Notes
+    - Every right-hand-side row is packed into one integer with one
+        element per digit of `digit_bytes` bytes, so a whole row of the
+        product is a sum of small-by-large integer products, and no
+        individual elements are touched until the result is unpacked.
+    - Elements are offset by half the digit range, so that no digit is
+        negative and each can be unpacked independently.
+    """
+    packed_rows, offsets = _kronecker_pack(right, digit_bytes)
+    return [
+        _kronecker_row(row, packed_rows, offsets, digit_bytes) for row in left
+    ]
+
+
+def _kronecker_pack(
+    right: IntRows,
+    digit_bytes: int,
+) -> tuple[list[int], int]:
+    """
+    Packs every row of the right-hand-side matrix of a product into a
+        single integer for Kronecker substitution.
+
+    Arguments
+    - right: The rows of the right-hand-side matrix.
+    - digit_bytes: The width of each packed element.
+
+    Notes
+    - Returns the packed rows, along with a single packed row of the
+        offsets that were added to every element.
+    """
+    half = 1 << (digit_bytes * 8 - 1)
+    offsets = int.from_bytes(
+        half.to_bytes(digit_bytes, "little") * len(right[0]), "little"
+    )
+    packed_rows = [
+        int.from_bytes(
+            b"".join(
+                (item + half).to_bytes(digit_bytes, "little") for item in row
+            ),
+            "little",
+        )
+        for row in right
+    ]
+    return packed_rows, offsets
+
+
+def _kronecker_row(
+    row: Sequence[int],
+    packed_rows: list[int],
+    offsets: int,
+    digit_bytes: int,
+) -> list[int]:
+    """
+    Calculates one row of a matrix product by Kronecker substitution,
+        given the packed right-hand-side matrix.
+
+    Arguments
+    - row: The row of the left-hand-side matrix.
+    - packed_rows: The packed rows of the right-hand-side matrix.
+    - offsets: The packed row of offsets added to every element.
+    - digit_bytes: The width of each packed element.
+    """
+    half = 1 << (digit_bytes * 8 - 1)
+    row_bytes = (offsets.bit_length() + 7) // 8
+    # The packed rows each carry one set of offsets, so remove all but
+    # the one set that is needed to unpack
+    packed = sum(map(mul_operator, row, packed_rows))
+    packed += (1 - sum(row)) * offsets
+    digits = packed.to_bytes(row_bytes, "little")
+    return [
+        int.from_bytes(digits[start : start + digit_bytes], "little") - half
+        for start in range(0, row_bytes, digit_bytes)
+    ]
+
+
+def _quarters(
+    rows: IntRows,
+    half_rows: int,
+    half_cols: int,
+) -> tuple[IntRows, IntRows, IntRows, IntRows]:
+    """
+    Splits a matrix into its four quadrants.
+
+    Arguments
+    - rows: The rows of the matrix to split.
+    - half_rows: The row count of the top quadrants.
+    - half_cols: The column count of the left quadrants.
+    """
+    top = rows[:half_rows]
+    bottom = rows[half_rows:]
+    return (
+        [row[:half_cols] for row in top],
+        [row[half_cols:] for row in top],
+        [row[:half_cols] for row in bottom],
+        [row[half_cols:] for row in bottom],
+    )
+
+
+def _add(
+    left: IntRows,
+    right: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the element-wise sum of two integer matrices.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    """
+    return [list(map(add_operator, *rows)) for rows in zip(left, right)]
+
+
+def _sub(
+    left: IntRows,
+    right: IntRows,
+) -> list[list[int]]:
+    """
+    Calculates the element-wise difference of two integer matrices.
+
+    Arguments
+    - left: The rows of the left-hand-side matrix.
+    - right: The rows of the right-hand-side matrix.
+    """
+    return [list(map(sub_operator, *rows)) for rows in zip(left, right)]
@@ -0,0 +1,297 @@
+"""
+Implements the `EchelonForm` class (see `help(EchelonForm)`).
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Literal
+
+from ._elimination import Pivoting, bareiss, check_pivoting, integer_rows
+from ._interning import ONE, ZERO, interned_ratio
+from ._matrix import Matrix
+from ._vector import Vector
+
+__all__ = ("EchelonForm",)
+
+
+class EchelonForm(Matrix):
+    """
+    Expresses the row-echelon or reduced row-echelon form of a matrix,
+        along with what was found out about that matrix while it was
+        row-reduced.
+
+    An echelon form is a `Matrix` in every respect, and operations on
+        it give ordinary `Matrix` objects. It also records the column
+        of every pivot and the permutation the rows went through, so
+        the rank, null space, column space and consistency of the
+        matrix it was reduced from can be read off without eliminating
+        again.
+
+    `row_reduce` returns an `EchelonForm` for every `Matrix` it is
+        given.
+    """
+
+    __slots__ = (
+        "_source",
+        "_form",
+        "_pivoting",
+        "_pivot_columns",
+        "_permutation",
+        "_sign",
+    )
+
+    def __init__(
+        self,
+        matrix: Matrix,
+        form: Literal["rref", "ref"] = "rref",
+        pivoting: Pivoting | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the `EchelonForm` class by
+            row-reducing a matrix.
+
+        Arguments
+        - matrix: The matrix to row-reduce.
+        - form: Whether to compute the reduced row-echelon form, or a
+            non-reduced row-echelon form.
+            Optional, defaults to 'rref'.
+        - pivoting: The pivoting strategy, see `row_reduce`.
+            Optional, defaults to 'partial' for the row-echelon form,
+            and otherwise to 'markowitz' for a mostly zero matrix and
+            to 'smallest' for any other matrix.
+
+        Possible Errors
+        - ValueError: If the pivoting strategy is not recognized.
+
+        Notes
+        - Elimination is fraction-free: rows are scaled to integers and
+            only divided (exactly) by the previous pivot, so each
+            element is only divided (and normalized) once, at the end.
+        """
+        strategy = check_pivoting(pivoting)
+        if strategy is None and form == "ref":
+            strategy = "partial"
+        rows, scales = integer_rows(matrix)
+        pivots, pivot_columns, permutation, sign = bareiss(
+            rows, form == "rref", scales, strategy
+        )
+        num_of_cols = matrix.shape[1]
+        data: list[Fraction] = []
+        previous = 1
+        for index, row in enumerate(rows):
+            if index >= len(pivots):
+                data.extend([ZERO] * num_of_cols)
+                continue
+            if form == "rref":
+                # Elimination leaves every pivot equal to the last one
+                denominator = pivots[-1]
+            else:
+                # Each row of the fraction-free form is its ordinary
+                # Gaussian elimination counterpart scaled by the
+                # previous pivot
+                denominator = previous * scales[index]
+                previous = pivots[index]
+            data.extend(interned_ratio(item, denominator) for item in row)
+        # Set instance variables
+        self._data = tuple(data)
+        self._shape = matrix.shape
+        self._offset = 0
+        self._strides = (num_of_cols, 1)
+        self._hash = None
+        self._scaled = None
+        self._source = matrix
+        self._form = form
+        self._pivoting = pivoting
+        self._pivot_columns = tuple(pivot_columns)
+        self._permutation = tuple(permutation)
+        self._sign = sign
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this echelon
+            form.
+
+        Notes
+        - Assuming all relevant libraries have been imported, the
+            reproduction string can be run as valid Python to create
+            an exact copy of this echelon form.
+        """
+        obj_name = self.__class__.__name__
+        matrix = repr(self._source).replace("\n", "\n    ")
+        return (
+            f"{obj_name}(\n    matrix={matrix},\n"
+            f"    form={self._form!r},\n"
+            f"    pivoting={self._pivoting!r},\n)"
+        )
+
+    def column_space(
+        self,
+    ) -> tuple[Vector, ...]:
+        """
+        Returns a basis of the column space of the matrix this echelon
+            form was reduced from.
+
+        Notes
+        - The basis is made of the columns of that matrix which hold a
+            pivot in this echelon form.
+        """
+        return tuple(
+            Vector._adopt(self._source._col(col))
+            for col in self._pivot_columns
+        )
+
+    def is_consistent(
+        self,
+        rhs_columns: int = 1,
+    ) -> bool:
+        """
+        Determines whether the linear system of equations this echelon
+            form was reduced from (as an augmented matrix) has at least
+            one solution.
+
+        Arguments
+        - rhs_columns: The number of columns, at the right of the
+            matrix, that hold right-hand sides.
+            Optional, defaults to 1.
+
+        Possible Errors
+        - ValueError: If the number of right-hand-side columns is not
+            positive, or leaves no coefficient columns.
+
+        Notes
+        - A system is consistent if and only if no pivot lies in a
+            right-hand-side column. With several right-hand sides, this
+            checks that every one of them has a solution.
+        """
+        num_of_cols = self._shape[1]
+        if not 0 < rhs_columns < num_of_cols:
+            raise ValueError(
+                "the number of right-hand-side columns must be in "
+                f"[1, {num_of_cols}), got {rhs_columns}"
+            )
+        return (
+            len(self._pivot_columns) == 0
+            or self._pivot_columns[-1] < num_of_cols - rhs_columns
+        )
+
+    def nullspace(
+        self,
+    ) -> tuple[Vector, ...]:
+        """
+        Returns a basis of the null space of the matrix this echelon
+            form was reduced from.
+
+        Notes
+        - There is one basis vector for every column without a pivot,
+            which holds a one in that column and a zero in every other
+            column without a pivot. The basis is empty if the matrix
+            has full column rank.
+        - Reading the basis off a reduced row-echelon form only needs
+            one element per pivot, a non-reduced one needs back
+            substitution.
+        """
+        num_of_cols = self._shape[1]
+        pivot_columns = self._pivot_columns
+        free_columns = sorted(set(range(num_of_cols)) - set(pivot_columns))
+        basis = []
+        for free in free_columns:
+            solution = [ZERO] * num_of_cols
+            solution[free] = ONE
+            if self._form == "rref":
+                for row, col in enumerate(pivot_columns):
+                    solution[col] = -self._row(row)[free]
+            else:
+                for row in reversed(range(len(pivot_columns))):
+                    col = pivot_columns[row]
+                    items = self._row(row)
+                    total = sum(
+                        (
+                            items[other] * solution[other]
+                            for other in range(col + 1, num_of_cols)
+                            if solution[other] and items[other]
+                        ),
+                        ZERO,
+                    )
+                    solution[col] = -total / items[col]
+            basis.append(Vector._adopt(tuple(solution)))
+        return tuple(basis)
+
+    def row_space(
+        self,
+    ) -> tuple[Vector, ...]:
+        """
+        Returns a basis of the row space of the matrix this echelon
+            form was reduced from.
+
+        Notes
+        - The basis is made of the nonzero rows of this echelon form.
+        """
+        return tuple(
+            Vector._adopt(self._row(row))
+            for row in range(len(self._pivot_columns))
+        )
+
+    # PROPERTIES
+
+    @property
+    def form(
+        self,
+    ) -> Literal["rref", "ref"]:
+        """
+        Returns whether this is a reduced row-echelon form ('rref'), or
+            a non-reduced row-echelon form ('ref').
+        """
+        return self._form
+
+    @property
+    def permutation(
+        self,
+    ) -> tuple[int, ...]:
+        """
+        Returns the row of the original matrix that each row of this
+            echelon form was moved from by pivoting.
+        """
+        return self._permutation
+
+    @property
+    def pivot_columns(
+        self,
+    ) -> tuple[int, ...]:
+        """
+        Returns the column of the pivot of each nonzero row of this
+            echelon form.
+        """
+        return self._pivot_columns
+
+    @property
+    def rank(
+        self,
+    ) -> int:
+        """
+        Returns the rank of this echelon form, which is also the rank
+            of the matrix it was reduced from.
+        """
+        return len(self._pivot_columns)
+
+    @property
+    def sign(
+        self,
+    ) -> int:
+        """
+        Returns the sign (1 or -1) of the row permutation. For a square
+            matrix, its determinant is this sign times the product of
+            the diagonal of its non-reduced row-echelon form.
+        """
+        return self._sign
+
+    @property
+    def source(
+        self,
+    ) -> Matrix:
+        """
+        Returns the matrix this echelon form was reduced from.
+        """
+        return self._source
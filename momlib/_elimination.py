@@ -0,0 +1,303 @@
+"""
+Provides the fraction-free (Bareiss) elimination engine that exact row
+    reduction, determinants and ranks of `Matrix` objects are built on.
+    Rows are scaled to integers once, and every later division is exact,
+    so no fractions are formed until the final result.
+"""
+
+from __future__ import annotations
+
+from math import lcm
+from typing import Iterable, Literal
+
+from ._matrix import Matrix
+
+__all__ = (
+    "Pivoting",
+    "SPARSE_MAX_DENSITY",
+    "bareiss",
+    "check_pivoting",
+    "integer_rows",
+)
+
+# How the pivot of each column is chosen by elimination, see `row_reduce`.
+Pivoting = Literal["partial", "first", "smallest", "markowitz"]
+
+# Elimination only updates the nonzero elements of each row, rather than
+# every element, while at most this fraction of elements is nonzero.
+SPARSE_MAX_DENSITY = 0.25
+
+
+def check_pivoting(
+    pivoting: Pivoting | None,
+) -> Pivoting | None:
+    """
+    Checks a pivoting strategy for exact elimination.
+
+    Arguments
+    - pivoting: The pivoting strategy, or `None` for the default.
+
+    Possible Errors
+    - ValueError: If the pivoting strategy is not recognized.
+    """
+    if pivoting is not None and pivoting not in (
+        "partial",
+        "first",
+        "smallest",
+        "markowitz",
+    ):
+        raise ValueError(
+            "pivoting must be 'partial', 'first', 'smallest' or "
+            f"'markowitz', got {pivoting!r}"
+        )
+    return pivoting
+
+
+def integer_rows(
+    matrix: Matrix,
+) -> tuple[list[list[int]], list[int]]:
+    """
+    Scales every row of a matrix to integers.
+
+    Arguments
+    - matrix: The matrix to scale.
+
+    Notes
+    - Returns the integer rows along with the factor each row was
+        scaled by. Rows share the common denominator of the matrix if
+        it has a scaled form, and otherwise each row is scaled by the
+        least common multiple of its own denominators.
+    """
+    num_of_cols = matrix.shape[1]
+    scaled = matrix._scaled_form()
+    if scaled is not None:
+        numerators, denominator = scaled
+        return [
+            list(numerators[start : start + num_of_cols])
+            for start in range(0, len(numerators), num_of_cols)
+        ], [denominator] * matrix.shape[0]
+    rows = []
+    scales = []
+    for row in matrix:
+        scale = lcm(*(item.denominator for item in row))
+        rows.append(
+            [item.numerator * (scale // item.denominator) for item in row]
+        )
+        scales.append(scale)
+    return rows, scales
+
+
+def bareiss(
+    rows: list[list[int]],
+    reduced: bool,
+    scales: list[int],
+    pivoting: Pivoting | None,
+    multipliers: bool = False,
+) -> tuple[list[int], list[int], list[int], int]:
+    """
+    Using fraction-free (Bareiss) elimination, transforms a matrix of
+        integers in place into row-echelon (or reduced row-echelon)
+        form, up to the scaling of each row.
+
+    Arguments
+    - rows: The rows of the matrix, which are overwritten.
+    - reduced: Whether to also eliminate above each pivot.
+    - scales: The factor each row was scaled by to make it integral,
+        which partial pivoting needs to compare the unscaled rows.
+    - pivoting: The pivoting strategy, see `row_reduce`, or `None` to
+        choose 'markowitz' if the matrix is sparse and 'smallest'
+        otherwise.
+    - multipliers: Whether to leave, in place of each element that is
+        eliminated below a pivot, the element it was before (its
+        multiplier in fraction-free form), as an in-place LU
+        factorization does. Only for the non-reduced form.
+        Optional, defaults to `False`.
+
+    Notes
+    - Returns the pivot of each nonzero row (which is also the leading
+        minor of that size), the column of each pivot, the original
+        position of each row, and the sign of the permutation of the
+        rows. `scales` is permuted along with the rows.
+    - Each update divides by the previous pivot. The division is always
+        exact, and every element stays a minor of the original matrix,
+        so elements never grow past the Hadamard bound.
+    - In reduced form, every pivot equals the last one.
+    - While at most `SPARSE_MAX_DENSITY` of the elements are nonzero,
+        rows are held as dictionaries of their nonzero elements, so
+        updates skip every zero (unless multipliers are kept, which
+        need every row to stay a list).
+    """
+    row_count = len(rows)
+    col_count = len(rows[0])
+    sparse_max = row_count * col_count * SPARSE_MAX_DENSITY
+    nonzero = sum(col_count - row.count(0) for row in rows)
+    if pivoting is None:
+        pivoting = "markowitz" if nonzero <= sparse_max else "smallest"
+    pivots: list[int] = []
+    pivot_cols: list[int] = []
+    permutation = list(range(row_count))
+    sign = 1
+    previous = 1
+    pivot_row = 0
+    pivot_col = 0
+    if nonzero <= sparse_max and not multipliers:
+        sparse_rows = [
+            {col: item for col, item in enumerate(row) if item != 0}
+            for row in rows
+        ]
+        while pivot_col < col_count and pivot_row < row_count:
+            if nonzero > sparse_max:
+                break
+            best = _choose_pivot(
+                (
+                    (index, row[pivot_col], len(row))
+                    for index, row in enumerate(
+                        sparse_rows[pivot_row:], pivot_row
+                    )
+                    if pivot_col in row
+                ),
+                scales,
+                pivoting,
+            )
+            if best is None:
+                pivot_col += 1
+                continue
+            if best != pivot_row:
+                sparse_rows[pivot_row], sparse_rows[best] = (
+                    sparse_rows[best],
+                    sparse_rows[pivot_row],
+                )
+                scales[pivot_row], scales[best] = (
+                    scales[best],
+                    scales[pivot_row],
+                )
+                permutation[pivot_row], permutation[best] = (
+                    permutation[best],
+                    permutation[pivot_row],
+                )
+                sign = -sign
+            pivot_items = sparse_rows[pivot_row]
+            pivot = pivot_items[pivot_col]
+            for index in range(0 if reduced else pivot_row + 1, row_count):
+                if index == pivot_row:
+                    continue
+                row = sparse_rows[index]
+                factor = row.get(pivot_col, 0)
+                if factor != 0:
+                    nonzero -= len(row)
+                    updated = {col: pivot * item for col, item in row.items()}
+                    for col, item in pivot_items.items():
+                        updated[col] = updated.get(col, 0) - factor * item
+                    row = sparse_rows[index] = {
+                        col: item // previous
+                        for col, item in updated.items()
+                        if item != 0
+                    }
+                    nonzero += len(row)
+                elif pivot != previous:
+                    for col, item in row.items():
+                        row[col] = pivot * item // previous
+            pivots.append(pivot)
+            pivot_cols.append(pivot_col)
+            previous = pivot
+            pivot_row += 1
+            pivot_col += 1
+        for index, row in enumerate(sparse_rows):
+            rows[index] = [0] * col_count
+            for col, item in row.items():
+                rows[index][col] = item
+    while pivot_col < col_count and pivot_row < row_count:
+        best = _choose_pivot(
+            (
+                (index, row[pivot_col], col_count - row[pivot_col:].count(0))
+                if pivoting == "markowitz"
+                else (index, row[pivot_col], 0)
+                for index, row in enumerate(rows[pivot_row:], pivot_row)
+                if row[pivot_col] != 0
+            ),
+            scales,
+            pivoting,
+        )
+        if best is None:
+            pivot_col += 1
+            continue
+        if best != pivot_row:
+            rows[pivot_row], rows[best] = rows[best], rows[pivot_row]
+            scales[pivot_row], scales[best] = scales[best], scales[pivot_row]
+            permutation[pivot_row], permutation[best] = (
+                permutation[best],
+                permutation[pivot_row],
+            )
+            sign = -sign
+        pivot_items = rows[pivot_row]
+        pivot = pivot_items[pivot_col]
+        # Rows below the pivot are zero before its column, rows above
+        # it (in reduced form) are not
+        for index in range(0 if reduced else pivot_row + 1, row_count):
+            if index == pivot_row:
+                continue
+            row = rows[index]
+            start = 0 if index < pivot_row else pivot_col
+            factor = row[pivot_col]
+            if factor != 0:
+                row[start:] = [
+                    (pivot * item - factor * pivot_item) // previous
+                    for item, pivot_item in zip(
+                        row[start:], pivot_items[start:]
+                    )
+                ]
+                if multipliers:
+                    row[pivot_col] = factor
+            elif pivot != previous:
+                row[start:] = [
+                    pivot * item // previous for item in row[start:]
+                ]
+        pivots.append(pivot)
+        pivot_cols.append(pivot_col)
+        previous = pivot
+        pivot_row += 1
+        pivot_col += 1
+    return pivots, pivot_cols, permutation, sign
+
+
+def _choose_pivot(
+    candidates: Iterable[tuple[int, int, int]],
+    scales: list[int],
+    pivoting: Pivoting,
+) -> int | None:
+    """
+    Chooses the pivot of a column for fraction-free elimination.
+
+    Arguments
+    - candidates: The row index, element and nonzero element count of
+        every row with a nonzero element in the column, in row order.
+    - scales: The factor each row was scaled by to make it integral.
+    - pivoting: The pivoting strategy, see `row_reduce`.
+
+    Notes
+    - Returns the row index of the pivot, or `None` if there are no
+        candidates.
+    - Every later update multiplies by the pivot, so the fewer bits it
+        has, the less the elements grow. Every row the pivot row is
+        subtracted from gains its nonzero elements, so the fewer it
+        has, the less fill-in there is (this is the Markowitz rule,
+        with the column already fixed).
+    """
+    best = None
+    best_key: tuple[int, int] | None = None
+    best_item = 0
+    for index, item, count in candidates:
+        if pivoting == "first":
+            return index
+        if pivoting == "partial":
+            if best is None or (
+                abs(item) * scales[best] > abs(best_item) * scales[index]
+            ):
+                best = index
+                best_item = item
+            continue
+        key = (count if pivoting == "markowitz" else 0, item.bit_length())
+        if best_key is None or key < best_key:
+            best = index
+            best_key = key
+    return best
@@ -0,0 +1,750 @@
+"""
+Implements the `FloatMatrix` class (see `help(FloatMatrix)`).
+"""
+
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from math import fsum
+from operator import (
+    mul as mul_operator,
+    truediv as truediv_operator,
+    add as add_operator,
+    sub as sub_operator,
+)
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Final,
+    Iterator,
+    overload,
+)
+from collections.abc import (
+    Hashable as HashableABC,
+    Sequence as SequenceABC,
+)
+
+from ._errors import DimensionMismatchError
+from ._float_vector import FloatVector
+from ._storage import normalize_index
+
+__all__ = ("FloatMatrix",)
+
+
+class FloatMatrix(
+    HashableABC,
+    SequenceABC[tuple[float, ...]],
+):
+    """
+    Expresses the mathematical notion of a real-valued matrix using
+        double-precision floating point numbers, as a fast (but
+        inexact) counterpart to `Matrix`.
+
+    Elements are stored row-major in a single compact `array` of C
+        doubles rather than as individual Python objects, and
+        reductions (such as the sums in a matrix product) use
+        `math.fsum` to avoid accumulating rounding errors.
+
+    `FloatMatrix` objects are considered non-mutable, which means that
+        for the life of an object it cannot be meaningfully
+        modified[^1]. Float matrices are, therefore, hashable (using
+        `hash(matrix_instance)`).
+
+    [^1]: If you need to modify a `FloatMatrix`, look into the
+        `matrix_instance.elements` property.
+    """
+
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        initializer: Iterable[Iterable[float | Fraction]],
+    ) -> None:
+        """
+        Initializes a new instance of the `FloatMatrix` class.
+
+        Arguments
+        - initializer: A 2D iterable that will be used to construct the
+            matrix, such as a list of lists of numbers or a `Matrix`.
+
+        Possible Errors
+        - ValueError: If the initializer has no elements, or if the
+            initializer is jagged (not rectangular).
+        """
+        data = array("d")
+        num_of_rows = 0
+        num_of_cols = -1
+        for row in initializer:
+            data.extend(map(float, row))
+            num_of_rows += 1
+            if num_of_cols < 0:
+                num_of_cols = len(data)
+            elif len(data) != num_of_rows * num_of_cols:
+                raise ValueError("matrices must be rectangular (not jagged)")
+        if num_of_rows <= 0 or num_of_cols <= 0:
+            raise ValueError("matrices must have at least one element")
+        self._data: Final[array[float]] = data
+        self._shape: Final[tuple[int, int]] = (num_of_rows, num_of_cols)
+        self._hash: int | None = None
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the total number of elements in this matrix.
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(
+        self,
+        key: tuple[int, int],
+    ) -> float:
+        ...
+
+    @overload
+    def __getitem__(
+        self,
+        key: tuple[slice, int] | tuple[int, slice] | tuple[slice, slice],
+    ) -> FloatMatrix:
+        ...
+
+    def __getitem__(
+        self,
+        key: tuple[int | slice, int | slice],
+    ) -> float | FloatMatrix:
+        """
+        Returns the items at specified coordinates in this matrix.
+
+        Arguments
+        - key: The 0-indexed row-column coordinates of the desired
+            elements.
+
+        Possible Errors
+        - IndexError: If an integer index is out of bounds.
+        - ValueError: If the slice would create a matrix with zero
+            elements.
+        """
+        key_r = key[0]
+        key_c = key[1]
+        num_of_cols = self._shape[1]
+        try:
+            if isinstance(key_r, int) and isinstance(key_c, int):
+                return self._data[
+                    normalize_index(key_r, self._shape[0]) * num_of_cols
+                    + normalize_index(key_c, num_of_cols)
+                ]
+            else:
+                if isinstance(key_r, int):
+                    key_r = normalize_index(key_r, self._shape[0])
+                    range_r = range(key_r, key_r + 1)
+                else:
+                    range_r = range(*key_r.indices(self._shape[0]))
+
+                if isinstance(key_c, int):
+                    key_c = normalize_index(key_c, num_of_cols)
+                    key_c = slice(key_c, key_c + 1)
+
+                if len(range_r) <= 0:
+                    raise ValueError("matrices must have at least one element")
+                data = array("d")
+                for row in range_r:
+                    data.extend(
+                        self._data[
+                            row * num_of_cols : (row + 1) * num_of_cols
+                        ][key_c]
+                    )
+                if len(data) <= 0:
+                    raise ValueError("matrices must have at least one element")
+                return FloatMatrix._adopt(
+                    data, (len(range_r), len(data) // len(range_r))
+                )
+
+        except IndexError:
+            raise IndexError(
+                f"index out of bounds, expected index in "
+                f"([0, {self._shape[0]}), [0, {self._shape[1]})) but "
+                f"received ({key[0]}, {key[1]})"
+            )
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[float, ...]]:
+        """
+        Returns an iterator over the rows of this matrix.
+        """
+        return (tuple(row) for row in self._rows())
+
+    def __str__(
+        self,
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this matrix.
+        """
+        return self._string_format(10, 10, lambda f: "%.3g" % f)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this matrix.
+
+        Notes
+        - Assuming all relevant libraries have been imported, the
+            reproduction string can be run as valid Python to create
+            an exact copy of this matrix.
+        """
+        obj_name = self.__class__.__name__
+        initializer = "[\n        [{}],\n    ]".format(
+            "],\n        [".join(
+                ", ".join(repr(item) for item in row) for row in self
+            )
+        )
+        return f"{obj_name}(\n    initializer={initializer},\n)"
+
+    @overload
+    def __matmul__(
+        self,
+        other: FloatMatrix,
+    ) -> FloatMatrix:
+        ...
+
+    @overload
+    def __matmul__(
+        self,
+        other: FloatVector,
+    ) -> FloatVector:
+        ...
+
+    def __matmul__(
+        self,
+        other: FloatMatrix | FloatVector,
+    ) -> FloatMatrix | FloatVector:
+        """
+        Returns the matrix product of this and another
+            matrix, or of this matrix and a (column) vector.
+
+        Arguments
+        - other: The right-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the column count of `self` does not
+            match the row count (or length) of `other`.
+        """
+        if isinstance(other, FloatVector):
+            if self._shape[1] != len(other):
+                raise DimensionMismatchError(
+                    f"left side columns ({self._shape[1]}) "
+                    f"do not equal right side length ({len(other)})"
+                )
+            return FloatVector._adopt(
+                array(
+                    "d",
+                    (
+                        fsum(map(mul_operator, self_row, other._data))
+                        for self_row in self._rows()
+                    ),
+                )
+            )
+        if not isinstance(other, FloatMatrix):  # type: ignore
+            return NotImplemented
+        if self._shape[1] != other._shape[0]:
+            raise DimensionMismatchError(
+                f"left side columns ({self._shape[1]}) "
+                f"do not equal right side rows ({other._shape[0]}), "
+                "did you mean to find the Hadamard (element-wise) product "
+                "instead? ('*' operator)"
+            )
+        num_of_cols = other._shape[1]
+        other_cols = [
+            other._data[col::num_of_cols] for col in range(num_of_cols)
+        ]
+        return FloatMatrix._adopt(
+            array(
+                "d",
+                (
+                    fsum(map(mul_operator, self_row, other_col))
+                    for self_row in self._rows()
+                    for other_col in other_cols
+                ),
+            ),
+            (self._shape[0], num_of_cols),
+        )
+
+    def __rmatmul__(
+        self,
+        other: FloatVector,
+    ) -> FloatVector:
+        """
+        Returns the matrix product of a (row) vector and this matrix.
+
+        Arguments
+        - other: The left-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the length of `other` does not
+            match the row count of `self`.
+        """
+        if not isinstance(other, FloatVector):  # type: ignore
+            return NotImplemented
+        if len(other) != self._shape[0]:
+            raise DimensionMismatchError(
+                f"left side length ({len(other)}) "
+                f"does not equal right side rows ({self._shape[0]})"
+            )
+        num_of_cols = self._shape[1]
+        return FloatVector._adopt(
+            array(
+                "d",
+                (
+                    fsum(
+                        map(
+                            mul_operator,
+                            other._data,
+                            self._data[col::num_of_cols],
+                        )
+                    )
+                    for col in range(num_of_cols)
+                ),
+            )
+        )
+
+    def __mul__(
+        self,
+        other: FloatMatrix | float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise product of this matrix and either
+            another matrix or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+
+        Notes
+        - To calculate the matrix product of two matrices, use the
+            `__matmul__` (at-sign) operator.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, mul_operator)
+
+    def __rmul__(
+        self,
+        other: float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise product of this matrix and either
+            another matrix or a single number (if this matrix is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+
+        Notes
+        - To calculate the matrix product of two matrices, use the
+            `__matmul__` (at-sign) operator.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, mul_operator)
+
+    def __truediv__(
+        self,
+        other: FloatMatrix | float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise quotient of this matrix and either
+            another matrix or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        - ZeroDivisionError: If `other` is zero, or is a matrix that
+            contains a zero anywhere.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, truediv_operator)
+
+    def __rtruediv__(
+        self,
+        other: float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise quotient of this matrix and either
+            another matrix or a single number (if this matrix is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        - ZeroDivisionError: If `other` is zero, or is a matrix that
+            contains a zero anywhere.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, truediv_operator)
+
+    def __add__(
+        self,
+        other: FloatMatrix | float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise sum of this matrix and either
+            another matrix or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, add_operator)
+
+    def __radd__(
+        self,
+        other: float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise sum of this matrix and either
+            another matrix or a single number (if this matrix is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, add_operator)
+
+    def __sub__(
+        self,
+        other: FloatMatrix | float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise difference of this matrix and either
+            another matrix or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, sub_operator)
+
+    def __rsub__(
+        self,
+        other: float | Fraction,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise difference of this matrix and either
+            another matrix or a single number (if this matrix is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatMatrix, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, sub_operator)
+
+    def __neg__(
+        self,
+    ) -> FloatMatrix:
+        """
+        Calculates the element-wise negation of this matrix.
+        """
+        return self._elwise_operate(-1, True, mul_operator)
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        """
+        Compares this matrix to an object, returns `True` if and only
+            if the right-hand side is a float matrix with the same
+            dimensions as this matrix, such that every element in this
+            matrix is equal to every corresponding element in the
+            `other` matrix (otherwise returns `False`).
+
+        Arguments
+        - other: The object this matrix is to be compared to.
+        """
+        if not isinstance(other, FloatMatrix):
+            return NotImplemented
+        if self._hash is not None and other._hash is not None:
+            if hash(self) != hash(other):
+                return False
+        return self._shape == other._shape and self._data == other._data
+
+    def __or__(
+        self,
+        other: FloatMatrix,
+    ) -> FloatMatrix:
+        """
+        Augments the rows of this matrix with the rows of the
+            `other` matrix.
+
+        Arguments
+        - other: The right-hand side rows to append.
+
+        Possible Errors
+        - DimensionMismatchError: If the two matrices have unequal row
+            counts.
+        """
+        if not isinstance(other, FloatMatrix):  # type: ignore
+            return NotImplemented
+        if self._shape[0] != other._shape[0]:
+            raise DimensionMismatchError(
+                f"left side rows ({self._shape[0]}) "
+                f"do not equal right side rows ({other._shape[0]}), "
+                "cannot augment columns"
+            )
+        data = array("d")
+        for self_row, other_row in zip(self._rows(), other._rows()):
+            data.extend(self_row)
+            data.extend(other_row)
+        return FloatMatrix._adopt(
+            data, (self._shape[0], self._shape[1] + other._shape[1])
+        )
+
+    def __hash__(
+        self,
+    ) -> int:
+        """
+        Returns the hash of this matrix.
+        """
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    # PROPERTIES
+
+    @property
+    def diagonal(
+        self,
+    ) -> Iterable[float]:
+        step = self._shape[1] + 1
+        for i in range(min(self._shape)):
+            yield self._data[i * step]
+
+    @property
+    def elements(
+        self,
+    ) -> list[list[float]]:
+        return [row.tolist() for row in self._rows()]
+
+    @property
+    def shape(
+        self,
+    ) -> tuple[int, int]:
+        return self._shape
+
+    # PRIVATE/PROTECTED METHODS
+
+    @classmethod
+    def _adopt(
+        cls,
+        data: array[float],
+        shape: tuple[int, int],
+    ) -> FloatMatrix:
+        """
+        Creates a matrix that takes ownership of a row-major array of
+            doubles without copying or validating it.
+
+        Arguments
+        - data: The row-major elements of the new matrix.
+        - shape: The row-column shape of the new matrix, the product of
+            which must equal the length of `data`.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._shape = shape
+        matrix._hash = None
+        return matrix
+
+    def _rows(
+        self,
+    ) -> Iterator[array[float]]:
+        """
+        Returns an iterator over the rows of this matrix as arrays.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        num_of_cols = self._shape[1]
+        for start in range(0, len(self._data), num_of_cols):
+            yield self._data[start : start + num_of_cols]
+
+    def _elwise_operate(
+        self,
+        other: FloatMatrix | float | Fraction,
+        self_side_left: bool,
+        operation: Callable[[float, float], float],
+    ) -> FloatMatrix:
+        """
+        Returns a matrix that results from the element-wise operation of
+            two matrices (or one matrix and a number).
+
+        Arguments
+        - other: The right-hand side operand, can be either a matrix or
+            a number (numbers are interpreted as homogenous matrices of
+            the same shape as `self`).
+        - self_side_left: Whether `self` is the left operand (true), or
+            the right operand (false).
+        - operation: The arbitrary operation applied to two elements to
+            create a single result.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatMatrix and does
+            not have the required shape.
+
+        Notes
+        - The operation specified in `operation` may raise errors. These
+            will not be caught by this method.
+        - This is a private method not meant to be exposed.
+        """
+        if isinstance(other, FloatMatrix):
+            if self._shape != other._shape:
+                order = (
+                    ("left", "right") if self_side_left else ("right", "left")
+                )
+                raise DimensionMismatchError(
+                    f"{order[0]} side shape {self._shape} "
+                    f"does not equal {order[1]} side shape {other._shape}"
+                )
+            if self_side_left:
+                data = map(operation, self._data, other._data)
+            else:
+                data = map(operation, other._data, self._data)
+        else:
+            other = float(other)
+            if self_side_left:
+                data = (operation(item, other) for item in self._data)
+            else:
+                data = (operation(other, item) for item in self._data)
+        return FloatMatrix._adopt(array("d", data), self._shape)
+
+    def _string_format(
+        self,
+        max_rows: int,
+        max_cols: int,
+        element_formatter: Callable[[float], str],
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this matrix.
+
+        Arguments
+        - max_rows: The maximum number of rows to print.
+        - max_cols: The maximum number of columns to print.
+        - element_formatter: The operation applied to each element to
+            convert it to a string.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+
+        def format_to_str(n: float, row: int, col: int) -> str:
+            if row >= max_rows:
+                if col >= max_cols:
+                    return "\u22F1"
+                return "\u22EE"
+            elif col >= max_cols:
+                return "\u22EF"
+            else:
+                return element_formatter(n)
+
+        element_strs = [
+            [
+                format_to_str(self[row, col], row, col)
+                for col in range(min(self._shape[1], max_cols + 1))
+            ]
+            for row in range(min(self._shape[0], max_rows + 1))
+        ]
+        column_lengths = [
+            max(
+                (
+                    len(element_strs[row][col])
+                    for row in range(min(len(element_strs), max_rows + 1))
+                )
+            )
+            for col in range(min(len(element_strs[0]), max_cols + 1))
+        ]
+        for row in range(len(element_strs)):
+            for col in range(len(element_strs[row])):
+                element_strs[row][col] = element_strs[row][col].center(
+                    column_lengths[col]
+                )
+
+        dat_str = f" \u2502\n\u2502 ".join(
+            ("  ".join(row) for row in element_strs)
+        )
+        space = " " * (sum(column_lengths) + (2 * len(column_lengths)))
+        return (
+            f"\u250C{space}\u2510\n"
+            f"\u2502 {dat_str} \u2502"
+            f" (size: {self._shape[0]}\u00D7{self._shape[1]})\n"
+            f"\u2514{space}\u2518"
+        )
@@ -0,0 +1,526 @@
+"""
+Implements the `FloatVector` class (see `help(FloatVector)`).
+"""
+
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from math import fsum
+from operator import (
+    mul as mul_operator,
+    truediv as truediv_operator,
+    add as add_operator,
+    sub as sub_operator,
+)
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Final,
+    Iterator,
+    overload,
+)
+from collections.abc import (
+    Hashable as HashableABC,
+    Sequence as SequenceABC,
+)
+
+from ._errors import DimensionMismatchError
+
+__all__ = ("FloatVector",)
+
+
+class FloatVector(
+    HashableABC,
+    SequenceABC[float],
+):
+    """
+    Expresses the mathematical notion of a real-valued vector using
+        double-precision floating point numbers, as a fast (but
+        inexact) counterpart to `Vector`.
+
+    Elements are stored in a compact `array` of C doubles rather than
+        as individual Python objects, and reductions (such as the dot
+        product) use `math.fsum` to avoid accumulating rounding errors.
+
+    `FloatVector` objects are considered non-mutable, which means that
+        for the life of an object it cannot be meaningfully
+        modified[^1]. Float vectors are, therefore, hashable (using
+        `hash(vector_instance)`).
+
+    [^1]: If you need to modify a `FloatVector`, look into the
+        `vector_instance.elements` property.
+    """
+
+    __slots__ = (
+        "_data",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        initializer: Iterable[float | Fraction],
+    ) -> None:
+        """
+        Initializes a new instance of the `FloatVector` class.
+
+        Arguments
+        - initializer: An iterable that will be used to construct the
+            vector, such as a list of numbers or a `Vector`.
+
+        Possible Errors
+        - ValueError: If the initializer has no elements.
+        """
+        data = array("d", map(float, initializer))
+        if len(data) <= 0:
+            raise ValueError("vectors must have at least one element")
+        self._data: Final[array[float]] = data
+        self._hash: int | None = None
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the total number of elements in this vector.
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, key: int) -> float:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> FloatVector:
+        ...
+
+    def __getitem__(
+        self,
+        key: int | slice,
+    ) -> float | FloatVector:
+        """
+        Returns the items at given positions.
+
+        Arguments
+        - key: The 0-indexed position of the desired elements.
+
+        Possible Errors
+        - IndexError: If an integer index is out of bounds.
+        - ValueError: If the slice would create a vector with zero
+            elements.
+        """
+        try:
+            if isinstance(key, int):
+                return self._data[key]
+            else:
+                data = self._data[key]
+                if len(data) <= 0:
+                    raise ValueError("vectors must have at least one element")
+                return FloatVector._adopt(data)
+        except IndexError:
+            raise IndexError(
+                f"index out of bounds, expected index in "
+                f"[0, {len(self._data)}) but received {key}"
+            )
+
+    def __iter__(
+        self,
+    ) -> Iterator[float]:
+        """
+        Returns an iterator over the items of this vector.
+        """
+        return self._data.__iter__()
+
+    def __str__(
+        self,
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this vector.
+        """
+        return self._string_format(10, lambda f: "%.3g" % f)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this vector.
+        """
+        obj_name = self.__class__.__name__
+        initializer = "[{}]".format(
+            ", ".join(repr(item) for item in self._data)
+        )
+        return f"{obj_name}(\n    initializer={initializer},\n)"
+
+    def __matmul__(
+        self,
+        other: FloatVector,
+    ) -> float:
+        """
+        Calculates the dot product of this and another vector.
+
+        Arguments
+        - other: The right-hand-side operand to dot multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the two vectors have different
+            lengths.
+
+        Notes
+        - To calculate the element-wise product of two vectors, use the
+            `__mul__` (asterisk) operator.
+        """
+        if not isinstance(other, FloatVector):  # type: ignore
+            return NotImplemented
+        if len(self._data) != len(other._data):
+            raise DimensionMismatchError(
+                f"left side length ({len(self._data)}) "
+                f"does not match right side length ({len(other._data)})"
+            )
+        return fsum(map(mul_operator, self._data, other._data))
+
+    def __mul__(
+        self,
+        other: FloatVector | float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise product of this vector and either
+            another vector or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+
+        Notes
+        - To calculate the dot product of two vectors, use the
+            `__matmul__` (at-sign) operator.
+        """
+
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, mul_operator)
+
+    def __rmul__(
+        self,
+        other: float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise product of this vector and either
+            another vector or a single number (if this vector is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+
+        Notes
+        - To calculate the dot product of two vectors, use the
+            `__matmul__` (at-sign) operator.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, mul_operator)
+
+    def __truediv__(
+        self,
+        other: FloatVector | float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise quotient of this vector and either
+            another vector or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        - ZeroDivisionError: If `other` is zero, or is a vector that
+            contains a zero anywhere.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, truediv_operator)
+
+    def __rtruediv__(
+        self,
+        other: float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise quotient of this vector and either
+            another vector or a single number (if this vector is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        - ZeroDivisionError: If `other` is zero, or is a vector that
+            contains a zero anywhere.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, truediv_operator)
+
+    def __add__(
+        self,
+        other: FloatVector | float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise sum of this vector and either
+            another vector or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, add_operator)
+
+    def __radd__(
+        self,
+        other: float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise sum of this vector and either
+            another vector or a single number (if this vector is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, add_operator)
+
+    def __sub__(
+        self,
+        other: FloatVector | float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise difference of this vector and either
+            another vector or a single number.
+
+        Arguments
+        - other: The left-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, True, sub_operator)
+
+    def __rsub__(
+        self,
+        other: float | Fraction,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise difference of this vector and either
+            another vector or a single number (if this vector is the
+            right-hand-side operand).
+
+        Arguments
+        - other: The right-hand-side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required shape.
+        """
+        if not isinstance(
+            other,
+            (FloatVector, int, float, Fraction),
+        ):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, False, sub_operator)
+
+    def __neg__(
+        self,
+    ) -> FloatVector:
+        """
+        Calculates the element-wise negation of this vector.
+        """
+        return self._elwise_operate(-1, True, mul_operator)
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        """
+        Compares this vector to an object, returns true if and only
+            if the right-hand side is a float vector with the same
+            length as this vector, such that every element in this
+            vector is equal to every corresponding element in the
+            `other` vector (otherwise returns false).
+
+        Arguments
+        - other: The object this vector is to be compared to.
+        """
+        if not isinstance(other, FloatVector):
+            return NotImplemented
+        if self._hash is not None and other._hash is not None:
+            if hash(self) != hash(other):
+                return False
+        return self._data == other._data
+
+    def __hash__(
+        self,
+    ) -> int:
+        """
+        Returns the hash of this vector.
+        """
+        if self._hash is None:
+            self._hash = hash(tuple(self._data))
+        return self._hash
+
+    # PROPERTIES
+
+    @property
+    def elements(
+        self,
+    ) -> list[float]:
+        return self._data.tolist()
+
+    # PRIVATE/PROTECTED METHODS
+
+    @classmethod
+    def _adopt(
+        cls,
+        data: array[float],
+    ) -> FloatVector:
+        """
+        Creates a vector that takes ownership of a non-empty array of
+            doubles without copying or validating it.
+
+        Arguments
+        - data: The elements of the new vector.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        vector = cls.__new__(cls)
+        vector._data = data
+        vector._hash = None
+        return vector
+
+    def _elwise_operate(
+        self,
+        other: FloatVector | float | Fraction,
+        self_side_left: bool,
+        operation: Callable[[float, float], float],
+    ) -> FloatVector:
+        """
+        Creates and returns a vector that results from the element-
+            wise operation of two vectors (or one vector and a number).
+
+        Arguments
+        - other: The right-hand side operand, can be either a vector or
+            a number (numbers are interpreted as homogenous vectors of
+            the same length as `self`).
+        - self_side_left: Whether `self` is the left operand (true), or
+            the right operand (false).
+        - operation: The arbitrary operation applied to two elements to
+            create a single result.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a FloatVector and does
+            not have the required length.
+
+        Notes
+        - The operation specified in `operation` may raise errors. These
+            will not be caught by this method.
+        - This is a private method not meant to be exposed.
+        """
+        if isinstance(other, FloatVector):
+            if len(self._data) != len(other._data):
+                order = (
+                    ("left", "right") if self_side_left else ("right", "left")
+                )
+                raise DimensionMismatchError(
+                    f"{order[0]} side length {len(self._data)} "
+                    f"does not equal {order[1]} side length "
+                    f"{len(other._data)}"
+                )
+            if self_side_left:
+                data = map(operation, self._data, other._data)
+            else:
+                data = map(operation, other._data, self._data)
+        else:
+            other = float(other)
+            if self_side_left:
+                data = (operation(item, other) for item in self._data)
+            else:
+                data = (operation(other, item) for item in self._data)
+        return FloatVector._adopt(array("d", data))
+
+    def _string_format(
+        self,
+        max_elements: int,
+        element_formatter: Callable[[float], str],
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this vector.
+
+        Arguments
+        - max_elements: The maximum number of elements to print.
+        - element_formatter: The operation applied to each element to
+            convert it to a string.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+
+        def format_as_str(n: float, idx: int) -> str:
+            if idx >= max_elements:
+                return "\u22EF"
+            else:
+                return element_formatter(n)
+
+        length = len(self._data)
+        return (
+            f"\u27E8 "
+            + ", ".join(
+                (
+                    format_as_str(self._data[element], element)
+                    for element in range(min(length, max_elements + 1))
+                )
+            )
+            + f" \u27E9 (size: {length})"
+        )
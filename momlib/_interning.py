@@ -0,0 +1,74 @@
+"""
+Provides shared `Fraction` instances for small whole numbers, so that
+    matrices and vectors full of values such as 0, 1 and -1 reference
+    one object per value rather than allocating one object per element.
+
+Fractions are immutable, so sharing an instance between any number of
+    matrices and vectors is always safe.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Final
+
+__all__ = (
+    "INTERNED_RANGE",
+    "ONE",
+    "ZERO",
+    "interned",
+    "interned_ratio",
+)
+
+# Whole numbers in [-INTERNED_RANGE, INTERNED_RANGE] are interned.
+INTERNED_RANGE: Final[int] = 256
+
+# Keys compare (and hash) equal to ints, floats and fractions of the
+# same value, so one lookup serves every kind of number.
+_INTERNED: Final[dict[int, Fraction]] = {
+    value: Fraction(value)
+    for value in range(-INTERNED_RANGE, INTERNED_RANGE + 1)
+}
+
+ZERO: Final[Fraction] = _INTERNED[0]
+ONE: Final[Fraction] = _INTERNED[1]
+
+
+def interned(
+    value: int | float | Fraction,
+) -> Fraction:
+    """
+    Converts a number to a fraction, returning the shared instance if
+        the number is a small whole number.
+
+    Arguments
+    - value: The number to convert.
+    """
+    shared = _INTERNED.get(value)  # type: ignore
+    if shared is not None:
+        return shared
+    if type(value) is Fraction:
+        return value
+    return Fraction(value)
+
+
+def interned_ratio(
+    numerator: int,
+    denominator: int,
+) -> Fraction:
+    """
+    Creates the fraction with the given numerator and denominator,
+        returning the shared instance if it is a small whole number.
+
+    Arguments
+    - numerator: The numerator.
+    - denominator: The nonzero denominator.
+
+    Possible Errors
+    - ZeroDivisionError: If `denominator` is zero.
+    """
+    if denominator == 1 or (numerator == 0 and denominator != 0):
+        shared = _INTERNED.get(numerator)
+        if shared is not None:
+            return shared
+    return Fraction(numerator, denominator)
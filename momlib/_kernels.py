@@ -0,0 +1,290 @@
+"""
+Provides straight-line kernels for matrix products, determinants and
+    inverses of small fixed sizes. Each kernel is a Python function
+    without any loops or indexing, generated from its size on first use
+    and cached for every later call.
+
+Kernels take and return flat row-major sequences of elements, and only
+    use addition, subtraction and multiplication, so they work equally
+    on integers (such as the numerators of a scaled matrix), fractions
+    and floats.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Final, Sequence
+
+__all__ = (
+    "KERNEL_MAX_SIZE",
+    "adjugate_kernel",
+    "determinant_kernel",
+    "product_kernel",
+)
+
+# Kernels are only generated up to this side length, above it the code
+# grows faster than the loops it replaces are slowed down by overhead.
+KERNEL_MAX_SIZE: Final[int] = 6
+
+Kernel = Callable[..., Any]
+
+_kernels: dict[tuple[str, int, int, int], Kernel] = {}
+
+
+def product_kernel(
+    rows: int,
+    inner: int,
+    cols: int,
+) -> Kernel:
+    """
+    Returns the kernel that calculates the matrix product of a `rows`
+        by `inner` matrix and an `inner` by `cols` matrix.
+
+    Arguments
+    - rows: The row count of the left-hand-side matrix.
+    - inner: The column count of the left-hand-side matrix.
+    - cols: The column count of the right-hand-side matrix.
+
+    Notes
+    - The kernel takes the row-major elements of both matrices, and
+        returns a tuple of the row-major elements of their product.
+    """
+    key = ("product", rows, inner, cols)
+    kernel = _kernels.get(key)
+    if kernel is None:
+        elements = ",\n        ".join(
+            " + ".join(
+                f"a{row * inner + k} * b{k * cols + col}" for k in range(inner)
+            )
+            for row in range(rows)
+            for col in range(cols)
+        )
+        kernel = _kernels[key] = _compile(
+            "product",
+            ["a", "b"],
+            [
+                _unpack("a", rows * inner),
+                _unpack("b", inner * cols),
+                f"return (\n        {elements},\n    )",
+            ],
+        )
+    return kernel
+
+
+def determinant_kernel(
+    size: int,
+) -> Kernel:
+    """
+    Returns the kernel that calculates the determinant of a square
+        matrix.
+
+    Arguments
+    - size: The side length of the matrix.
+
+    Notes
+    - The kernel takes the row-major elements of the matrix, and
+        returns its determinant.
+    - The determinant is expanded by minors, and every minor is only
+        calculated once, no matter how many larger minors share it.
+    """
+    key = ("determinant", size, size, size)
+    kernel = _kernels.get(key)
+    if kernel is None:
+        minors = _Minors(size)
+        result = minors.minor(tuple(range(size)), tuple(range(size)))
+        kernel = _kernels[key] = _compile(
+            "determinant",
+            ["a"],
+            [_unpack("a", size * size), *minors.lines, f"return {result}"],
+        )
+    return kernel
+
+
+def adjugate_kernel(
+    size: int,
+) -> Kernel:
+    """
+    Returns the kernel that calculates the determinant and adjugate of
+        a square matrix, from which its inverse follows.
+
+    Arguments
+    - size: The side length of the matrix.
+
+    Notes
+    - The kernel takes the row-major elements of the matrix, and
+        returns its determinant along with a tuple of the row-major
+        elements of its adjugate. The inverse is the adjugate divided
+        by the determinant, if the determinant is nonzero.
+    """
+    key = ("adjugate", size, size, size)
+    kernel = _kernels.get(key)
+    if kernel is None:
+        minors = _Minors(size)
+        cofactors = _cofactors(minors, size)
+        cofactor_lines = _cofactor_lines(cofactors, size)
+        adjugate = ",\n        ".join(
+            cofactors[col][row] for row in range(size) for col in range(size)
+        )
+        kernel = _kernels[key] = _compile(
+            "adjugate",
+            ["a"],
+            [
+                _unpack("a", size * size),
+                *minors.lines,
+                *cofactor_lines,
+                f"return {_determinant(cofactors, size)}, (\n"
+                f"        {adjugate},\n    )",
+            ],
+        )
+    return kernel
+
+
+class _Minors:
+    """
+    Generates the lines of code that calculate minors of a square
+        matrix, expanding each along its first row and sharing every
+        smaller minor between all of the larger minors that need it.
+    """
+
+    def __init__(
+        self,
+        size: int,
+    ) -> None:
+        """
+        Creates a generator for the minors of a square matrix.
+
+        Arguments
+        - size: The side length of the matrix.
+        """
+        self.size = size
+        self.lines: list[str] = []
+        self._names: dict[tuple[tuple[int, ...], tuple[int, ...]], str] = {}
+
+    def minor(
+        self,
+        rows: tuple[int, ...],
+        cols: tuple[int, ...],
+    ) -> str:
+        """
+        Returns the expression for a minor, generating the lines of code
+            that calculate it (and any smaller minors) if needed.
+
+        Arguments
+        - rows: The rows of the minor, in ascending order.
+        - cols: The columns of the minor, in ascending order.
+        """
+        if len(rows) == 1:
+            return f"a{rows[0] * self.size + cols[0]}"
+        name = self._names.get((rows, cols))
+        if name is None:
+            terms = []
+            for index, col in enumerate(cols):
+                sub_minor = self.minor(
+                    rows[1:], cols[:index] + cols[index + 1 :]
+                )
+                sign = " - " if index % 2 else " + "
+                terms.append(
+                    f"{sign}a{rows[0] * self.size + col} * {sub_minor}"
+                )
+            name = self._names[(rows, cols)] = f"m{len(self._names)}"
+            self.lines.append(f"{name} = {''.join(terms)[3:]}")
+        return name
+
+
+def _cofactors(
+    minors: _Minors,
+    size: int,
+) -> list[list[str]]:
+    """
+    Returns the expressions for every cofactor of a square matrix, as
+        a list of rows.
+
+    Arguments
+    - minors: The generator for the minors of the matrix.
+    - size: The side length of the matrix.
+    """
+    if size == 1:
+        return [["1"]]
+    everything = tuple(range(size))
+    return [
+        [
+            minors.minor(
+                everything[:row] + everything[row + 1 :],
+                everything[:col] + everything[col + 1 :],
+            )
+            for col in range(size)
+        ]
+        for row in range(size)
+    ]
+
+
+def _cofactor_lines(
+    cofactors: list[list[str]],
+    size: int,
+) -> list[str]:
+    """
+    Returns the lines of code that turn minors into signed cofactors,
+        replacing the expressions in `cofactors` with their names.
+
+    Arguments
+    - cofactors: The minor expressions, as a list of rows.
+    - size: The side length of the matrix.
+    """
+    lines = []
+    for row in range(size):
+        for col in range(size):
+            name = f"c{row * size + col}"
+            sign = "-" if (row + col) % 2 else ""
+            lines.append(f"{name} = {sign}{cofactors[row][col]}")
+            cofactors[row][col] = name
+    return lines
+
+
+def _determinant(
+    cofactors: list[list[str]],
+    size: int,
+) -> str:
+    """
+    Returns the expression for the determinant of a square matrix, by
+        expanding it along the first row of its cofactors.
+
+    Arguments
+    - cofactors: The cofactor names, as a list of rows.
+    - size: The side length of the matrix.
+    """
+    return " + ".join(f"a{col} * {cofactors[0][col]}" for col in range(size))
+
+
+def _unpack(
+    name: str,
+    length: int,
+) -> str:
+    """
+    Returns the line of code that unpacks a sequence argument into one
+        local variable per element.
+
+    Arguments
+    - name: The name of the argument, and prefix of the variables.
+    - length: The length of the sequence.
+    """
+    targets = ", ".join(f"{name}{index}" for index in range(length))
+    return f"{targets}, = {name}"
+
+
+def _compile(
+    name: str,
+    parameters: Sequence[str],
+    lines: Sequence[str],
+) -> Kernel:
+    """
+    Compiles the body of a kernel into a function.
+
+    Arguments
+    - name: The name of the function.
+    - parameters: The names of the parameters of the function.
+    - lines: The lines of the body of the function, without indentation.
+    """
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def {name}({', '.join(parameters)}):\n{body}"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<momlib {name} kernel>", "exec"), namespace)
+    return namespace[name]
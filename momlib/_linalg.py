@@ -1,42 +1,88 @@
 """
 Provides an assortment of more advanced linear algebra tools to work
-    with `Vector` and `Matrix` objects.
+    with `Vector` and `Matrix` objects (and their floating point
+    counterparts, `FloatVector` and `FloatMatrix`).
 """
 
 from __future__ import annotations
 
+from array import array
 from fractions import Fraction
-from math import sqrt, acos
-from typing import Iterable, Literal, overload
+from math import acos, ceil, fsum, log2, sqrt
+from sys import float_info, getsizeof
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    overload,
+)
 from functools import reduce
+from itertools import chain, tee
 from operator import mul as mul_operator
+from random import getrandbits
 
 from ._errors import (
     DimensionMismatchError,
     LinearDependenceError,
     RectangularMatrixError,
 )
+from ._blocked import integer_gram, integer_row_products
+from ._echelon import EchelonForm
+from ._elimination import Pivoting, bareiss, check_pivoting, integer_rows
+from ._float_matrix import FloatMatrix
+from ._float_vector import FloatVector
+from ._interning import ONE, ZERO, interned_ratio
+from ._lu import LUFactorization
+from ._kernels import (
+    KERNEL_MAX_SIZE,
+    adjugate_kernel,
+    determinant_kernel,
+)
 from ._matrix import Matrix
+from ._modular import ModularMatrix, modular_rank, random_prime
+from ._policy import to_fractions
+from ._scaled import Scaled, dot_products, to_scaled
+from ._stack import MatrixStack
 from ._vector import Vector
 
+# How many random primes the probabilistic rank and singularity checks
+# try before trusting a rank deficiency found modulo each of them.
+PROBABILISTIC_TRIALS = 2
+
+# The default largest chance of accepting a wrong matrix product or
+# inverse when verifying one.
+VERIFY_ERROR_PROBABILITY = 2.0**-64
+
 __all__ = (
     "cross",
     "determinant",
     "distance",
+    "gram",
     "homogenous",
     "identity",
     "inverse",
+    "is_singular",
     "join_vectors",
     "laplace_expansion",
     "limit_denominator",
+    "lu",
     "magnitude",
     "matrix_power",
+    "memory_saved",
+    "multi_dot",
     "normalize",
     "orthogonalize",
+    "product_rows",
     "rank",
     "row_reduce",
+    "solve",
     "transpose",
     "split_vectors",
+    "verify_inverse",
+    "verify_product",
 )
 
 
@@ -96,25 +142,59 @@ def cross(
     if len(vectors) != v_len - 1:
         raise ValueError("exactly n-1 n-dimensional vectors must be given")
     matrix = join_vectors(homogenous(v_len, 1), *vectors, orientation="row")
-    return Vector(
-        coefficient * determinant(matrix)
-        for matrix, coefficient in laplace_expansion(matrix)
+    return Vector._adopt(
+        tuple(
+            coefficient * determinant(matrix)
+            for matrix, coefficient in laplace_expansion(matrix)
+        )
     )
 
 
+@overload
 def determinant(
     matrix: Matrix,
+    pivoting: Pivoting | None = None,
 ) -> Fraction:
+    ...
+
+
+@overload
+def determinant(
+    matrix: FloatMatrix,
+    pivoting: Pivoting | None = None,
+) -> float:
+    ...
+
+
+@overload
+def determinant(
+    matrix: MatrixStack,
+    pivoting: Pivoting | None = None,
+) -> tuple[Fraction, ...]:
+    ...
+
+
+def determinant(
+    matrix: Matrix | FloatMatrix | MatrixStack,
+    pivoting: Pivoting | None = None,
+) -> Fraction | float | tuple[Fraction, ...]:
     """
     Calculates the determinant of a matrix, which represents the scaling
         factor a matrix would apply when acting as a linear
         transformation.
 
     Arguments
-    - matrix: The matrix for which the determinant is to be calculated.
+    - matrix: The matrix for which the determinant is to be calculated,
+        or a stack of matrices to calculate every determinant of.
+    - pivoting: The pivoting strategy of elimination, see `row_reduce`.
+        Optional, defaults to 'markowitz' for a mostly zero `Matrix`,
+        to 'smallest' for any other `Matrix`, and to 'partial' for a
+        `FloatMatrix`.
 
     Possible Errors
     - RectangularMatrixError: If `matrix` is not a square matrix.
+    - ValueError: If the pivoting strategy is not recognized, or does
+        not apply to `matrix`.
     """
     if matrix.shape[0] != matrix.shape[1]:
         raise RectangularMatrixError(
@@ -122,21 +202,36 @@ def determinant(
             "matrices, this matrix has a shape of "
             f"({matrix.shape[0]},{matrix.shape[1]})"
         )
-    if matrix.shape == (1, 1):
-        return matrix[0, 0]
-    if matrix.shape == (2, 2):
-        return (matrix[0, 0] * matrix[1, 1]) - (matrix[1, 0] * matrix[0, 1])
-    if matrix.shape == (3, 3):
-        return (
-            (matrix[0, 0] * matrix[1, 1] * matrix[2, 2])
-            + (matrix[0, 1] * matrix[1, 2] * matrix[2, 0])
-            + (matrix[0, 2] * matrix[1, 0] * matrix[2, 1])
-            - (matrix[0, 2] * matrix[1, 1] * matrix[2, 0])
-            - (matrix[0, 1] * matrix[1, 0] * matrix[2, 2])
-            - (matrix[0, 0] * matrix[1, 2] * matrix[2, 1])
+    if isinstance(matrix, FloatMatrix):
+        upper, sign = _float_eliminate(
+            matrix, False, _float_pivoting(pivoting)
+        )
+        return reduce(mul_operator, upper.diagonal, float(sign))
+    pivoting = check_pivoting(pivoting)
+    side_len = matrix.shape[0]
+    if isinstance(matrix, MatrixStack):
+        if side_len > KERNEL_MAX_SIZE:
+            return tuple(determinant(item, pivoting) for item in matrix)
+        kernel = determinant_kernel(side_len)
+        return tuple(
+            _kernel_determinant(kernel, items, scaled, side_len)
+            for items, scaled in matrix._parts()
+        )
+    scaled = matrix._scaled_form()
+    if side_len <= KERNEL_MAX_SIZE:
+        return _kernel_determinant(
+            determinant_kernel(side_len), matrix._flat(), scaled, side_len
+        )
+    if scaled is not None:
+        return interned_ratio(
+            _integer_determinant(scaled[0], side_len, pivoting),
+            scaled[1] ** side_len,
         )
-    upper, sign = _ref(matrix)
-    return reduce(mul_operator, upper.diagonal, Fraction(sign))
+    rows, scales = integer_rows(matrix)
+    pivots, _, _, sign = bareiss(rows, False, scales, pivoting)
+    if len(pivots) < side_len:
+        return ZERO
+    return interned_ratio(sign * pivots[-1], reduce(mul_operator, scales))
 
 
 def distance(
@@ -167,6 +262,96 @@ def distance(
     return sqrt(difference @ difference)
 
 
+@overload
+def gram(
+    matrix: Matrix,
+    orientation: Literal["col", "row"] = "col",
+) -> Matrix:
+    ...
+
+
+@overload
+def gram(
+    matrix: FloatMatrix,
+    orientation: Literal["col", "row"] = "col",
+) -> FloatMatrix:
+    ...
+
+
+def gram(
+    matrix: Matrix | FloatMatrix,
+    orientation: Literal["col", "row"] = "col",
+) -> Matrix | FloatMatrix:
+    """
+    Calculates the Gram matrix of the columns or rows of a matrix, that
+        is, the dot product of every pair of them.
+
+    Arguments
+    - matrix: The matrix whose columns or rows to take dot products of.
+    - orientation: Whether to take the columns, calculating the product
+        of the transpose of `matrix` and `matrix`, or the rows,
+        calculating the product of `matrix` and its transpose.
+        Optional, defaults to 'col'.
+
+    Notes
+    - The result is symmetric, so only the dot products on and above
+        the diagonal are calculated, and the transpose of `matrix` is
+        never built.
+    """
+    rows, cols = matrix.shape
+    if orientation == "col":
+        count, length, step, stride = cols, rows, 1, cols
+    else:  # if orientation == "row":
+        count, length, step, stride = rows, cols, cols, 1
+
+    if isinstance(matrix, FloatMatrix):
+        float_vectors = [
+            matrix._data[index * step :: stride][:length]
+            for index in range(count)
+        ]
+        float_result = array("d", bytes(8 * count * count))
+        for index, vector in enumerate(float_vectors):
+            for other_index in range(index, count):
+                item = fsum(
+                    map(mul_operator, vector, float_vectors[other_index])
+                )
+                float_result[index * count + other_index] = item
+                float_result[other_index * count + index] = item
+        return FloatMatrix._adopt(float_result, (count, count))
+
+    scaled = matrix._scaled_form()
+    if scaled is not None:
+        numerators, denominator = scaled
+        vectors = [
+            numerators[index * step :: stride][:length]
+            for index in range(count)
+        ]
+        return Matrix._from_scaled(
+            (
+                tuple(chain.from_iterable(integer_gram(vectors))),
+                denominator * denominator,
+            ),
+            (count, count),
+        )
+
+    # Give every row or column its own common denominator instead
+    # (with no size limit, `to_scaled` never returns `None`)
+    scaled_vectors: list[Scaled] = [
+        to_scaled(vector._items(), None)  # type: ignore
+        for vector in split_vectors(matrix, orientation)
+    ]
+    result = [[ZERO] * count for _ in range(count)]
+    for index, (vector, vector_den) in enumerate(scaled_vectors):
+        for other_index in range(index, count):
+            other, other_den = scaled_vectors[other_index]
+            item = interned_ratio(
+                sum(map(mul_operator, vector, other)), vector_den * other_den
+            )
+            result[index][other_index] = item
+            result[other_index][index] = item
+    return Matrix._adopt(tuple(chain.from_iterable(result)), (count, count))
+
+
 @overload
 def homogenous(
     shape: tuple[int, int],
@@ -196,13 +381,22 @@ def homogenous(
         the desired vector.
     - value: The value with which to fill the matrix.
         Optional, defaults to 0.
+
+    Possible Errors
+    - ValueError: If the shape has a dimension of 0 (or less).
+
+    Notes
+    - Every element references the same fraction object.
     """
+    fill = to_fractions((value,), None)[0]
     if isinstance(shape, tuple):
-        return Matrix(
-            (value for _ in range(shape[1])) for _ in range(shape[0])
-        )
+        if shape[0] <= 0 or shape[1] <= 0:
+            raise ValueError("matrices must have at least one element")
+        return Matrix._adopt((fill,) * (shape[0] * shape[1]), shape)
     else:  # if isinstance(shape, int):
-        return Vector(value for _ in range(shape))
+        if shape <= 0:
+            raise ValueError("vectors must have at least one element")
+        return Vector._adopt((fill,) * shape)
 
 
 def identity(
@@ -219,24 +413,61 @@ def identity(
     """
     if side_length <= 0:
         raise ValueError("The size of an identity matrix must be at least 1")
-    return Matrix(
-        (1 if i == j else 0 for i in range(side_length))
-        for j in range(side_length)
+    return Matrix._adopt(
+        tuple(
+            ONE if i == j else ZERO
+            for j in range(side_length)
+            for i in range(side_length)
+        ),
+        (side_length, side_length),
     )
 
 
+@overload
 def inverse(
     matrix: Matrix,
+    pivoting: Pivoting | None = None,
 ) -> Matrix:
+    ...
+
+
+@overload
+def inverse(
+    matrix: FloatMatrix,
+    pivoting: Pivoting | None = None,
+) -> FloatMatrix:
+    ...
+
+
+@overload
+def inverse(
+    matrix: MatrixStack,
+    pivoting: Pivoting | None = None,
+) -> MatrixStack:
+    ...
+
+
+def inverse(
+    matrix: Matrix | FloatMatrix | MatrixStack,
+    pivoting: Pivoting | None = None,
+) -> Matrix | FloatMatrix | MatrixStack:
     """
     Inverts a matrix with respect to matrix multiplication.
 
     Arguments
-    - matrix: The matrix to invert.
+    - matrix: The matrix to invert, or a stack of matrices to invert
+        every one of.
+    - pivoting: The pivoting strategy of elimination, see `row_reduce`.
+        Optional, defaults to 'markowitz' for a mostly zero `Matrix`,
+        to 'smallest' for any other `Matrix`, and to 'partial' for a
+        `FloatMatrix`.
 
     Possible Errors
     - RectangularMatrixError: If `matrix` is not a square matrix.
-    - LinearDependenceError: If `matrix` is non-invertible.
+    - LinearDependenceError: If `matrix` is non-invertible (for a
+        `FloatMatrix`, if it is singular to working precision).
+    - ValueError: If the pivoting strategy is not recognized, or does
+        not apply to `matrix`.
     """
     side_len = matrix.shape[0]
     if side_len != matrix.shape[1]:
@@ -245,16 +476,94 @@ def inverse(
             "matrices, this matrix has a shape of "
             f"({matrix.shape[0]},{matrix.shape[1]})"
         )
-    reduction = row_reduce(matrix | identity(side_len))
+    if isinstance(matrix, FloatMatrix):
+        reduction = _float_eliminate(
+            matrix | FloatMatrix(identity(side_len)),
+            True,
+            _float_pivoting(pivoting),
+            side_len,
+        )[0]
+    elif isinstance(matrix, MatrixStack):
+        if side_len > KERNEL_MAX_SIZE:
+            pivoting = check_pivoting(pivoting)
+            return MatrixStack(inverse(item, pivoting) for item in matrix)
+        kernel = adjugate_kernel(side_len)
+        data: list[Fraction] = []
+        for index, (items, scaled) in enumerate(matrix._parts()):
+            inverse_items = _kernel_inverse(kernel, items, scaled)
+            if inverse_items is None:
+                raise LinearDependenceError(
+                    f"cannot invert linearly dependent matrix {index} "
+                    "of the stack"
+                )
+            data.extend(inverse_items)
+        return MatrixStack._adopt(tuple(data), matrix.shape, len(matrix))
+    elif side_len <= KERNEL_MAX_SIZE:
+        inverse_items = _kernel_inverse(
+            adjugate_kernel(side_len), matrix._flat(), matrix._scaled_form()
+        )
+        if inverse_items is None:
+            raise LinearDependenceError(
+                "cannot invert linearly dependent matrices"
+            )
+        return Matrix._adopt(inverse_items, matrix.shape)
+    else:
+        factorization = LUFactorization(matrix, pivoting)
+        if factorization.is_singular():
+            raise LinearDependenceError(
+                "cannot invert linearly dependent matrices"
+            )
+        return factorization.inverse()
     inversion = reduction[:, side_len:]
     for i in reduction.diagonal:
-        if i != Fraction(1):
+        if i != 1:
             raise LinearDependenceError(
                 "cannot invert linearly dependent matrices"
             )
     return inversion
 
 
+def is_singular(
+    matrix: Matrix | FloatMatrix | ModularMatrix,
+    method: Literal["exact", "probabilistic"] = "exact",
+) -> bool:
+    """
+    Determines whether a square matrix is singular (non-invertible).
+
+    Arguments
+    - matrix: The matrix to check.
+    - method: Whether a singular result must be confirmed exactly, or
+        may be trusted once it has been found modulo several random
+        primes (see `rank`).
+        Optional, defaults to 'exact'.
+
+    Possible Errors
+    - RectangularMatrixError: If `matrix` is not a square matrix.
+
+    Notes
+    - A `Matrix` is first reduced modulo a random word-sized prime. If
+        it is invertible there, it is invertible over the rationals, so
+        the common (non-singular) case never leaves small-integer
+        arithmetic.
+    """
+    side_len = matrix.shape[0]
+    if side_len != matrix.shape[1]:
+        raise RectangularMatrixError(
+            "singularity is only defined for square "
+            "matrices, this matrix has a shape of "
+            f"({matrix.shape[0]},{matrix.shape[1]})"
+        )
+    if isinstance(matrix, FloatMatrix):
+        return determinant(matrix) == 0.0
+    if isinstance(matrix, ModularMatrix):
+        return modular_rank(matrix) < side_len
+    if _modular_rank_bound(matrix, method) == side_len:
+        return False
+    if method == "probabilistic":
+        return True
+    return determinant(matrix) == 0
+
+
 def join_vectors(
     *vectors: Vector,
     orientation: Literal["col", "row"] = "col",
@@ -283,10 +592,14 @@ def join_vectors(
                 "all vectors must have the same length to be "
                 "joined into a matrix"
             )
+    rows = Matrix._adopt(
+        tuple(chain.from_iterable(vector._items() for vector in vectors)),
+        (len(vectors), v_len),
+    )
     if orientation == "col":
-        return Matrix(row for row in zip(*vectors))
+        return rows._transpose()
     else:  # if orientation == "row":
-        return Matrix(vectors)
+        return rows
 
 
 def laplace_expansion(
@@ -314,10 +627,15 @@ def laplace_expansion(
         )
     for i in range(matrix.shape[1]):
         yield (
-            Matrix(
-                (item for c, item in enumerate(row) if c != i)
-                for r, row in enumerate(matrix)
-                if r != 0
+            Matrix._adopt(
+                tuple(
+                    item
+                    for r, row in enumerate(matrix)
+                    if r != 0
+                    for c, item in enumerate(row)
+                    if c != i
+                ),
+                (matrix.shape[0] - 1, matrix.shape[1] - 1),
             ),
             (1 if i % 2 == 0 else -1) * matrix[0, i],
         )
@@ -361,16 +679,50 @@ def limit_denominator(
             "maximum denominator must be a nonzero positive integer"
         )
     if isinstance(arg, Matrix):
-        return Matrix(
-            (item.limit_denominator(max_denominator) for item in row)
-            for row in arg
+        return Matrix._adopt(
+            tuple(
+                item.limit_denominator(max_denominator) for item in arg._flat()
+            ),
+            arg.shape,
         )
     else:  # if isinstance(arg, Vector):
-        return Vector(item.limit_denominator(max_denominator) for item in arg)
+        return Vector._adopt(
+            tuple(item.limit_denominator(max_denominator) for item in arg)
+        )
+
+
+def lu(
+    matrix: Matrix,
+    pivoting: Pivoting | None = None,
+) -> LUFactorization:
+    """
+    Factorizes a square matrix into a permutation, a unit lower
+        triangular and an upper triangular matrix, so that linear
+        systems of equations with the same matrix can be solved again
+        and again without eliminating it again.
+
+    Arguments
+    - matrix: The square matrix to factorize.
+    - pivoting: The pivoting strategy of elimination, see `row_reduce`.
+        Optional, defaults to 'markowitz' for a mostly zero matrix and
+        to 'smallest' for any other matrix.
+
+    Possible Errors
+    - RectangularMatrixError: If `matrix` is not a square matrix.
+    - ValueError: If the pivoting strategy is not recognized.
+
+    Notes
+    - See `LUFactorization` for what can be done with the result. Its
+        `solve`, `determinant` and `inverse` methods all reuse the
+        elimination done here.
+    - Prefer `solve` for a single system, and `lu` for a matrix that
+        is solved against more than once.
+    """
+    return LUFactorization(matrix, pivoting)
 
 
 def magnitude(
-    vector: Vector,
+    vector: Vector | FloatVector,
 ) -> float:
     """
     Calculates the magnitude (length) of a given vector.
@@ -381,6 +733,8 @@ def magnitude(
     Notes
     - May introduce floating point errors.
     """
+    if isinstance(vector, FloatVector):
+        return sqrt(fsum(n * n for n in vector._data))
     return sqrt(sum((n * n for n in vector)))
 
 
@@ -417,9 +771,141 @@ def matrix_power(
     return fast_pow(identity_mat, matrix, power)
 
 
+def memory_saved(
+    arg: Matrix | Vector,
+) -> int:
+    """
+    Calculates how many bytes of memory a matrix or vector saves by
+        having elements reference shared fraction objects (such as the
+        interned small whole numbers) rather than copies of them.
+
+    Arguments
+    - arg: The matrix or vector to inspect.
+
+    Notes
+    - Only the fraction objects themselves are counted, not the
+        integers they hold.
+    """
+    items = arg._flat() if isinstance(arg, Matrix) else arg._items()
+    seen: set[int] = set()
+    saved = 0
+    for item in items:
+        if id(item) in seen:
+            saved += getsizeof(item)
+        else:
+            seen.add(id(item))
+    return saved
+
+
+@overload
+def multi_dot(
+    *matrices: Matrix,
+) -> Matrix:
+    ...
+
+
+@overload
+def multi_dot(
+    *matrices: FloatMatrix,
+) -> FloatMatrix:
+    ...
+
+
+def multi_dot(
+    *matrices: Matrix | FloatMatrix,
+) -> Matrix | FloatMatrix:
+    """
+    Calculates the product of a chain of matrices, multiplying them in
+        the order that is estimated to be cheapest.
+
+    Arguments
+    - *matrices: The matrices to multiply, from left to right.
+
+    Possible Errors
+    - ValueError: If no matrices are given.
+    - DimensionMismatchError: If any matrix does not have as many
+        columns as the next one has rows.
+
+    Notes
+    - The order is chosen by the classic dynamic programming solution
+        to the matrix chain problem, where the cost of each product is
+        its number of element multiplications weighed by the estimated
+        size of the elements being multiplied.
+    - The result is the same in any order, only the work differs.
+    """
+    if len(matrices) == 0:
+        raise ValueError("at least one matrix must be given")
+    for left, right in zip(matrices, matrices[1:]):
+        if left.shape[1] != right.shape[0]:
+            raise DimensionMismatchError(
+                f"left matrix width ({left.shape[1]}) "
+                f"does not equal right matrix height ({right.shape[0]})"
+            )
+    count = len(matrices)
+    if count <= 2:
+        return reduce(lambda left, right: left @ right, matrices)
+
+    dims = [matrix.shape[0] for matrix in matrices]
+    dims.append(matrices[-1].shape[1])
+    # bits[i][j] estimates the element size of the product of matrices
+    # i through j, costs[i][j] the cheapest way to calculate it and
+    # splits[i][j] the last product of that cheapest way
+    bits = [[0] * count for _ in range(count)]
+    costs = [[0] * count for _ in range(count)]
+    splits = [[0] * count for _ in range(count)]
+    for index, matrix in enumerate(matrices):
+        bits[index][index] = _element_bits(matrix)
+    for span in range(1, count):
+        for start in range(count - span):
+            end = start + span
+            best_cost = -1
+            for split in range(start, end):
+                cost = (
+                    costs[start][split]
+                    + costs[split + 1][end]
+                    + dims[start]
+                    * dims[split + 1]
+                    * dims[end + 1]
+                    * _digit_cost(bits[start][split])
+                    * _digit_cost(bits[split + 1][end])
+                )
+                if best_cost < 0 or cost < best_cost:
+                    best_cost = cost
+                    splits[start][end] = split
+            costs[start][end] = best_cost
+            split = splits[start][end]
+            bits[start][end] = (
+                bits[start][split]
+                + bits[split + 1][end]
+                + dims[split + 1].bit_length()
+            )
+
+    def chain_product(start: int, end: int) -> Matrix | FloatMatrix:
+        if start == end:
+            return matrices[start]
+        split = splits[start][end]
+        return chain_product(start, split) @ chain_product(split + 1, end)
+
+    return chain_product(0, count - 1)
+
+
+@overload
 def normalize(
     vector: Vector,
 ) -> Vector:
+    ...
+
+
+@overload
+def normalize(
+    vector: FloatVector,
+) -> FloatVector:
+    ...
+
+
+def normalize(
+    vector: Vector | FloatVector,
+) -> Vector | FloatVector:
     """
     Calculates an approximately normal vector.
 
@@ -439,13 +925,29 @@ def normalize(
         raise ZeroDivisionError(
             "vectors with magnitude 0 cannot be normalized"
         )
+    elif isinstance(vector, FloatVector):
+        return vector / mag
     else:
         return Vector(n / mag for n in vector)
 
 
+@overload
 def orthogonalize(
     *vectors: Vector,
 ) -> list[Vector]:
+    ...
+
+
+@overload
+def orthogonalize(
+    *vectors: FloatVector,
+) -> list[FloatVector]:
+    ...
+
+
+def orthogonalize(
+    *vectors: Vector | FloatVector,
+) -> list[Vector] | list[FloatVector]:
     """
     Using the Gram-Schmidt process, creates an orthogonal basis from a
         set of vectors.
@@ -478,6 +980,7 @@ def orthogonalize(
             )
     if len(vectors) != v_len:
         raise ValueError("exactly n n-dimensional vectors must be given")
+    zero = vectors[0] * 0
     u_vectors: list[Vector] = []
     try:
         for k in range(len(vectors)):
@@ -491,7 +994,7 @@ def orthogonalize(
                     )
                     for i in range(k)
                 ),
-                start=homogenous(v_len, 0),
+                start=zero,
             )
     except ZeroDivisionError:
         raise LinearDependenceError(
@@ -501,44 +1004,313 @@ def orthogonalize(
     return u_vectors
 
 
+def product_rows(
+    left: Matrix,
+    right: Matrix,
+) -> Iterator[Vector]:
+    """
+    Lazily calculates the matrix product of two matrices, one row at a
+        time.
+
+    Arguments
+    - left: The left-hand-side matrix.
+    - right: The right-hand-side matrix.
+
+    Possible Errors
+    - DimensionMismatchError: If the width of `left` does not equal the
+        height of `right`.
+
+    Notes
+    - Each row of the product is only calculated once it is consumed,
+        so the whole product is never held in memory unless the caller
+        keeps every row.
+    - The columns of `right` are only prepared once, and shared by the
+        calculation of every row.
+    """
+    if left.shape[1] != right.shape[0]:
+        raise DimensionMismatchError(
+            f"left matrix width ({left.shape[1]}) "
+            f"does not equal right matrix height ({right.shape[0]})"
+        )
+    # Give every row of `left` its own common denominator, so that no
+    # pass over the whole of `left` is needed
+    # (with no size limit, `to_scaled` never returns `None`)
+    left_rows: Iterator[Scaled] = (
+        to_scaled(row._items(), None)  # type: ignore
+        for row in split_vectors(left, "row")
+    )
+    right_scaled = right._scaled_form()
+    if right_scaled is None:
+        right_cols: list[Scaled] = [
+            to_scaled(col._items(), None)  # type: ignore
+            for col in split_vectors(right, "col")
+        ]
+        return (
+            Vector._adopt(dot_products((row_scaled,), right_cols))
+            for row_scaled in left_rows
+        )
+    right_nums, right_den = right_scaled
+    num_of_cols = right.shape[1]
+    right_rows = [
+        right_nums[start : start + num_of_cols]
+        for start in range(0, len(right_nums), num_of_cols)
+    ]
+    left_nums, left_dens = tee(left_rows)
+    return (
+        Vector._from_scaled((tuple(numerators), left_den * right_den))
+        for numerators, (_, left_den) in zip(
+            integer_row_products((nums for nums, _ in left_nums), right_rows),
+            left_dens,
+        )
+    )
+
+
 def rank(
-    matrix: Matrix,
+    matrix: Matrix | FloatMatrix | ModularMatrix,
+    method: Literal["exact", "probabilistic"] = "exact",
+    pivoting: Pivoting | None = None,
 ) -> int:
     """
     Calculates the rank of a given matrix.
 
     Arguments
     - matrix: The matrix the rank is to be calculated from.
+    - method: Whether the rank of a rank-deficient `Matrix` must be
+        confirmed by exact elimination, or may be taken as the highest
+        rank found modulo several random primes.
+        Optional, defaults to 'exact'.
+    - pivoting: The pivoting strategy of elimination, see `row_reduce`.
+        Optional, defaults to 'markowitz' for a mostly zero `Matrix`,
+        to 'smallest' for any other `Matrix`, and to 'partial' for a
+        `FloatMatrix`.
+
+    Possible Errors
+    - ValueError: If the pivoting strategy is not recognized, or does
+        not apply to `matrix`.
+
+    Notes
+    - A `Matrix` is first reduced modulo a random word-sized prime. The
+        rank modulo a prime never exceeds the rational rank, so if it
+        is full the result is exact and no fractions are ever formed.
+    - The probabilistic method can only underestimate the rank, and
+        only if every prime tried divides every nonzero maximal minor,
+        which is vanishingly unlikely for random 30-bit primes.
+    - The rank of a `ModularMatrix` is its rank over the integers
+        modulo its modulus, where pivoting has no effect.
+    - The rank of an `EchelonForm` is read off its pivots, without any
+        elimination.
     """
-    matrix_ref = row_reduce(matrix, "ref")
-    rank_count = 0
-    for i in range(min(matrix_ref.shape)):
-        if matrix_ref[i, i] == 0:
-            break
-        else:
-            rank_count += 1
-    return rank_count
+    if isinstance(matrix, ModularMatrix):
+        return modular_rank(matrix)
+    if isinstance(matrix, EchelonForm):
+        return matrix.rank
+    if isinstance(matrix, Matrix):
+        pivoting = check_pivoting(pivoting)
+        rank_bound = _modular_rank_bound(matrix, method)
+        if rank_bound == min(matrix.shape) or method == "probabilistic":
+            return rank_bound
+        rows, scales = integer_rows(matrix)
+        return len(bareiss(rows, False, scales, pivoting)[0])
+    matrix_ref = row_reduce(matrix, "ref", pivoting)
+    return sum(1 for row in matrix_ref if any(row))
 
 
+@overload
 def row_reduce(
     matrix: Matrix,
     form: Literal["rref", "ref"] = "rref",
-) -> Matrix:
+    pivoting: Pivoting | None = None,
+) -> EchelonForm:
+    ...
+
+
+@overload
+def row_reduce(
+    matrix: FloatMatrix,
+    form: Literal["rref", "ref"] = "rref",
+    pivoting: Pivoting | None = None,
+) -> FloatMatrix:
+    ...
+
+
+@overload
+def row_reduce(
+    matrix: MatrixStack,
+    form: Literal["rref", "ref"] = "rref",
+    pivoting: Pivoting | None = None,
+) -> MatrixStack:
+    ...
+
+
+def row_reduce(
+    matrix: Matrix | FloatMatrix | MatrixStack,
+    form: Literal["rref", "ref"] = "rref",
+    pivoting: Pivoting | None = None,
+) -> EchelonForm | FloatMatrix | MatrixStack:
     """
     Computes a row-echelon or reduced row-echelon form matrix by row
         reduction.
 
     Arguments
-    - matrix: The matrix to row-reduce.
+    - matrix: The matrix to row-reduce, or a stack of matrices to
+        row-reduce every one of.
     - form: Whether to compute the reduced row-echelon form by
         Gauss-Jordan elimination, or compute a non-reduced row-echelon
         form by simple Gaussian elimination.
         Optional, defaults to 'rref'.
+    - pivoting: How to choose the pivot of each column, either
+        'partial' (the entry of largest magnitude), 'first' (the first
+        nonzero entry) or, for a `Matrix` only, 'smallest' (the entry
+        that takes the fewest bits in fraction-free form) or
+        'markowitz' (the entry whose row has the fewest nonzero
+        entries, then the fewest bits).
+        Optional, defaults to 'partial' for a `FloatMatrix` and for
+        the row-echelon form, and otherwise to 'markowitz' if at most
+        `SPARSE_MAX_DENSITY` of the entries are nonzero, and to
+        'smallest' if not.
+
+    Possible Errors
+    - ValueError: If the pivoting strategy is not recognized, or does
+        not apply to `matrix`.
+
+    Notes
+    - For a `Matrix`, the result is an `EchelonForm`, which also
+        records the pivot columns, row permutation and rank.
+    - For a `Matrix`, elimination is fraction-free: rows are scaled to
+        integers and only divided (exactly) by the previous pivot, so
+        no fractions are formed until the final result.
+    - For a `Matrix`, partial pivoting does nothing for numerical
+        stability, but gives the same row-echelon form as textbook
+        Gaussian elimination. Pivoting on the smallest entries keeps
+        intermediate elements smaller, and pivoting on the sparsest
+        rows keeps zeros from filling in, which both make elimination
+        faster. The reduced row-echelon form is the same whatever the
+        pivots.
+    - Elimination of a mostly zero `Matrix` only updates its nonzero
+        entries, for as long as it stays mostly zero.
+    - For a `FloatMatrix`, entries that are negligible relative to the
+        largest entry of `matrix` are treated as zero.
+    """
+    if isinstance(matrix, FloatMatrix):
+        return _float_eliminate(
+            matrix, form == "rref", _float_pivoting(pivoting)
+        )[0]
+    if isinstance(matrix, MatrixStack):
+        check_pivoting(pivoting)
+        return MatrixStack._adopt(
+            tuple(
+                chain.from_iterable(
+                    EchelonForm(
+                        Matrix._adopt(items, matrix.shape), form, pivoting
+                    )._flat()
+                    for items, _ in matrix._parts()
+                )
+            ),
+            matrix.shape,
+            len(matrix),
+        )
+    return EchelonForm(matrix, form, pivoting)
+
+
+@overload
+def solve(
+    matrix: Matrix,
+    rhs: Vector,
+) -> Vector:
+    ...
+
+
+@overload
+def solve(
+    matrix: Matrix,
+    rhs: Matrix,
+) -> Matrix:
+    ...
+
+
+@overload
+def solve(
+    matrix: FloatMatrix,
+    rhs: FloatVector,
+) -> FloatVector:
+    ...
+
+
+@overload
+def solve(
+    matrix: FloatMatrix,
+    rhs: FloatMatrix,
+) -> FloatMatrix:
+    ...
+
+
+def solve(
+    matrix: Matrix | FloatMatrix,
+    rhs: Vector | Matrix | FloatVector | FloatMatrix,
+) -> Vector | Matrix | FloatVector | FloatMatrix:
+    """
+    Solves a linear system of equations, finding the vector (or matrix)
+        that `matrix` maps onto `rhs`.
+
+    Arguments
+    - matrix: The square matrix of coefficients of the system.
+    - rhs: The right-hand side of the system, either a vector, or a
+        matrix with one right-hand side per column.
+
+    Possible Errors
+    - RectangularMatrixError: If `matrix` is not a square matrix.
+    - DimensionMismatchError: If the length (or height) of `rhs` does
+        not equal the side length of `matrix`.
+    - LinearDependenceError: If `matrix` is singular, so the system has
+        no unique solution (for a `FloatMatrix`, if it is singular to
+        working precision).
+
+    Notes
+    - Faster than multiplying `rhs` by the inverse of `matrix`, which
+        is never calculated.
+    - To solve against the same (exact) matrix more than once, factorize
+        it once with `lu` and use the `solve` method of the result.
     """
-    if form == "rref":
-        return _rref(matrix)
-    else:  # if form == "ref":
-        return _ref(matrix)[0]
+    side_len = matrix.shape[0]
+    if side_len != matrix.shape[1]:
+        raise RectangularMatrixError(
+            "only square matrices define systems with unique solutions, "
+            f"this matrix has a shape of ({side_len},{matrix.shape[1]})"
+        )
+    rhs_matrix: Matrix | FloatMatrix
+    if isinstance(rhs, FloatVector):
+        rhs_matrix = FloatMatrix._adopt(array("d", rhs._data), (len(rhs), 1))
+    elif isinstance(rhs, Vector):
+        rhs_matrix = join_vectors(rhs)
+    else:
+        rhs_matrix = rhs
+    if rhs_matrix.shape[0] != side_len:
+        raise DimensionMismatchError(
+            f"right-hand side height ({rhs_matrix.shape[0]}) "
+            f"does not equal matrix side length ({side_len})"
+        )
+
+    solution: Matrix | FloatMatrix
+    if isinstance(matrix, Matrix) and side_len <= KERNEL_MAX_SIZE:
+        solution = _kernel_solve(matrix, rhs_matrix)  # type: ignore
+    elif isinstance(matrix, Matrix):
+        solution = LUFactorization(matrix).solve(rhs_matrix)  # type: ignore
+    else:
+        reduction = _float_eliminate(
+            matrix | rhs_matrix, True, "partial", side_len
+        )[0]
+        for i in reduction.diagonal:
+            if i != 1:
+                raise LinearDependenceError(
+                    "cannot solve systems of linearly dependent equations"
+                )
+        solution = reduction[:, side_len:]
+
+    if isinstance(rhs, FloatVector):
+        return FloatVector._adopt(solution._data)  # type: ignore
+    if isinstance(rhs, Vector):
+        return Vector._adopt(solution._flat())  # type: ignore
+    return solution
 
 
 def split_vectors(
@@ -553,11 +1325,33 @@ def split_vectors(
     - orientation: Whether to interpret the given matrix as a collection
         of columns, or a list of rows.
         Optional, defaults to 'col'.
+
+    Notes
+    - The vectors are views that share the elements of `matrix`, no
+        elements are copied.
     """
+    rows, cols = matrix.shape
+    row_stride, col_stride = matrix._strides
     if orientation == "col":
-        return (Vector(col) for col in zip(*iter(matrix)))
+        return (
+            Vector._view(
+                matrix._data,
+                rows,
+                matrix._offset + col * col_stride,
+                row_stride,
+            )
+            for col in range(cols)
+        )
     else:  # if orientation == "row":
-        return (Vector(col) for col in matrix)
+        return (
+            Vector._view(
+                matrix._data,
+                cols,
+                matrix._offset + row * row_stride,
+                col_stride,
+            )
+            for row in range(rows)
+        )
 
 
 def transpose(
@@ -568,110 +1362,504 @@ def transpose(
 
     Arguments
     - matrix: The matrix to transpose.
+
+    Notes
+    - The transpose is a view that shares the elements of `matrix`, no
+        elements are copied.
+    """
+    return matrix._transpose()
+
+
+def verify_inverse(
+    matrix: Matrix,
+    inverse_matrix: Matrix,
+    error_probability: float = VERIFY_ERROR_PROBABILITY,
+) -> bool:
     """
-    return Matrix(
-        (matrix[i, j] for i in range(matrix.shape[0]))
-        for j in range(matrix.shape[1])
+    Checks whether a matrix is the inverse of another, without
+        calculating any matrix products.
+
+    Arguments
+    - matrix: The matrix that was inverted.
+    - inverse_matrix: The supposed inverse of `matrix`.
+    - error_probability: The largest acceptable chance of accepting a
+        wrong inverse.
+        Optional, defaults to `VERIFY_ERROR_PROBABILITY`.
+
+    Possible Errors
+    - RectangularMatrixError: If `matrix` is not a square matrix.
+    - ValueError: If `error_probability` is not between 0 and 1.
+
+    Notes
+    - Uses the same check as `verify_product`, with the product being
+        the identity matrix.
+    - A correct inverse is always accepted.
+    """
+    side_len = matrix.shape[0]
+    if side_len != matrix.shape[1]:
+        raise RectangularMatrixError("only square matrices have inverses")
+    if inverse_matrix.shape != matrix.shape:
+        return False
+    return verify_product(
+        matrix, inverse_matrix, identity(side_len), error_probability
+    )
+
+
+def verify_product(
+    left: Matrix,
+    right: Matrix,
+    product: Matrix,
+    error_probability: float = VERIFY_ERROR_PROBABILITY,
+) -> bool:
+    """
+    Checks whether a matrix is the product of two others, without
+        calculating any matrix products.
+
+    Arguments
+    - left: The left-hand-side matrix of the product.
+    - right: The right-hand-side matrix of the product.
+    - product: The supposed product of `left` and `right`.
+    - error_probability: The largest acceptable chance of accepting a
+        wrong product.
+        Optional, defaults to `VERIFY_ERROR_PROBABILITY`.
+
+    Possible Errors
+    - DimensionMismatchError: If the width of `left` does not equal the
+        height of `right`.
+    - ValueError: If `error_probability` is not between 0 and 1.
+
+    Notes
+    - Uses Freivalds' algorithm: the product is multiplied by a random
+        vector, and the result compared to multiplying `right` and then
+        `left` by it, which only takes matrix-vector products.
+    - A correct product is always accepted. A wrong one is accepted
+        only if the random vector lies in a particular hyperplane, and
+        elements are drawn from enough values for this to happen with
+        at most `error_probability` chance, in a single trial.
+    - Also verifies the solution of a linear system of equations, as
+        the product of the system and its solution.
+    - If the matrices have no shared denominators worth scaling to,
+        both sides are compared modulo a random prime of at least 64
+        more bits than the elements of the random vector, which only
+        adds a negligible chance of accepting a wrong product.
+    """
+    if left.shape[1] != right.shape[0]:
+        raise DimensionMismatchError(
+            f"left matrix width ({left.shape[1]}) "
+            f"does not equal right matrix height ({right.shape[0]})"
+        )
+    if product.shape != (left.shape[0], right.shape[1]):
+        return False
+    check = _random_integers(right.shape[1], error_probability)
+    left_scaled = left._scaled_form()
+    right_scaled = right._scaled_form()
+    product_scaled = product._scaled_form()
+    if (
+        left_scaled is not None
+        and right_scaled is not None
+        and product_scaled is not None
+    ):
+        # Compare the numerators over a common denominator, which skips
+        # forming any fractions
+        left_nums, left_den = left_scaled
+        right_nums, right_den = right_scaled
+        product_nums, product_den = product_scaled
+        inner = _integer_matvec(
+            left_nums,
+            _integer_matvec(right_nums, check),
+        )
+        outer = _integer_matvec(product_nums, check)
+        return all(
+            inner_item * product_den == outer_item * left_den * right_den
+            for inner_item, outer_item in zip(inner, outer)
+        )
+    # Without shared denominators, even a single row of the product can
+    # have a common denominator of many thousands of bits, so compare
+    # both sides modulo a large random prime instead, which keeps every
+    # number small
+    while True:
+        modulus = random_prime(max(check, default=0).bit_length() + 64)
+        try:
+            left_rows, right_rows, product_rows = (
+                ModularMatrix(matrix, modulus).elements
+                for matrix in (left, right, product)
+            )
+        except ZeroDivisionError:
+            continue  # a denominator is a multiple of the modulus
+        break
+    inner = [sum(map(mul_operator, row, check)) for row in right_rows]
+    return all(
+        (
+            sum(map(mul_operator, left_row, inner))
+            - sum(map(mul_operator, product_row, check))
+        )
+        % modulus
+        == 0
+        for left_row, product_row in zip(left_rows, product_rows)
     )
 
 
 # PRIVATE/PROTECTED METHODS
 
 
-def _ref(
-    matrix: Matrix,
-) -> tuple[Matrix, int]:
+def _float_pivoting(
+    pivoting: Pivoting | None,
+) -> Literal["partial", "first"]:
     """
-    Using Gaussian elimination, calculates and returns the row-echelon
-        form of a matrix.
+    Checks the pivoting strategy for elimination of a `FloatMatrix`.
 
     Arguments
-    - matrix: The matrix to row-reduce.
+    - pivoting: The pivoting strategy, or `None` for the default.
+
+    Possible Errors
+    - ValueError: If the pivoting strategy is not recognized, or only
+        applies to exact elimination.
     """
+    if pivoting is None:
+        return "partial"
+    if pivoting not in ("partial", "first"):
+        raise ValueError(
+            "pivoting for float matrices must be 'partial' or 'first', "
+            f"got {pivoting!r}"
+        )
+    return pivoting
+
+
+def _float_eliminate(
+    matrix: FloatMatrix,
+    reduced: bool,
+    pivoting: Literal["partial", "first"] = "partial",
+    coefficient_cols: int | None = None,
+) -> tuple[FloatMatrix, int]:
+    """
+    Using Gaussian (or Gauss-Jordan) elimination, calculates the
+        row-echelon (or reduced row-echelon) form of a float matrix,
+        along with the sign of the row permutation.
 
-    # Adapted from:
-    # https://en.wikipedia.org/wiki/Gaussian_elimination
-    # #Pseudocode
+    Arguments
+    - matrix: The matrix to row-reduce.
+    - reduced: Whether to compute the reduced row-echelon form.
+    - pivoting: Whether to pivot on the largest entry of each column
+        (partial pivoting), or on the first one that is not
+        negligible.
+        Optional, defaults to 'partial'.
+    - coefficient_cols: The number of leading columns that hold the
+        coefficients of a system, when the columns after them are
+        augmented onto it (such as right-hand sides, or the identity
+        matrix of an inversion).
+        Optional, defaults to every column.
 
+    Notes
+    - Entries no larger than the largest coefficient, scaled by the
+        largest dimension of the coefficients and the machine epsilon,
+        are treated as (and set to) zero. Augmented columns take no
+        part in this, so their scale never makes the coefficients
+        look singular.
+    """
+    row_count, col_count = matrix.shape
     list_mat = matrix.elements
-    lm_shape = matrix.shape
-    row_count = lm_shape[0]
-    col_count = lm_shape[1]
+    if coefficient_cols is None:
+        coefficient_cols = col_count
+    tolerance = (
+        max(abs(item) for row in list_mat for item in row[:coefficient_cols])
+        * max(row_count, coefficient_cols)
+        * float_info.epsilon
+    )
     pivot_row = 0
-    pivot_col = 0
     det_sign = 1
 
-    while pivot_row < row_count and pivot_col < col_count:
-        max_row = max(
-            (
-                (abs(list_mat[i][pivot_col]), i)
-                for i in range(pivot_row, row_count)
-            ),
-            key=lambda x: x[0],
-        )[1]
-        if list_mat[max_row][pivot_col] == Fraction(0):
-            pivot_col += 1
+    for pivot_col in range(col_count):
+        if pivot_row >= row_count:
+            break
+        if pivoting == "first":
+            max_row = next(
+                (
+                    i
+                    for i in range(pivot_row, row_count)
+                    if abs(list_mat[i][pivot_col]) > tolerance
+                ),
+                pivot_row,
+            )
         else:
-            if max_row != pivot_row:
-                list_mat[pivot_row], list_mat[max_row] = (
-                    list_mat[max_row],
-                    list_mat[pivot_row],
-                )
-                det_sign = -det_sign
-            for row in range(pivot_row + 1, row_count):
-                factor = (
-                    list_mat[row][pivot_col] / list_mat[pivot_row][pivot_col]
+            max_row = max(
+                range(pivot_row, row_count),
+                key=lambda i: abs(list_mat[i][pivot_col]),
+            )
+        if abs(list_mat[max_row][pivot_col]) <= tolerance:
+            for row in range(pivot_row, row_count):
+                list_mat[row][pivot_col] = 0.0
+            continue
+        if max_row != pivot_row:
+            list_mat[pivot_row], list_mat[max_row] = (
+                list_mat[max_row],
+                list_mat[pivot_row],
+            )
+            det_sign = -det_sign
+        pivot = list_mat[pivot_row]
+        if reduced:
+            scale = pivot[pivot_col]
+            pivot[pivot_col:] = [item / scale for item in pivot[pivot_col:]]
+            pivot[pivot_col] = 1.0
+            targets = range(row_count)
+        else:
+            targets = range(pivot_row + 1, row_count)
+        for row in targets:
+            current = list_mat[row]
+            if row == pivot_row or not current[pivot_col]:
+                continue
+            factor = current[pivot_col] / pivot[pivot_col]
+            current[pivot_col:] = [
+                item - pivot_item * factor
+                for item, pivot_item in zip(
+                    current[pivot_col:], pivot[pivot_col:]
                 )
-                list_mat[row][pivot_col] = Fraction(0)
-                for col in range(pivot_col + 1, col_count):
-                    list_mat[row][col] -= list_mat[pivot_row][col] * factor
-            pivot_row += 1
-            pivot_col += 1
-    return Matrix(list_mat), det_sign
+            ]
+            current[pivot_col] = 0.0
+        pivot_row += 1
+    return (
+        FloatMatrix._adopt(
+            array("d", chain.from_iterable(list_mat)), matrix.shape
+        ),
+        det_sign,
+    )
+
 
+def _integer_determinant(
+    items: tuple[int, ...],
+    side_length: int,
+    pivoting: Pivoting | None,
+) -> int:
+    """
+    Calculates the determinant of a square matrix of integers without
+        leaving integer arithmetic.
+
+    Arguments
+    - items: The row-major elements of the matrix.
+    - side_length: The side-length of the matrix.
+    - pivoting: The pivoting strategy, see `row_reduce`.
 
-def _rref(
+    Notes
+    - The matrix is reduced by fraction-free (Bareiss) elimination,
+        where every division is exact.
+    """
+    rows = [
+        list(items[start : start + side_length])
+        for start in range(0, len(items), side_length)
+    ]
+    pivots, _, _, sign = bareiss(rows, False, [1] * side_length, pivoting)
+    if len(pivots) < len(rows):
+        return 0
+    return sign * pivots[-1]
+
+
+def _kernel_determinant(
+    kernel: Callable[[Sequence[Any]], Any],
+    items: tuple[Fraction, ...],
+    scaled: Scaled | None,
+    side_len: int,
+) -> Fraction:
+    """
+    Calculates the determinant of a small matrix with a generated
+        kernel.
+
+    Arguments
+    - kernel: The determinant kernel for the size of the matrix.
+    - items: The row-major elements of the matrix.
+    - scaled: The scaled form of the matrix, if there is one.
+    - side_len: The side length of the matrix.
+    """
+    if scaled is None:
+        return kernel(items)
+    return interned_ratio(kernel(scaled[0]), scaled[1] ** side_len)
+
+
+def _kernel_inverse(
+    kernel: Callable[[Sequence[Any]], Any],
+    items: tuple[Fraction, ...],
+    scaled: Scaled | None,
+) -> tuple[Fraction, ...] | None:
+    """
+    Calculates the row-major elements of the inverse of a small matrix
+        with a generated kernel.
+
+    Arguments
+    - kernel: The adjugate kernel for the size of the matrix.
+    - items: The row-major elements of the matrix.
+    - scaled: The scaled form of the matrix, if there is one.
+
+    Notes
+    - Returns `None` if the matrix is singular.
+    """
+    if scaled is None:
+        det, adjugate = kernel(items)
+        if det == 0:
+            return None
+        return tuple(item / det for item in adjugate)
+    det, adjugate = kernel(scaled[0])
+    if det == 0:
+        return None
+    # The inverse of the numerators over their denominator is that
+    # denominator over the numerators
+    return tuple(interned_ratio(item * scaled[1], det) for item in adjugate)
+
+
+def _kernel_solve(
     matrix: Matrix,
+    rhs: Matrix,
 ) -> Matrix:
     """
-    Using Gauss-Jordan elimination, calculates and returns the
-        reduced row-echelon form of a matrix.
+    Solves a small linear system of equations with a generated kernel.
 
     Arguments
-    - matrix: The matrix to row-reduce.
+    - matrix: The square matrix of coefficients of the system.
+    - rhs: The right-hand sides of the system, one per column.
+
+    Possible Errors
+    - LinearDependenceError: If `matrix` is singular.
+
+    Notes
+    - The adjugate comes from the kernel for the side length, and is
+        multiplied by `rhs` before dividing by the determinant, so the
+        kernels used never depend on the number of right-hand sides.
     """
+    side_len = matrix.shape[0]
+    cols = rhs.shape[1]
+    kernel = adjugate_kernel(side_len)
+    scaled = matrix._scaled_form()
+    rhs_scaled = rhs._scaled_form()
+    if scaled is not None and rhs_scaled is not None:
+        det, adjugate = kernel(scaled[0])
+        rhs_items: Sequence[Any] = rhs_scaled[0]
+    else:
+        det, adjugate = kernel(matrix._flat())
+        rhs_items = rhs._flat()
+    if det == 0:
+        raise LinearDependenceError(
+            "cannot solve systems of linearly dependent equations"
+        )
+    rhs_cols = [rhs_items[col::cols] for col in range(cols)]
+    products = (
+        sum(map(mul_operator, adjugate[start : start + side_len], rhs_col))
+        for start in range(0, side_len * side_len, side_len)
+        for rhs_col in rhs_cols
+    )
+    if scaled is not None and rhs_scaled is not None:
+        # Both denominators factor out of the system
+        return Matrix._adopt(
+            tuple(
+                interned_ratio(item * scaled[1], det * rhs_scaled[1])
+                for item in products
+            ),
+            rhs.shape,
+        )
+    return Matrix._adopt(tuple(item / det for item in products), rhs.shape)
 
-    # Adapted from:
-    # https://en.wikipedia.org/wiki/Row_echelon_form
-    # #Pseudocode_for_reduced_row_echelon_form
 
-    list_mat = matrix.elements
-    lm_shape = matrix.shape
-    lead = 0
-    row_count = lm_shape[0]
-    col_count = lm_shape[1]
-    for row in range(row_count):
-        if col_count <= lead:
-            return Matrix(list_mat)
-        i = row
-        while list_mat[i][lead] == Fraction(0):
-            i += 1
-            if row_count == i:
-                i = row
-                lead += 1
-                if col_count == lead:
-                    return Matrix(list_mat)
-        if i != row:
-            list_mat[i], list_mat[row] = list_mat[row], list_mat[i]
-        lead_val = list_mat[row][lead]
-        for col in range(lm_shape[1]):
-            list_mat[row][col] = list_mat[row][col] / lead_val
-        for i in range(row_count):
-            if i != row:
-                lead_val = list_mat[i][lead]
-                for col in range(lm_shape[1]):
-                    list_mat[i][col] = list_mat[i][col] - (
-                        lead_val * list_mat[row][col]
-                    )
-        lead += 1
-    return Matrix(list_mat)
+def _modular_rank_bound(
+    matrix: Matrix,
+    method: Literal["exact", "probabilistic"],
+) -> int:
+    """
+    Calculates a lower bound on the rank of a matrix from its rank
+        modulo one (or, for the probabilistic method, several) random
+        primes.
+
+    Arguments
+    - matrix: The matrix to bound the rank of.
+    - method: Whether to try one prime, or `PROBABILISTIC_TRIALS`.
+
+    Notes
+    - Each row is scaled to integers first, which leaves the rank
+        unchanged and means no modular inverses are needed.
+    """
+    int_rows = integer_rows(matrix)[0]
+    trials = PROBABILISTIC_TRIALS if method == "probabilistic" else 1
+    full_rank = min(matrix.shape)
+    rank_bound = 0
+    for _ in range(trials):
+        modulus = random_prime()
+        rank_bound = max(
+            rank_bound,
+            modular_rank(ModularMatrix(int_rows, modulus)),
+        )
+        if rank_bound == full_rank:
+            break
+    return rank_bound
+
+
+def _element_bits(
+    matrix: Matrix | FloatMatrix,
+) -> int:
+    """
+    Estimates how many bits the elements of a matrix take up when it is
+        multiplied, for weighing the cost of matrix products.
+
+    Arguments
+    - matrix: The matrix to inspect.
+    """
+    if isinstance(matrix, FloatMatrix):
+        return 1
+    scaled = matrix._scaled_form()
+    if scaled is not None:
+        return max(map(abs, scaled[0]), default=0).bit_length()
+    return max(
+        (
+            item.numerator.bit_length() + item.denominator.bit_length()
+            for item in matrix._flat()
+        ),
+        default=0,
+    )
+
+
+def _digit_cost(
+    bits: int,
+) -> int:
+    """
+    Estimates the relative cost of multiplying by an integer with the
+        given number of bits, as its number of 30-bit machine digits.
+
+    Arguments
+    - bits: The number of bits of the integer.
+    """
+    return 1 + bits // 30
+
+
+def _random_integers(
+    length: int,
+    error_probability: float,
+) -> tuple[int, ...]:
+    """
+    Draws random integers from enough values that any single one of
+        them has at most a given chance of being drawn.
+
+    Arguments
+    - length: The number of integers to draw.
+    - error_probability: The largest acceptable chance of drawing any
+        single value.
+
+    Possible Errors
+    - ValueError: If `error_probability` is not between 0 and 1.
+    """
+    if not 0 < error_probability < 1:
+        raise ValueError("the error probability must be between 0 and 1")
+    bits = max(1, ceil(-log2(error_probability)))
+    return tuple(getrandbits(bits) for _ in range(length))
+
+
+def _integer_matvec(
+    numerators: tuple[int, ...],
+    vector: Sequence[int],
+) -> list[int]:
+    """
+    Calculates the product of a matrix and a column vector of integers,
+        given the row-major integer elements of the matrix.
+
+    Arguments
+    - numerators: The row-major elements of the matrix.
+    - vector: The column vector, with one element per matrix column.
+    """
+    num_of_cols = len(vector)
+    return [
+        sum(map(mul_operator, numerators[start : start + num_of_cols], vector))
+        for start in range(0, len(numerators), num_of_cols)
+    ]
@@ -0,0 +1,379 @@
+"""
+Implements the `LUFactorization` class (see `help(LUFactorization)`).
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from math import lcm, prod
+from typing import overload
+
+from ._elimination import Pivoting, bareiss, check_pivoting, integer_rows
+from ._errors import (
+    DimensionMismatchError,
+    LinearDependenceError,
+    RectangularMatrixError,
+)
+from ._interning import ONE, ZERO, interned_ratio
+from ._matrix import Matrix
+from ._vector import Vector
+
+__all__ = ("LUFactorization",)
+
+
+class LUFactorization:
+    """
+    Expresses the LU factorization (with row pivoting) of a square
+        matrix, that is the permutation matrix `P`, the unit lower
+        triangular matrix `L` and the upper triangular matrix `U` for
+        which `P @ matrix == L @ U`.
+
+    The matrix is only eliminated once, when the factorization is
+        created. After that, every solve is a forward and a back
+        substitution, which takes time proportional to the square of
+        the side length (per right-hand side) rather than its cube, so
+        factorizing pays off as soon as a matrix is solved against more
+        than once.
+
+    `lu` returns an `LUFactorization` for every `Matrix` it is given.
+    """
+
+    __slots__ = (
+        "_source",
+        "_pivoting",
+        "_rows",
+        "_pivots",
+        "_pivot_columns",
+        "_scales",
+        "_permutation",
+        "_sign",
+        "_lower",
+        "_upper",
+        "_inverse",
+    )
+
+    def __init__(
+        self,
+        matrix: Matrix,
+        pivoting: Pivoting | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the `LUFactorization` class by
+            factorizing a matrix.
+
+        Arguments
+        - matrix: The square matrix to factorize.
+        - pivoting: The pivoting strategy, see `row_reduce`.
+            Optional, defaults to 'markowitz' for a mostly zero matrix
+            and to 'smallest' for any other matrix.
+
+        Possible Errors
+        - RectangularMatrixError: If `matrix` is not a square matrix.
+        - ValueError: If the pivoting strategy is not recognized.
+
+        Notes
+        - Singular matrices can be factorized, but not solved against
+            or inverted.
+        - Factorization is fraction-free: the factors are kept as the
+            integer rows of the Bareiss elimination, with each
+            multiplier stored below the diagonal, and the fractions of
+            `lower` and `upper` are only formed when they are asked for.
+        """
+        if matrix.shape[0] != matrix.shape[1]:
+            raise RectangularMatrixError(
+                "LU factorizations are only defined for square "
+                "matrices, this matrix has a shape of "
+                f"({matrix.shape[0]},{matrix.shape[1]})"
+            )
+        strategy = check_pivoting(pivoting)
+        rows, scales = integer_rows(matrix)
+        pivots, pivot_columns, permutation, sign = bareiss(
+            rows, False, scales, strategy, True
+        )
+        self._source = matrix
+        self._pivoting = pivoting
+        self._rows = rows
+        self._pivots = pivots
+        self._pivot_columns = pivot_columns
+        self._scales = scales
+        self._permutation = tuple(permutation)
+        self._sign = sign
+        self._lower: Matrix | None = None
+        self._upper: Matrix | None = None
+        self._inverse: Matrix | None = None
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this
+            factorization.
+
+        Notes
+        - Assuming all relevant libraries have been imported, the
+            reproduction string can be run as valid Python to create
+            an exact copy of this factorization.
+        """
+        obj_name = self.__class__.__name__
+        matrix = repr(self._source).replace("\n", "\n    ")
+        return (
+            f"{obj_name}(\n    matrix={matrix},\n"
+            f"    pivoting={self._pivoting!r},\n)"
+        )
+
+    def determinant(
+        self,
+    ) -> Fraction:
+        """
+        Returns the determinant of the factorized matrix.
+
+        Notes
+        - This is the sign of the permutation times the product of the
+            diagonal of `upper`, which the last fraction-free pivot
+            already is (up to the scaling of the rows).
+        """
+        if self.is_singular():
+            return ZERO
+        return interned_ratio(
+            self._sign * self._pivots[-1], prod(self._scales)
+        )
+
+    def inverse(
+        self,
+    ) -> Matrix:
+        """
+        Returns the inverse of the factorized matrix with respect to
+            matrix multiplication.
+
+        Possible Errors
+        - LinearDependenceError: If the factorized matrix is singular.
+
+        Notes
+        - The inverse is solved for (against the identity matrix) the
+            first time it is asked for, and kept after that.
+        """
+        if self._inverse is None:
+            side_len = len(self._rows)
+            self._inverse = self.solve(
+                Matrix._adopt(
+                    tuple(
+                        ONE if row == col else ZERO
+                        for row in range(side_len)
+                        for col in range(side_len)
+                    ),
+                    (side_len, side_len),
+                )
+            )
+        return self._inverse
+
+    def is_singular(
+        self,
+    ) -> bool:
+        """
+        Returns whether the factorized matrix is singular, in which
+            case `upper` has a zero on its diagonal.
+        """
+        return len(self._pivots) < len(self._rows)
+
+    @overload
+    def solve(
+        self,
+        rhs: Vector,
+    ) -> Vector:
+        ...
+
+    @overload
+    def solve(
+        self,
+        rhs: Matrix,
+    ) -> Matrix:
+        ...
+
+    def solve(
+        self,
+        rhs: Vector | Matrix,
+    ) -> Vector | Matrix:
+        """
+        Solves the linear system of equations of the factorized matrix,
+            finding the vector (or matrix) that it maps onto `rhs`.
+
+        Arguments
+        - rhs: The right-hand side of the system, either a vector, or a
+            matrix with one right-hand side per column.
+
+        Possible Errors
+        - DimensionMismatchError: If the length (or height) of `rhs`
+            does not equal the side length of the factorized matrix.
+        - LinearDependenceError: If the factorized matrix is singular,
+            so the system has no unique solution.
+
+        Notes
+        - Solving many right-hand sides at once, as the columns of a
+            matrix, is faster than solving them one by one.
+        - Substitution is fraction-free like the factorization: every
+            division is exact, and the solution only becomes fractions
+            once, at the end.
+        """
+        side_len = len(self._rows)
+        rhs_matrix = (
+            Matrix._adopt(tuple(rhs), (len(rhs), 1))
+            if isinstance(rhs, Vector)
+            else rhs
+        )
+        if rhs_matrix.shape[0] != side_len:
+            raise DimensionMismatchError(
+                f"right-hand side height ({rhs_matrix.shape[0]}) "
+                f"does not equal matrix side length ({side_len})"
+            )
+        if self.is_singular():
+            raise LinearDependenceError(
+                "cannot solve systems of linearly dependent equations"
+            )
+        rows = self._rows
+        pivots = self._pivots
+        # Scale the right-hand sides the same way as the rows they are
+        # paired with, plus a shared denominator to keep them integral
+        rhs_rows, rhs_scales = integer_rows(rhs_matrix)
+        denominator = lcm(*rhs_scales)
+        items = [
+            [
+                item * (scale * denominator // rhs_scales[origin])
+                for item in rhs_rows[origin]
+            ]
+            for origin, scale in zip(self._permutation, self._scales)
+        ]
+        # Forward substitution repeats the updates of the elimination
+        previous = 1
+        for index, pivot in enumerate(pivots):
+            pivot_items = items[index]
+            for other in range(index + 1, side_len):
+                factor = rows[other][index]
+                if factor != 0:
+                    items[other] = [
+                        (pivot * item - factor * pivot_item) // previous
+                        for item, pivot_item in zip(items[other], pivot_items)
+                    ]
+                elif pivot != previous:
+                    items[other] = [
+                        pivot * item // previous for item in items[other]
+                    ]
+            previous = pivot
+        # Back substitution solves for the solution times the
+        # determinant, which Cramer's rule shows is integral
+        determinant = pivots[-1]
+        for index in reversed(range(side_len)):
+            row = rows[index]
+            totals = [determinant * item for item in items[index]]
+            for other in range(index + 1, side_len):
+                factor = row[other]
+                if factor != 0:
+                    totals = [
+                        total - factor * item
+                        for total, item in zip(totals, items[other])
+                    ]
+            items[index] = [total // pivots[index] for total in totals]
+        denominator *= determinant
+        solution = tuple(
+            interned_ratio(item, denominator) for row in items for item in row
+        )
+        if isinstance(rhs, Vector):
+            return Vector._adopt(solution)
+        return Matrix._adopt(solution, rhs_matrix.shape)
+
+    # PROPERTIES
+
+    @property
+    def lower(
+        self,
+    ) -> Matrix:
+        """
+        Returns the unit lower triangular factor `L` of this
+            factorization.
+        """
+        if self._lower is None:
+            side_len = len(self._rows)
+            data = []
+            for index, row in enumerate(self._rows):
+                for col in range(side_len):
+                    if col == index:
+                        data.append(ONE)
+                    elif col > index or col >= len(self._pivots):
+                        data.append(ZERO)
+                    else:
+                        # Undo the scaling of both rows involved, and
+                        # the fraction-free scaling of the multiplier
+                        data.append(
+                            interned_ratio(
+                                row[self._pivot_columns[col]]
+                                * self._scales[col],
+                                self._pivots[col] * self._scales[index],
+                            )
+                        )
+            self._lower = Matrix._adopt(tuple(data), (side_len, side_len))
+        return self._lower
+
+    @property
+    def permutation(
+        self,
+    ) -> tuple[int, ...]:
+        """
+        Returns the row of the factorized matrix that each row of the
+            factors was moved from by pivoting, so that row `i` of `P`
+            holds its one in column `permutation[i]`.
+        """
+        return self._permutation
+
+    @property
+    def pivoting(
+        self,
+    ) -> Pivoting | None:
+        """
+        Returns the pivoting strategy this factorization was created
+            with, or `None` if it was the default.
+        """
+        return self._pivoting
+
+    @property
+    def sign(
+        self,
+    ) -> int:
+        """
+        Returns the sign (1 or -1) of the row permutation, which is
+            also the determinant of `P`.
+        """
+        return self._sign
+
+    @property
+    def source(
+        self,
+    ) -> Matrix:
+        """
+        Returns the matrix that was factorized.
+        """
+        return self._source
+
+    @property
+    def upper(
+        self,
+    ) -> Matrix:
+        """
+        Returns the upper triangular factor `U` of this factorization.
+        """
+        if self._upper is None:
+            side_len = len(self._rows)
+            data = [ZERO] * (side_len * side_len)
+            previous = 1
+            for index, (pivot, start) in enumerate(
+                zip(self._pivots, self._pivot_columns)
+            ):
+                # Each row of the fraction-free form is its ordinary
+                # Gaussian elimination counterpart scaled by the
+                # previous pivot
+                denominator = previous * self._scales[index]
+                data[index * side_len + start : (index + 1) * side_len] = [
+                    interned_ratio(item, denominator)
+                    for item in self._rows[index][start:]
+                ]
+                previous = pivot
+            self._upper = Matrix._adopt(tuple(data), (side_len, side_len))
+        return self._upper
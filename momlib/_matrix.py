@@ -25,7 +25,21 @@ from collections.abc import (
     Sequence as SequenceABC,
 )
 
+from ._blocked import get_strassen_cutoff, integer_product
 from ._errors import DimensionMismatchError
+from ._interning import interned_ratio
+from ._kernels import KERNEL_MAX_SIZE, product_kernel
+from ._policy import FloatPolicy, to_fractions
+from ._scaled import (
+    Scaled,
+    dot_products,
+    from_scaled,
+    scaled_operate,
+    to_integral,
+    to_scaled,
+)
+from ._storage import normalize_index, strided_slice
+from ._vector import Vector
 
 __all__ = ("Matrix",)
 
@@ -44,6 +58,12 @@ class Matrix(
         Matrices are, therefore, hashable (using
         `hash(matrix_instance)`).
 
+    Elements are stored in a single flat tuple that is addressed with
+        an offset and a pair of row-column strides. Slices and
+        transposes are views that share the buffer of the matrix they
+        were taken from, so they are created without copying any
+        elements.
+
     [^1]: If you need to modify a `Matrix`, look into the
         `matrix_instance.elements` property.
     """
@@ -51,12 +71,16 @@ class Matrix(
     __slots__ = (
         "_data",
         "_shape",
+        "_offset",
+        "_strides",
         "_hash",
+        "_scaled",
     )
 
     def __init__(
         self,
         initializer: Iterable[Iterable[float | Fraction]],
+        float_policy: FloatPolicy | None = None,
     ) -> None:
         """
         Initializes a new instance of the `Matrix` class.
@@ -64,27 +88,35 @@ class Matrix(
         Arguments
         - initializer: A 2D iterable that will be used to construct the
             matrix.
+        - float_policy: How floats in the initializer are converted to
+            fractions, either 'exact', 'decimal' or a maximum
+            denominator (see `set_float_policy`).
+            Optional, defaults to the global float policy.
 
         Possible Errors
-        - ValueError: If the initializer has no elements, or if the
-            initializer is jagged (not rectangular).
+        - ValueError: If the initializer has no elements, if the
+            initializer is jagged (not rectangular), or if the float
+            policy is not recognized.
         """
         # Capture the data - necessary because the initializer could be
         # mutable, or a generator.
-        data = tuple(
-            tuple(Fraction(item) for item in row) for row in initializer
-        )
+        rows = [tuple(row) for row in initializer]
         # Check the data shape
-        if len(data) <= 0 or len(data[0]) <= 0:
+        if len(rows) <= 0 or len(rows[0]) <= 0:
             raise ValueError("matrices must have at least one element")
-        num_of_cols = len(data[0])
-        for row in data:
+        num_of_cols = len(rows[0])
+        for row in rows:
             if len(row) != num_of_cols:
                 raise ValueError("matrices must be rectangular (not jagged)")
+        # Convert every element in a single pass
+        data = to_fractions(chain.from_iterable(rows), float_policy)
         # Set instance variables
-        self._data: Final[tuple[tuple[Fraction, ...], ...]] = data
-        self._shape: Final[tuple[int, int]] = (len(data), num_of_cols)
+        self._data: Final[tuple[Fraction, ...]] = tuple(data)
+        self._shape: Final[tuple[int, int]] = (len(rows), num_of_cols)
+        self._offset: Final[int] = 0
+        self._strides: Final[tuple[int, int]] = (num_of_cols, 1)
         self._hash: int | None = None
+        self._scaled: Scaled | None = to_integral(self._data)
 
     def __len__(
         self,
@@ -120,34 +152,54 @@ class Matrix(
             elements.
 
         Possible Errors
-        - IndexError: If the slice would create a matrix with zero
-            elements, or if an integer index is out of bounds.
+        - IndexError: If an integer index is out of bounds.
+        - ValueError: If the slice would create a matrix with zero
+            elements.
+
+        Notes
+        - Slices are views that share the elements of this matrix, no
+            elements are copied.
         """
         key_r = key[0]
         key_c = key[1]
         try:
             if isinstance(key_r, int) and isinstance(key_c, int):
-                return self._data[key_r][key_c]
+                return self._data[
+                    self._offset
+                    + normalize_index(key_r, self._shape[0]) * self._strides[0]
+                    + normalize_index(key_c, self._shape[1]) * self._strides[1]
+                ]
             else:
                 if isinstance(key_r, int):
-                    key_r = (key_r, key_r + 1)
+                    key_r = normalize_index(key_r, self._shape[0])
+                    range_r = range(key_r, key_r + 1)
                 else:
-                    key_r = key_r.indices(self._shape[0])
+                    range_r = range(*key_r.indices(self._shape[0]))
 
                 if isinstance(key_c, int):
-                    key_c = (key_c, key_c + 1)
+                    key_c = normalize_index(key_c, self._shape[1])
+                    range_c = range(key_c, key_c + 1)
                 else:
-                    key_c = key_c.indices(self._shape[1])
-
-                return Matrix(
-                    (self._data[r][c] for c in range(*key_c))
-                    for r in range(*key_r)
+                    range_c = range(*key_c.indices(self._shape[1]))
+
+                if len(range_r) <= 0 or len(range_c) <= 0:
+                    raise ValueError("matrices must have at least one element")
+                return Matrix._view(
+                    self._data,
+                    (len(range_r), len(range_c)),
+                    self._offset
+                    + range_r.start * self._strides[0]
+                    + range_c.start * self._strides[1],
+                    (
+                        range_r.step * self._strides[0],
+                        range_c.step * self._strides[1],
+                    ),
                 )
 
         except IndexError:
             raise IndexError(
                 f"index out of bounds, expected index in "
-                f"([0, {self._shape[0]}), [0, {self._shape[0]})) but "
+                f"([0, {self._shape[0]}), [0, {self._shape[1]})) but "
                 f"received ({key[0]}, {key[1]})"
             )
 
@@ -157,7 +209,7 @@ class Matrix(
         """
         Returns an iterator over the rows of this matrix.
         """
-        return self._data.__iter__()
+        return (self._row(row) for row in range(self._shape[0]))
 
     def __str__(
         self,
@@ -187,26 +239,42 @@ class Matrix(
         obj_name = self.__class__.__name__
         initializer = "[\n        [{}],\n    ]".format(
             "],\n        [".join(
-                ", ".join(repr(item) for item in row) for row in self._data
+                ", ".join(repr(item) for item in row) for row in self
             )
         )
         return f"{obj_name}(\n    initializer={initializer},\n)"
 
+    @overload
     def __matmul__(
         self,
         other: Matrix,
     ) -> Matrix:
+        ...
+
+    @overload
+    def __matmul__(
+        self,
+        other: Vector,
+    ) -> Vector:
+        ...
+
+    def __matmul__(
+        self,
+        other: Matrix | Vector,
+    ) -> Matrix | Vector:
         """
         Returns the matrix product of this and another
-            matrix.
+            matrix, or of this matrix and a (column) vector.
 
         Arguments
         - other: The right-hand-side operand to matrix multiplication.
 
         Possible Errors
         - DimensionMismatchError: If the column count of `self` does not
-            match the row count of `other`.
+            match the row count (or length) of `other`.
         """
+        if isinstance(other, Vector):
+            return self._vector_product(other, False)
         if not isinstance(other, Matrix):  # type: ignore
             return NotImplemented
         inner_dim = self._shape[1]
@@ -217,18 +285,89 @@ class Matrix(
                 "did you mean to find the Hadamard (element-wise) product "
                 "instead? ('*' operator)"
             )
-        return Matrix(
-            (
-                sum(
+        num_of_cols = other._shape[1]
+        shape = (self._shape[0], num_of_cols)
+        blocked = (
+            min(shape[0], inner_dim, num_of_cols) >= get_strassen_cutoff()
+        )
+        self_scaled = self._scaled_form()
+        other_scaled = other._scaled_form()
+        if self_scaled is not None and other_scaled is not None:
+            self_nums = self_scaled[0]
+            other_nums = other_scaled[0]
+            if max(shape[0], inner_dim, num_of_cols) <= KERNEL_MAX_SIZE:
+                return Matrix._from_scaled(
                     (
-                        self._data[row][i] * other._data[i][col]
-                        for i in range(inner_dim)
+                        product_kernel(shape[0], inner_dim, num_of_cols)(
+                            self_nums, other_nums
+                        ),
+                        self_scaled[1] * other_scaled[1],
+                    ),
+                    shape,
+                )
+            self_rows = [
+                self_nums[start : start + inner_dim]
+                for start in range(0, len(self_nums), inner_dim)
+            ]
+            numerators = tuple(
+                chain.from_iterable(
+                    integer_product(
+                        self_rows,
+                        [
+                            other_nums[start : start + num_of_cols]
+                            for start in range(0, len(other_nums), num_of_cols)
+                        ],
                     )
                 )
-                for col in range(other._shape[1])
             )
-            for row in range(self._shape[0])
+            return Matrix._from_scaled(
+                (numerators, self_scaled[1] * other_scaled[1]), shape
+            )
+        # Give every row and column its own common denominator instead
+        # (with no size limit, `to_scaled` never returns `None`)
+        self_rows_scaled: list[Scaled] = [
+            to_scaled(row, None) for row in self  # type: ignore
+        ]
+        other_cols_scaled: list[Scaled] = [
+            to_scaled(other._col(col), None)  # type: ignore
+            for col in range(num_of_cols)
+        ]
+        if not blocked:
+            return Matrix._adopt(
+                dot_products(self_rows_scaled, other_cols_scaled), shape
+            )
+        # The row and column denominators factor out of the product of
+        # the numerator matrices
+        product = integer_product(
+            [nums for nums, _ in self_rows_scaled],
+            list(zip(*(nums for nums, _ in other_cols_scaled))),
         )
+        return Matrix._adopt(
+            tuple(
+                interned_ratio(item, row_den * col_den)
+                for row, (_, row_den) in zip(product, self_rows_scaled)
+                for item, (_, col_den) in zip(row, other_cols_scaled)
+            ),
+            shape,
+        )
+
+    def __rmatmul__(
+        self,
+        other: Vector,
+    ) -> Vector:
+        """
+        Returns the matrix product of a (row) vector and this matrix.
+
+        Arguments
+        - other: The left-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the length of `other` does not
+            match the row count of `self`.
+        """
+        if not isinstance(other, Vector):  # type: ignore
+            return NotImplemented
+        return self._vector_product(other, True)
 
     def __mul__(
         self,
@@ -451,10 +590,9 @@ class Matrix(
                 return False
         if self._shape != other._shape:
             return False
-        for row in range(self._shape[0]):
-            for col in range(self._shape[1]):
-                if self[row, col] != other[row, col]:
-                    return False
+        for self_row, other_row in zip(self, other):
+            if self_row != other_row:
+                return False
         return True
 
     def __or__(
@@ -480,11 +618,14 @@ class Matrix(
                 f"do not equal right side rows ({other._shape[0]}), "
                 "cannot augment columns"
             )
-        return Matrix(
-            (
-                chain(self_row, other_row)
-                for self_row, other_row in zip(self._data, other._data)
-            )
+        return Matrix._adopt(
+            tuple(
+                chain.from_iterable(
+                    chain(self_row, other_row)
+                    for self_row, other_row in zip(self, other)
+                )
+            ),
+            (self._shape[0], self._shape[1] + other._shape[1]),
         )
 
     def __hash__(
@@ -494,7 +635,7 @@ class Matrix(
         Returns the hash of this matrix.
         """
         if self._hash is None:
-            self._hash = hash(self._data)
+            self._hash = hash(tuple(self))
         return self._hash
 
     # PROPERTIES
@@ -503,14 +644,15 @@ class Matrix(
     def diagonal(
         self,
     ) -> Iterable[Fraction]:
+        step = self._strides[0] + self._strides[1]
         for i in range(min(self._shape)):
-            yield self._data[i][i]
+            yield self._data[self._offset + i * step]
 
     @property
     def elements(
         self,
     ) -> list[list[Fraction]]:
-        return [[item for item in row] for row in self._data]
+        return [list(row) for row in self]
 
     @property
     def shape(
@@ -520,6 +662,176 @@ class Matrix(
 
     # PRIVATE/PROTECTED METHODS
 
+    @classmethod
+    def _adopt(
+        cls,
+        data: tuple[Fraction, ...],
+        shape: tuple[int, int],
+    ) -> Matrix:
+        """
+        Creates a matrix that takes ownership of a row-major tuple of
+            fractions without coercing or validating its elements.
+
+        Arguments
+        - data: The row-major elements of the new matrix, every one of
+            which must already be a `Fraction`.
+        - shape: The row-column shape of the new matrix, the product of
+            which must equal the length of `data`.
+
+        Notes
+        - This is the fast construction path for results that are known
+            to be valid, such as the output of arithmetic on matrices.
+        - This is a private method not meant to be exposed.
+        """
+        return cls._view(data, shape, 0, (shape[1], 1))
+
+    @classmethod
+    def _from_scaled(
+        cls,
+        scaled: Scaled,
+        shape: tuple[int, int],
+    ) -> Matrix:
+        """
+        Creates a matrix from row-major integer numerators over a shared
+            denominator.
+
+        Arguments
+        - scaled: The numerators and their shared denominator.
+        - shape: The row-column shape of the new matrix.
+
+        Notes
+        - If the shared denominator is 1, the integers are kept so that
+            further arithmetic on the new matrix can skip fractions.
+        - This is a private method not meant to be exposed.
+        """
+        matrix = cls._adopt(from_scaled(*scaled), shape)
+        if scaled[1] == 1:
+            matrix._scaled = scaled
+        return matrix
+
+    @classmethod
+    def _view(
+        cls,
+        data: tuple[Fraction, ...],
+        shape: tuple[int, int],
+        offset: int,
+        strides: tuple[int, int],
+    ) -> Matrix:
+        """
+        Creates a matrix that addresses an existing flat buffer of
+            elements without copying or validating it.
+
+        Arguments
+        - data: The flat buffer of elements to share.
+        - shape: The row-column shape of the new matrix.
+        - offset: The position in `data` of the element at (0, 0).
+        - strides: The distance in `data` between consecutive rows and
+            between consecutive columns respectively.
+
+        Notes
+        - The caller is responsible for making sure that every position
+            addressed by `shape`, `offset` and `strides` exists in
+            `data`.
+        - This is a private method not meant to be exposed.
+        """
+        view = cls.__new__(cls)
+        view._data = data
+        view._shape = shape
+        view._offset = offset
+        view._strides = strides
+        view._hash = None
+        view._scaled = None
+        return view
+
+    def _row(
+        self,
+        row: int,
+    ) -> tuple[Fraction, ...]:
+        """
+        Returns the elements of a single row of this matrix.
+
+        Arguments
+        - row: The non-negative 0-indexed position of the row.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        start = self._offset + row * self._strides[0]
+        return strided_slice(
+            self._data, start, self._shape[1], self._strides[1]
+        )
+
+    def _col(
+        self,
+        col: int,
+    ) -> tuple[Fraction, ...]:
+        """
+        Returns the elements of a single column of this matrix.
+
+        Arguments
+        - col: The non-negative 0-indexed position of the column.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        start = self._offset + col * self._strides[1]
+        return strided_slice(
+            self._data, start, self._shape[0], self._strides[0]
+        )
+
+    def _flat(
+        self,
+    ) -> tuple[Fraction, ...]:
+        """
+        Returns the elements of this matrix as a row-major tuple, only
+            copying them if this matrix is a view on part of its buffer.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        rows, cols = self._shape
+        if (
+            self._offset == 0
+            and self._strides == (cols, 1)
+            and len(self._data) == rows * cols
+        ):
+            return self._data
+        return tuple(chain.from_iterable(self))
+
+    def _scaled_form(
+        self,
+    ) -> Scaled | None:
+        """
+        Returns the row-major elements of this matrix as integer
+            numerators over a shared denominator, computing and caching
+            them on first use.
+
+        Notes
+        - Returns `None` if the shared denominator is too large for the
+            integer representation to be worthwhile.
+        - This is a private method not meant to be exposed.
+        """
+        if self._scaled is None:
+            self._scaled = to_scaled(self._flat()) or ((), 0)
+        return self._scaled if self._scaled[1] != 0 else None
+
+    def _transpose(
+        self,
+    ) -> Matrix:
+        """
+        Returns the transpose of this matrix as a view that shares the
+            elements of this matrix.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        return Matrix._view(
+            self._data,
+            (self._shape[1], self._shape[0]),
+            self._offset,
+            (self._strides[1], self._strides[0]),
+        )
+
     def _elwise_operate(
         self,
         other: Matrix | float | Fraction,
@@ -547,6 +859,8 @@ class Matrix(
             have the required shape.
 
         Notes
+        - A float operand is first converted with the global float
+            ingestion policy, see `set_float_policy`.
         - The operation specified in `operation` may raise errors. These
             will not be caught by this method.
         - This is a private method not meant to be exposed.
@@ -560,34 +874,117 @@ class Matrix(
                     f"{order[0]} side shape {self._shape} "
                     f"does not equal {order[1]} side shape {other._shape}"
                 )
-            if self_side_left:
-                return Matrix(
-                    (
-                        operation(self_item, other_item)
-                        for self_item, other_item in zip(*rows)
-                    )
-                    for rows in zip(self._data, other._data)
+            self_scaled = self._scaled_form()
+            other_scaled = other._scaled_form()
+            if self_scaled is not None and other_scaled is not None:
+                scaled = (
+                    scaled_operate(self_scaled, other_scaled, operation)
+                    if self_side_left
+                    else scaled_operate(other_scaled, self_scaled, operation)
                 )
+                if scaled is not None:
+                    return Matrix._from_scaled(scaled, self._shape)
+            if self_side_left:
+                data = tuple(map(operation, self._flat(), other._flat()))
             else:
-                return Matrix(
-                    (
-                        operation(other_item, self_item)
-                        for self_item, other_item in zip(*rows)
-                    )
-                    for rows in zip(self._data, other._data)
-                )
-
+                data = tuple(map(operation, other._flat(), self._flat()))
         else:
+            if isinstance(other, float):
+                other = to_fractions((other,), None)[0]
+            self_scaled = self._scaled_form()
+            if self_scaled is not None and isinstance(other, (int, Fraction)):
+                other = Fraction(other)
+                scaled = (
+                    scaled_operate(self_scaled, other, operation)
+                    if self_side_left
+                    else scaled_operate(other, self_scaled, operation)
+                )
+                if scaled is not None:
+                    return Matrix._from_scaled(scaled, self._shape)
             if self_side_left:
-                return Matrix(
-                    (operation(item, other) for item in row)
-                    for row in self._data
+                data = tuple(operation(item, other) for item in self._flat())
+            else:
+                data = tuple(operation(other, item) for item in self._flat())
+        return Matrix._adopt(data, self._shape)
+
+    def _vector_product(
+        self,
+        vector: Vector,
+        vector_side_left: bool,
+    ) -> Vector:
+        """
+        Returns the matrix product of this matrix and a vector, without
+            converting the vector into a matrix.
+
+        Arguments
+        - vector: The vector operand.
+        - vector_side_left: Whether the vector is the left operand (a
+            row vector), or the right operand (a column vector).
+
+        Possible Errors
+        - DimensionMismatchError: If the length of `vector` does not
+            match the relevant dimension of `self`.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        rows, cols = self._shape
+        if len(vector) != (rows if vector_side_left else cols):
+            if vector_side_left:
+                raise DimensionMismatchError(
+                    f"left side length ({len(vector)}) "
+                    f"does not equal right side rows ({rows})"
                 )
+            raise DimensionMismatchError(
+                f"left side columns ({cols}) "
+                f"do not equal right side length ({len(vector)})"
+            )
+        self_scaled = self._scaled_form()
+        vector_scaled = vector._scaled_form()
+        if self_scaled is not None and vector_scaled is not None:
+            self_nums = self_scaled[0]
+            vector_nums = vector_scaled[0]
+            if vector_side_left:
+                numerators = integer_product(
+                    [vector_nums],
+                    [
+                        self_nums[start : start + cols]
+                        for start in range(0, len(self_nums), cols)
+                    ],
+                )[0]
             else:
-                return Matrix(
-                    (operation(other, item) for item in row)
-                    for row in self._data
+                numerators = [
+                    sum(
+                        map(
+                            mul_operator,
+                            self_nums[start : start + cols],
+                            vector_nums,
+                        )
+                    )
+                    for start in range(0, len(self_nums), cols)
+                ]
+            return Vector._from_scaled(
+                (tuple(numerators), self_scaled[1] * vector_scaled[1])
+            )
+        # Give every row or column its own common denominator instead
+        # (with no size limit, `to_scaled` never returns `None`)
+        vector_scaled = to_scaled(vector._items(), None)
+        if vector_side_left:
+            return Vector._adopt(
+                dot_products(
+                    (vector_scaled,),  # type: ignore
+                    [
+                        to_scaled(self._col(col), None)  # type: ignore
+                        for col in range(cols)
+                    ],
                 )
+            )
+        return Vector._adopt(
+            dot_products(
+                (to_scaled(row, None) for row in self),  # type: ignore
+                (vector_scaled,),  # type: ignore
+            )
+        )
 
     def _string_format(
         self,
@@ -621,7 +1018,7 @@ class Matrix(
 
         element_strs = [
             [
-                format_to_str(self._data[row][col], row, col)
+                format_to_str(self[row, col], row, col)
                 for col in range(min(self._shape[1], max_cols + 1))
             ]
             for row in range(min(self._shape[0], max_rows + 1))
@@ -0,0 +1,628 @@
+"""
+Implements the `ModularMatrix` class (see `help(ModularMatrix)`), along
+    with the prime number helpers it relies on.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from random import randrange
+from operator import (
+    mul as mul_operator,
+    add as add_operator,
+    sub as sub_operator,
+)
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Final,
+    Iterator,
+)
+from collections.abc import (
+    Hashable as HashableABC,
+    Sequence as SequenceABC,
+)
+
+from ._errors import DimensionMismatchError
+
+__all__ = (
+    "ModularMatrix",
+    "is_prime",
+    "modular_rank",
+    "random_prime",
+)
+
+# Small enough that every product of two residues stays a cheap
+# machine-sized integer operation, large enough that a random prime is
+# unlikely to divide any particular (nonzero) integer.
+PRIME_BITS = 30
+
+# Testing against these bases is deterministic for all n < 3.3 * 10**24.
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+class ModularMatrix(
+    HashableABC,
+    SequenceABC[tuple[int, ...]],
+):
+    """
+    Expresses the mathematical notion of a matrix over the finite field
+        of integers modulo a prime *p* (also known as GF(*p*)).
+
+    Elements are held as plain integers in the range [0, *p*), so
+        arithmetic never grows beyond the size of the modulus. This
+        makes modular matrices a cheap way to answer questions about
+        rational matrices (such as their rank) that are preserved when
+        reducing modulo almost every prime.
+
+    `ModularMatrix` objects are considered non-mutable, which means
+        that for the life of an object it cannot be meaningfully
+        modified[^1]. Modular matrices are, therefore, hashable (using
+        `hash(matrix_instance)`).
+
+    [^1]: If you need to modify a `ModularMatrix`, look into the
+        `matrix_instance.elements` property.
+    """
+
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_modulus",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        initializer: Iterable[Iterable[int | Fraction]],
+        modulus: int,
+    ) -> None:
+        """
+        Initializes a new instance of the `ModularMatrix` class.
+
+        Arguments
+        - initializer: A 2D iterable that will be used to construct the
+            matrix, such as a list of lists of integers or a `Matrix`.
+            Each fraction is mapped to its numerator times the modular
+            inverse of its denominator.
+        - modulus: The prime modulus.
+
+        Possible Errors
+        - ValueError: If the initializer has no elements, if the
+            initializer is jagged (not rectangular), or if the modulus
+            is not prime.
+        - ZeroDivisionError: If the denominator of a fraction in the
+            initializer is a multiple of the modulus.
+        """
+        if not is_prime(modulus):
+            raise ValueError(f"the modulus must be prime, got {modulus}")
+        inverses: dict[int, int] = {}
+        data: list[int] = []
+        num_of_rows = 0
+        num_of_cols = -1
+        for row in initializer:
+            for item in row:
+                denominator = item.denominator
+                if denominator == 1:
+                    data.append(item.numerator % modulus)
+                    continue
+                inverse = inverses.get(denominator)
+                if inverse is None:
+                    if denominator % modulus == 0:
+                        raise ZeroDivisionError(
+                            f"{item} has no residue modulo {modulus}"
+                        )
+                    inverse = pow(denominator, -1, modulus)
+                    inverses[denominator] = inverse
+                data.append(item.numerator * inverse % modulus)
+            num_of_rows += 1
+            if num_of_cols < 0:
+                num_of_cols = len(data)
+            elif len(data) != num_of_rows * num_of_cols:
+                raise ValueError("matrices must be rectangular (not jagged)")
+        if num_of_rows <= 0 or num_of_cols <= 0:
+            raise ValueError("matrices must have at least one element")
+        self._data: Final[tuple[int, ...]] = tuple(data)
+        self._shape: Final[tuple[int, int]] = (num_of_rows, num_of_cols)
+        self._modulus: Final[int] = modulus
+        self._hash: int | None = None
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the total number of elements in this matrix.
+        """
+        return len(self._data)
+
+    def __getitem__(
+        self,
+        key: tuple[int, int],
+    ) -> int:
+        """
+        Returns the item at specified coordinates in this matrix.
+
+        Arguments
+        - key: The 0-indexed row-column coordinates of the desired
+            element.
+
+        Possible Errors
+        - IndexError: If the index is out of bounds.
+        """
+        row, col = key
+        if not (
+            -self._shape[0] <= row < self._shape[0]
+            and -self._shape[1] <= col < self._shape[1]
+        ):
+            raise IndexError(
+                f"index out of bounds, expected index in "
+                f"([0, {self._shape[0]}), [0, {self._shape[1]})) but "
+                f"received ({row}, {col})"
+            )
+        return self._data[
+            (row % self._shape[0]) * self._shape[1] + (col % self._shape[1])
+        ]
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        Returns an iterator over the rows of this matrix.
+        """
+        num_of_cols = self._shape[1]
+        return (
+            self._data[start : start + num_of_cols]
+            for start in range(0, len(self._data), num_of_cols)
+        )
+
+    def __str__(
+        self,
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this matrix.
+        """
+        return self._string_format(10, 10, str)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this matrix.
+
+        Notes
+        - Assuming all relevant libraries have been imported, the
+            reproduction string can be run as valid Python to create
+            an exact copy of this matrix.
+        """
+        obj_name = self.__class__.__name__
+        initializer = "[\n        [{}],\n    ]".format(
+            "],\n        [".join(
+                ", ".join(str(item) for item in row) for row in self
+            )
+        )
+        return (
+            f"{obj_name}(\n    initializer={initializer},\n"
+            f"    modulus={self._modulus},\n)"
+        )
+
+    def __matmul__(
+        self,
+        other: ModularMatrix,
+    ) -> ModularMatrix:
+        """
+        Returns the matrix product of this and another
+            matrix.
+
+        Arguments
+        - other: The right-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the column count of `self` does not
+            match the row count of `other`.
+        - ValueError: If the two matrices have different moduli.
+        """
+        if not isinstance(other, ModularMatrix):  # type: ignore
+            return NotImplemented
+        self._check_modulus(other)
+        if self._shape[1] != other._shape[0]:
+            raise DimensionMismatchError(
+                f"left side columns ({self._shape[1]}) "
+                f"do not equal right side rows ({other._shape[0]}), "
+                "did you mean to find the Hadamard (element-wise) product "
+                "instead? ('*' operator)"
+            )
+        modulus = self._modulus
+        num_of_cols = other._shape[1]
+        other_cols = [
+            other._data[col::num_of_cols] for col in range(num_of_cols)
+        ]
+        # Reducing each sum once (rather than each product) is exact
+        # since Python integers never overflow.
+        return ModularMatrix._adopt(
+            tuple(
+                sum(map(mul_operator, self_row, other_col)) % modulus
+                for self_row in self
+                for other_col in other_cols
+            ),
+            (self._shape[0], num_of_cols),
+            modulus,
+        )
+
+    def __mul__(
+        self,
+        other: ModularMatrix | int,
+    ) -> ModularMatrix:
+        """
+        Returns the element-wise product of this and another matrix (or
+            this matrix and an integer).
+
+        Arguments
+        - other: The right-hand side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a ModularMatrix and does
+            not have the required shape.
+        - ValueError: If the two matrices have different moduli.
+        """
+        if not isinstance(other, (ModularMatrix, int)):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, mul_operator)
+
+    def __rmul__(
+        self,
+        other: int,
+    ) -> ModularMatrix:
+        """
+        Returns the element-wise product of an integer and this matrix.
+
+        Arguments
+        - other: The left-hand side operand.
+        """
+        if not isinstance(other, int):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, mul_operator)
+
+    def __add__(
+        self,
+        other: ModularMatrix,
+    ) -> ModularMatrix:
+        """
+        Returns the element-wise sum of this and another matrix.
+
+        Arguments
+        - other: The right-hand side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` does not have the required
+            shape.
+        - ValueError: If the two matrices have different moduli.
+        """
+        if not isinstance(other, ModularMatrix):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, add_operator)
+
+    def __sub__(
+        self,
+        other: ModularMatrix,
+    ) -> ModularMatrix:
+        """
+        Returns the element-wise difference of this and another matrix.
+
+        Arguments
+        - other: The right-hand side operand.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` does not have the required
+            shape.
+        - ValueError: If the two matrices have different moduli.
+        """
+        if not isinstance(other, ModularMatrix):  # type: ignore
+            return NotImplemented
+        return self._elwise_operate(other, sub_operator)
+
+    def __neg__(
+        self,
+    ) -> ModularMatrix:
+        """
+        Returns the additive inverse of this matrix.
+        """
+        return self._elwise_operate(-1, mul_operator)
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        """
+        Compares this matrix to an object, returns `True` if and only
+            if the right-hand side is a modular matrix with the same
+            modulus and dimensions as this matrix, such that every
+            element in this matrix is equal to every corresponding
+            element in the `other` matrix (otherwise returns `False`).
+
+        Arguments
+        - other: The object this matrix is to be compared to.
+        """
+        if not isinstance(other, ModularMatrix):
+            return NotImplemented
+        return (
+            self._modulus == other._modulus
+            and self._shape == other._shape
+            and self._data == other._data
+        )
+
+    def __hash__(
+        self,
+    ) -> int:
+        """
+        Returns the hash of this matrix.
+        """
+        if self._hash is None:
+            self._hash = hash((self._modulus, self._data))
+        return self._hash
+
+    # PROPERTIES
+
+    @property
+    def elements(
+        self,
+    ) -> list[list[int]]:
+        return [list(row) for row in self]
+
+    @property
+    def modulus(
+        self,
+    ) -> int:
+        return self._modulus
+
+    @property
+    def shape(
+        self,
+    ) -> tuple[int, int]:
+        return self._shape
+
+    # PRIVATE/PROTECTED METHODS
+
+    @classmethod
+    def _adopt(
+        cls,
+        data: tuple[int, ...],
+        shape: tuple[int, int],
+        modulus: int,
+    ) -> ModularMatrix:
+        """
+        Creates a matrix that takes ownership of a tuple of reduced
+            residues without copying or validating it.
+
+        Arguments
+        - data: The row-major residues of the new matrix, each in the
+            range [0, `modulus`).
+        - shape: The row-column shape of the new matrix.
+        - modulus: The prime modulus of the new matrix.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._shape = shape
+        matrix._modulus = modulus
+        matrix._hash = None
+        return matrix
+
+    def _check_modulus(
+        self,
+        other: ModularMatrix,
+    ) -> None:
+        """
+        Ensures another matrix is over the same field as this matrix.
+
+        Arguments
+        - other: The matrix to check.
+
+        Possible Errors
+        - ValueError: If the two matrices have different moduli.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        if self._modulus != other._modulus:
+            raise ValueError(
+                f"left side modulus ({self._modulus}) does not equal "
+                f"right side modulus ({other._modulus})"
+            )
+
+    def _elwise_operate(
+        self,
+        other: ModularMatrix | int,
+        operation: Callable[[int, int], int],
+    ) -> ModularMatrix:
+        """
+        Returns a matrix that results from the element-wise operation of
+            two matrices (or one matrix and an integer), reduced modulo
+            the modulus.
+
+        Arguments
+        - other: The right-hand side operand, can be either a matrix or
+            an integer.
+        - operation: The arbitrary operation applied to two elements to
+            create a single result.
+
+        Possible Errors
+        - DimensionMismatchError: If `other` is a ModularMatrix and does
+            not have the required shape.
+        - ValueError: If the two matrices have different moduli.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        modulus = self._modulus
+        if isinstance(other, ModularMatrix):
+            self._check_modulus(other)
+            if self._shape != other._shape:
+                raise DimensionMismatchError(
+                    f"left side shape {self._shape} "
+                    f"does not equal right side shape {other._shape}"
+                )
+            data = map(operation, self._data, other._data)
+        else:
+            data = (operation(item, other) for item in self._data)
+        return ModularMatrix._adopt(
+            tuple(item % modulus for item in data), self._shape, modulus
+        )
+
+    def _string_format(
+        self,
+        max_rows: int,
+        max_cols: int,
+        element_formatter: Callable[[int], str],
+    ) -> str:
+        """
+        Returns a "pretty" string representation of this matrix.
+
+        Arguments
+        - max_rows: The maximum number of rows to print.
+        - max_cols: The maximum number of columns to print.
+        - element_formatter: The operation applied to each element to
+            convert it to a string.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+
+        def format_to_str(n: int, row: int, col: int) -> str:
+            if row >= max_rows:
+                if col >= max_cols:
+                    return "\u22F1"
+                return "\u22EE"
+            elif col >= max_cols:
+                return "\u22EF"
+            else:
+                return element_formatter(n)
+
+        element_strs = [
+            [
+                format_to_str(self[row, col], row, col)
+                for col in range(min(self._shape[1], max_cols + 1))
+            ]
+            for row in range(min(self._shape[0], max_rows + 1))
+        ]
+        column_lengths = [
+            max(
+                (
+                    len(element_strs[row][col])
+                    for row in range(min(len(element_strs), max_rows + 1))
+                )
+            )
+            for col in range(min(len(element_strs[0]), max_cols + 1))
+        ]
+        for row in range(len(element_strs)):
+            for col in range(len(element_strs[row])):
+                element_strs[row][col] = element_strs[row][col].center(
+                    column_lengths[col]
+                )
+
+        dat_str = f" \u2502\n\u2502 ".join(
+            ("  ".join(row) for row in element_strs)
+        )
+        space = " " * (sum(column_lengths) + (2 * len(column_lengths)))
+        return (
+            f"\u250C{space}\u2510\n"
+            f"\u2502 {dat_str} \u2502"
+            f" (size: {self._shape[0]}\u00D7{self._shape[1]})\n"
+            f"\u2514{space}\u2518"
+        )
+
+
+def is_prime(
+    number: int,
+) -> bool:
+    """
+    Tests whether an integer is prime using the Miller-Rabin test.
+
+    Arguments
+    - number: The integer to test.
+
+    Notes
+    - The test is deterministic below 3.3 * 10**24, and only proves
+        that larger integers are probably prime.
+    """
+    if number < 2:
+        return False
+    for witness in _WITNESSES:
+        if number % witness == 0:
+            return number == witness
+    odd_part = number - 1
+    twos = 0
+    while odd_part % 2 == 0:
+        odd_part //= 2
+        twos += 1
+    for witness in _WITNESSES:
+        power = pow(witness, odd_part, number)
+        if power == 1 or power == number - 1:
+            continue
+        for _ in range(twos - 1):
+            power = power * power % number
+            if power == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def modular_rank(
+    matrix: ModularMatrix,
+) -> int:
+    """
+    Calculates the rank of a matrix over the integers modulo its prime
+        modulus by Gaussian elimination.
+
+    Arguments
+    - matrix: The matrix the rank is to be calculated from.
+    """
+    rows = matrix.elements
+    modulus = matrix.modulus
+    row_count = len(rows)
+    rank_count = 0
+    for col in range(len(rows[0])):
+        pivot = next(
+            (i for i in range(rank_count, row_count) if rows[i][col]), None
+        )
+        if pivot is None:
+            continue
+        rows[rank_count], rows[pivot] = rows[pivot], rows[rank_count]
+        inverse = pow(rows[rank_count][col], -1, modulus)
+        pivot_items = [
+            item * inverse % modulus for item in rows[rank_count][col + 1 :]
+        ]
+        for i in range(rank_count + 1, row_count):
+            row = rows[i]
+            factor = row[col]
+            if factor:
+                row[col + 1 :] = [
+                    (item - factor * pivot_item) % modulus
+                    for item, pivot_item in zip(row[col + 1 :], pivot_items)
+                ]
+        rank_count += 1
+        if rank_count == row_count:
+            break
+    return rank_count
+
+
+def random_prime(
+    bits: int = PRIME_BITS,
+) -> int:
+    """
+    Picks a random prime with the given number of bits.
+
+    Arguments
+    - bits: The bit length of the prime.
+        Optional, defaults to `PRIME_BITS`.
+
+    Notes
+    - Odd numbers with the given number of bits are drawn at random
+        until one of them passes the primality test.
+    """
+    while True:
+        candidate = randrange(1 << (bits - 1), 1 << bits) | 1
+        if is_prime(candidate):
+            return candidate
@@ -0,0 +1,135 @@
+"""
+Controls how floating point numbers are converted into fractions when
+    they are used to construct `Matrix` and `Vector` objects, or as
+    number operands of their element-wise arithmetic.
+
+Every float is a fraction with a power-of-two denominator, so converting
+    it exactly (the default) turns `0.1` into a fraction with a 55-bit
+    denominator, and every later operation carries those bits along. A
+    float ingestion policy trades that exactness for small fractions:
+- 'exact': Convert floats to the exact fraction they represent.
+- 'decimal': Convert floats to the fraction written by their shortest
+    decimal representation, so `0.1` becomes 1/10.
+- An integer: Convert floats to the closest fraction with at most that
+    denominator.
+
+The policy can be set globally with `set_float_policy`, or per call with
+    the `float_policy` argument of the `Matrix` and `Vector`
+    constructors (arithmetic always uses the global policy). It only
+    applies to floats (including subclasses of `float`): integers and
+    fractions are always converted exactly.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from math import isfinite
+from typing import Callable, Iterable, Literal, Union
+
+from ._interning import interned
+
+__all__ = (
+    "FloatPolicy",
+    "get_float_policy",
+    "set_float_policy",
+)
+
+FloatPolicy = Union[Literal["exact", "decimal"], int]
+
+_float_policy: FloatPolicy = "exact"
+
+
+def get_float_policy() -> FloatPolicy:
+    """
+    Returns the float ingestion policy currently used by default.
+    """
+    return _float_policy
+
+
+def set_float_policy(
+    policy: FloatPolicy,
+) -> None:
+    """
+    Sets the float ingestion policy used by default when constructing
+        `Matrix` and `Vector` objects.
+
+    Arguments
+    - policy: Either 'exact', 'decimal', or a maximum denominator.
+
+    Possible Errors
+    - ValueError: If the policy is not recognized.
+    """
+    global _float_policy
+    _float_converter(policy)
+    _float_policy = policy
+
+
+def to_fractions(
+    items: Iterable[float | Fraction],
+    policy: FloatPolicy | None,
+) -> list[Fraction]:
+    """
+    Converts numbers into fractions, applying a float ingestion policy
+        and sharing the interned instances of small whole numbers.
+
+    Arguments
+    - items: The numbers to convert.
+    - policy: The float ingestion policy, or `None` to use the global
+        one.
+
+    Possible Errors
+    - ValueError: If the policy is not recognized.
+    """
+    convert_float = _float_converter(
+        _float_policy if policy is None else policy
+    )
+    if convert_float is Fraction:
+        return list(map(interned, items))
+    return [
+        interned(convert_float(item) if isinstance(item, float) else item)
+        for item in items
+    ]
+
+
+def _float_converter(
+    policy: FloatPolicy,
+) -> Callable[[float], Fraction]:
+    """
+    Returns the function that converts a single float according to a
+        float ingestion policy.
+
+    Arguments
+    - policy: The float ingestion policy.
+
+    Possible Errors
+    - ValueError: If the policy is not recognized.
+    """
+    if policy == "exact":
+        return Fraction
+    if policy == "decimal":
+        return _decimal_fraction
+    if isinstance(policy, int) and not isinstance(policy, bool):
+        if policy < 1:
+            raise ValueError(
+                "the maximum denominator must be a positive integer"
+            )
+        return lambda item: Fraction(item).limit_denominator(policy)
+    raise ValueError(
+        "float policies must be 'exact', 'decimal' or a maximum "
+        f"denominator, got {policy!r}"
+    )
+
+
+def _decimal_fraction(
+    item: float,
+) -> Fraction:
+    """
+    Converts a float to the fraction written by its shortest decimal
+        representation.
+
+    Arguments
+    - item: The float to convert.
+    """
+    if isfinite(item):
+        return Fraction(repr(item))
+    return Fraction(item)
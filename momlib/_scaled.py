@@ -0,0 +1,198 @@
+"""
+Provides the common-denominator (scaled-integer) representation that
+    `Matrix` and `Vector` objects use to carry out arithmetic on plain
+    integers instead of on individual fractions.
+
+A sequence of fractions is represented by a tuple of integer numerators
+    and a single shared denominator, such that each fraction equals its
+    numerator divided by the shared denominator. Arithmetic is done on
+    the numerators, and each result is only normalized once, when it is
+    converted back into a fraction.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from itertools import repeat
+from math import lcm
+from operator import (
+    mul as mul_operator,
+    add as add_operator,
+    sub as sub_operator,
+)
+from typing import Callable, Iterable, Sequence
+
+from ._interning import interned, interned_ratio
+
+__all__ = (
+    "MAX_DENOMINATOR_BITS",
+    "Scaled",
+    "dot_products",
+    "from_scaled",
+    "scaled_operate",
+    "to_integral",
+    "to_scaled",
+)
+
+Scaled = tuple[tuple[int, ...], int]
+
+# Above this size, the shared denominator (and with it every numerator)
+# becomes too large for integer arithmetic to beat fractions.
+MAX_DENOMINATOR_BITS = 256
+
+
+def to_scaled(
+    values: Sequence[Fraction],
+    max_bits: int | None = MAX_DENOMINATOR_BITS,
+) -> Scaled | None:
+    """
+    Converts fractions into integer numerators over their least common
+        denominator.
+
+    Arguments
+    - values: The fractions to convert.
+    - max_bits: The largest common denominator (in bits) worth
+        converting to, or `None` for no limit.
+        Optional, defaults to `MAX_DENOMINATOR_BITS`.
+
+    Notes
+    - Returns `None` if the common denominator would be larger than
+        `max_bits` bits.
+    """
+    denominators = {value.denominator for value in values}
+    if max_bits is None:
+        denominator = lcm(*denominators)
+    else:
+        # Give up as soon as the denominator is too large, rather than
+        # finding a common denominator that may be far larger still
+        denominator = 1
+        for item in denominators:
+            denominator = lcm(denominator, item)
+            if denominator.bit_length() > max_bits:
+                return None
+    if denominator == 1:
+        return tuple(value.numerator for value in values), 1
+    return (
+        tuple(
+            value.numerator * (denominator // value.denominator)
+            for value in values
+        ),
+        denominator,
+    )
+
+
+def to_integral(
+    values: tuple[Fraction, ...],
+) -> Scaled | None:
+    """
+    Converts fractions that are all whole numbers into their integer
+        numerators over a denominator of 1.
+
+    Arguments
+    - values: The fractions to convert.
+
+    Notes
+    - Returns `None` if any of the fractions is not a whole number.
+    """
+    for value in values:
+        if value.denominator != 1:
+            return None
+    return tuple(value.numerator for value in values), 1
+
+
+def dot_products(
+    left_rows: Iterable[Scaled],
+    right_cols: Sequence[Scaled],
+) -> tuple[Fraction, ...]:
+    """
+    Calculates the dot product of every left row with every right
+        column, in row-major order, where every row and column has its
+        own common denominator.
+
+    Arguments
+    - left_rows: The scaled form of each left-hand-side row.
+    - right_cols: The scaled form of each right-hand-side column.
+
+    Notes
+    - Each product of numerators is over the product of the two
+        denominators, so a dot product is a plain integer sum over a
+        single denominator, and is only normalized once.
+    """
+    return tuple(
+        interned_ratio(
+            sum(map(mul_operator, row_nums, col_nums)), row_den * col_den
+        )
+        for row_nums, row_den in left_rows
+        for col_nums, col_den in right_cols
+    )
+
+
+def from_scaled(
+    numerators: Iterable[int],
+    denominator: int,
+) -> tuple[Fraction, ...]:
+    """
+    Converts integer numerators over a shared denominator back into
+        normalized fractions, sharing the interned instances of small
+        whole numbers.
+
+    Arguments
+    - numerators: The integer numerators.
+    - denominator: The positive shared denominator.
+    """
+    if denominator == 1:
+        return tuple(map(interned, numerators))
+    return tuple(
+        interned_ratio(numerator, denominator) for numerator in numerators
+    )
+
+
+def scaled_operate(
+    left: Scaled | Fraction,
+    right: Scaled | Fraction,
+    operation: Callable[[Fraction, Fraction], Fraction],
+) -> Scaled | None:
+    """
+    Applies an element-wise operation to two scaled sequences (or one
+        scaled sequence and a single fraction) using integer arithmetic,
+        producing a new scaled sequence. At least one of the operands
+        must be a scaled sequence.
+
+    Arguments
+    - left: The left-hand-side operand.
+    - right: The right-hand-side operand.
+    - operation: The element-wise operation, one of `operator.add`,
+        `operator.sub` or `operator.mul`.
+
+    Notes
+    - Returns `None` if `operation` cannot be carried out on a shared
+        denominator (such as division), in which case the caller must
+        operate on fractions instead.
+    """
+    if operation not in (add_operator, sub_operator, mul_operator):
+        return None
+    left_nums: Iterable[int]
+    right_nums: Iterable[int]
+    if isinstance(left, Fraction):
+        left_nums, left_den = repeat(left.numerator), left.denominator
+    else:
+        left_nums, left_den = left
+    if isinstance(right, Fraction):
+        right_nums, right_den = repeat(right.numerator), right.denominator
+    else:
+        right_nums, right_den = right
+    if operation is mul_operator:
+        return (
+            tuple(map(mul_operator, left_nums, right_nums)),
+            left_den * right_den,
+        )
+    denominator = lcm(left_den, right_den)
+    if left_den != denominator:
+        left_nums = map(
+            mul_operator, left_nums, repeat(denominator // left_den)
+        )
+    if right_den != denominator:
+        right_nums = map(
+            mul_operator, right_nums, repeat(denominator // right_den)
+        )
+    return tuple(map(operation, left_nums, right_nums)), denominator
@@ -0,0 +1,454 @@
+"""
+Implements the `MatrixStack` class (see `help(MatrixStack)`).
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from itertools import chain
+from typing import (
+    Any,
+    Final,
+    Iterable,
+    Iterator,
+    overload,
+)
+from collections.abc import (
+    Hashable as HashableABC,
+    Sequence as SequenceABC,
+)
+
+from ._errors import DimensionMismatchError
+from ._kernels import KERNEL_MAX_SIZE, product_kernel
+from ._matrix import Matrix
+from ._policy import FloatPolicy
+from ._scaled import Scaled, from_scaled, to_integral, to_scaled
+
+__all__ = ("MatrixStack",)
+
+
+class MatrixStack(
+    HashableABC,
+    SequenceABC[Matrix],
+):
+    """
+    Expresses a sequence of rational-valued matrices that all have the
+        same shape, stored together so that operations can be applied
+        to all of them at once.
+
+    The elements of every matrix are stored back to back in a single
+        flat tuple. Indexing a stack gives a `Matrix` view that shares
+        this buffer, so the individual matrices are only created (and
+        never copied) when they are needed.
+
+    Matrix multiplication of two stacks multiplies corresponding
+        matrices, and a single `Matrix` on either side is multiplied
+        with every matrix of a stack. The functions `determinant`,
+        `inverse` and `row_reduce` also accept stacks, which checks
+        their arguments once for the whole stack.
+
+    `MatrixStack` objects are considered non-mutable, and are therefore
+        hashable (using `hash(stack_instance)`).
+    """
+
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_count",
+        "_hash",
+        "_scaled",
+    )
+
+    def __init__(
+        self,
+        matrices: Iterable[Matrix | Iterable[Iterable[float | Fraction]]],
+        float_policy: FloatPolicy | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the `MatrixStack` class.
+
+        Arguments
+        - matrices: The matrices to stack, each either a `Matrix` or a
+            2D iterable that a `Matrix` can be constructed from.
+        - float_policy: The float ingestion policy for matrices that
+            are not already `Matrix` objects, see `set_float_policy`.
+            Optional, defaults to the global policy.
+
+        Possible Errors
+        - ValueError: If no matrices are given, or if any matrix given
+            is invalid.
+        - DimensionMismatchError: If the matrices do not all have the
+            same shape.
+        """
+        data: list[Fraction] = []
+        # Keep the scaled forms the matrices already have, as long as
+        # every matrix has one
+        scaled: list[Scaled | None] | None = []
+        shape: tuple[int, int] | None = None
+        count = 0
+        for matrix in matrices:
+            if not isinstance(matrix, Matrix):
+                matrix = Matrix(matrix, float_policy)
+            if scaled is not None:
+                if matrix._scaled is None:
+                    scaled = None
+                else:
+                    scaled.append(matrix._scaled_form())
+            if shape is None:
+                shape = matrix.shape
+            elif matrix.shape != shape:
+                raise DimensionMismatchError(
+                    "all matrices in a stack must have the same shape, "
+                    f"expected {shape} but got {matrix.shape}"
+                )
+            data.extend(matrix._flat())
+            count += 1
+        if shape is None:
+            raise ValueError("stacks must have at least one matrix")
+        self._data: Final[tuple[Fraction, ...]] = tuple(data)
+        self._shape: Final[tuple[int, int]] = shape
+        self._count: Final[int] = count
+        self._hash: int | None = None
+        self._scaled: list[Scaled | None] | None = scaled
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of matrices in this stack.
+        """
+        return self._count
+
+    @overload
+    def __getitem__(
+        self,
+        key: int,
+    ) -> Matrix:
+        ...
+
+    @overload
+    def __getitem__(
+        self,
+        key: slice,
+    ) -> MatrixStack:
+        ...
+
+    def __getitem__(
+        self,
+        key: int | slice,
+    ) -> Matrix | MatrixStack:
+        """
+        Returns the matrix at a specified index in this stack, or a new
+            stack of the matrices in a specified slice.
+
+        Arguments
+        - key: The 0-indexed position of the desired matrix, or the
+            slice of the desired matrices.
+
+        Possible Errors
+        - IndexError: If the index is out of bounds.
+        - ValueError: If the slice is empty, as stacks must have at
+            least one matrix.
+
+        Notes
+        - A single matrix is a view that shares the elements of this
+            stack, no elements are copied.
+        """
+        if isinstance(key, slice):
+            indices = range(*key.indices(self._count))
+            if len(indices) == 0:
+                raise ValueError("stacks must have at least one matrix")
+            return MatrixStack._adopt(
+                tuple(chain.from_iterable(map(self._items, indices))),
+                self._shape,
+                len(indices),
+            )
+        if not -self._count <= key < self._count:
+            raise IndexError(
+                f"index out of bounds, expected index in "
+                f"[0, {self._count}) but received {key}"
+            )
+        index = key % self._count
+        rows, cols = self._shape
+        matrix = Matrix._view(
+            self._data, self._shape, index * rows * cols, (cols, 1)
+        )
+        if self._scaled is not None:
+            matrix._scaled = self._scaled[index] or ((), 0)
+        return matrix
+
+    def __iter__(
+        self,
+    ) -> Iterator[Matrix]:
+        """
+        Returns an iterator over the matrices of this stack.
+        """
+        return (self[index] for index in range(self._count))
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a reproduction string representation of this stack.
+
+        Notes
+        - Assuming all relevant libraries have been imported, the
+            reproduction string can be run as valid Python to create
+            an exact copy of this stack.
+        """
+        obj_name = self.__class__.__name__
+        matrices = "[\n        [{}],\n    ]".format(
+            "],\n        [".join(
+                ", ".join(
+                    "[{}]".format(", ".join(repr(item) for item in row))
+                    for row in matrix
+                )
+                for matrix in self
+            )
+        )
+        return f"{obj_name}(\n    matrices={matrices},\n)"
+
+    @overload
+    def __matmul__(
+        self,
+        other: MatrixStack,
+    ) -> MatrixStack:
+        ...
+
+    @overload
+    def __matmul__(
+        self,
+        other: Matrix,
+    ) -> MatrixStack:
+        ...
+
+    def __matmul__(
+        self,
+        other: MatrixStack | Matrix,
+    ) -> MatrixStack:
+        """
+        Returns the stack of matrix products of the matrices of this
+            stack with the corresponding matrices of another stack, or
+            with a single matrix.
+
+        Arguments
+        - other: The right-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the column count of the matrices
+            of `self` does not match the row count of those of `other`,
+            or if two stacks hold different numbers of matrices (and
+            neither holds just one).
+        """
+        if isinstance(other, Matrix):
+            other = MatrixStack._adopt(other._flat(), other.shape, 1)
+        elif not isinstance(other, MatrixStack):  # type: ignore
+            return NotImplemented
+        return self._stack_product(other)
+
+    def __rmatmul__(
+        self,
+        other: Matrix,
+    ) -> MatrixStack:
+        """
+        Returns the stack of matrix products of a single matrix with
+            every matrix of this stack.
+
+        Arguments
+        - other: The left-hand-side operand to matrix multiplication.
+
+        Possible Errors
+        - DimensionMismatchError: If the column count of `other` does
+            not match the row count of the matrices of this stack.
+        """
+        if not isinstance(other, Matrix):  # type: ignore
+            return NotImplemented
+        return MatrixStack._adopt(
+            other._flat(), other.shape, 1
+        )._stack_product(self)
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        """
+        Compares this stack to an object, returns `True` if and only if
+            the right-hand side is a stack of equal matrices, in the
+            same order (otherwise returns `False`).
+
+        Arguments
+        - other: The object this stack is to be compared to.
+        """
+        if not isinstance(other, MatrixStack):
+            return NotImplemented
+        return (
+            self._shape == other._shape
+            and self._count == other._count
+            and self._data == other._data
+        )
+
+    def __hash__(
+        self,
+    ) -> int:
+        """
+        Returns the hash of this stack.
+        """
+        if self._hash is None:
+            self._hash = hash((self._shape, self._data))
+        return self._hash
+
+    # PROPERTIES
+
+    @property
+    def shape(
+        self,
+    ) -> tuple[int, int]:
+        """
+        Returns the row-column shape shared by every matrix in this
+            stack.
+        """
+        return self._shape
+
+    # PRIVATE/PROTECTED METHODS
+
+    @classmethod
+    def _adopt(
+        cls,
+        data: tuple[Fraction, ...],
+        shape: tuple[int, int],
+        count: int,
+    ) -> MatrixStack:
+        """
+        Creates a stack that takes ownership of a flat tuple of the
+            row-major elements of every matrix without copying or
+            validating it.
+
+        Arguments
+        - data: The row-major elements of every matrix, back to back.
+        - shape: The row-column shape of every matrix.
+        - count: The number of matrices.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        stack = cls.__new__(cls)
+        stack._data = data
+        stack._shape = shape
+        stack._count = count
+        stack._hash = None
+        stack._scaled = None
+        return stack
+
+    def _items(
+        self,
+        index: int,
+    ) -> tuple[Fraction, ...]:
+        """
+        Returns the row-major elements of one matrix of this stack.
+
+        Arguments
+        - index: The 0-indexed position of the matrix.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        size = self._shape[0] * self._shape[1]
+        return self._data[index * size : (index + 1) * size]
+
+    def _parts(
+        self,
+    ) -> Iterator[tuple[tuple[Fraction, ...], Scaled | None]]:
+        """
+        Returns an iterator over the row-major elements of every matrix
+            of this stack, along with their scaled forms, computing and
+            caching the scaled forms on first use.
+
+        Notes
+        - A scaled form is `None` if the shared denominator of its
+            matrix is too large for it to be worthwhile.
+        - This is a private method not meant to be exposed.
+        """
+        if self._scaled is None:
+            # Stacks of whole numbers are common enough to check for
+            # them all at once
+            integral = to_integral(self._data)
+            if integral is not None:
+                size = self._shape[0] * self._shape[1]
+                numerators = integral[0]
+                self._scaled = [
+                    (numerators[start : start + size], 1)
+                    for start in range(0, len(numerators), size)
+                ]
+            else:
+                self._scaled = [
+                    to_scaled(self._items(index))
+                    for index in range(self._count)
+                ]
+        return zip(map(self._items, range(self._count)), self._scaled)
+
+    def _stack_product(
+        self,
+        other: MatrixStack,
+    ) -> MatrixStack:
+        """
+        Returns the stack of matrix products of corresponding matrices,
+            where a stack of a single matrix is paired with every
+            matrix of the other stack.
+
+        Arguments
+        - other: The right-hand-side stack.
+
+        Possible Errors
+        - DimensionMismatchError: If the matrices cannot be multiplied,
+            or if the stacks cannot be paired up.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        rows, inner = self._shape
+        if inner != other._shape[0]:
+            raise DimensionMismatchError(
+                f"left side columns ({inner}) "
+                f"do not equal right side rows ({other._shape[0]})"
+            )
+        count = max(self._count, other._count)
+        if min(self._count, other._count) != 1 and (
+            self._count != other._count
+        ):
+            raise DimensionMismatchError(
+                f"left stack size ({self._count}) "
+                f"does not equal right stack size ({other._count})"
+            )
+        cols = other._shape[1]
+        shape = (rows, cols)
+        self_parts = list(self._parts())
+        other_parts = list(other._parts())
+        if len(self_parts) == 1:
+            self_parts *= count
+        if len(other_parts) == 1:
+            other_parts *= count
+
+        data: list[Fraction] = []
+        if max(rows, inner, cols) <= KERNEL_MAX_SIZE:
+            kernel = product_kernel(rows, inner, cols)
+            for (self_items, self_scaled), (other_items, other_scaled) in zip(
+                self_parts, other_parts
+            ):
+                if self_scaled is not None and other_scaled is not None:
+                    data.extend(
+                        from_scaled(
+                            kernel(self_scaled[0], other_scaled[0]),
+                            self_scaled[1] * other_scaled[1],
+                        )
+                    )
+                else:
+                    data.extend(kernel(self_items, other_items))
+        else:
+            for (self_items, _), (other_items, _) in zip(
+                self_parts, other_parts
+            ):
+                product = Matrix._adopt(self_items, self._shape) @ (
+                    Matrix._adopt(other_items, other._shape)
+                )
+                data.extend(product._flat())
+        return MatrixStack._adopt(tuple(data), shape, count)
@@ -0,0 +1,59 @@
+"""
+Provides helpers for addressing the flat, strided element buffers that
+    back `Matrix` and `Vector` objects.
+"""
+
+from __future__ import annotations
+
+from typing import TypeVar
+
+__all__ = (
+    "normalize_index",
+    "strided_slice",
+)
+
+T = TypeVar("T")
+
+
+def normalize_index(
+    index: int,
+    length: int,
+) -> int:
+    """
+    Converts a possibly negative index into a non-negative one.
+
+    Arguments
+    - index: The 0-indexed position, negative values count backwards
+        from `length`.
+    - length: The length of the indexed dimension.
+
+    Possible Errors
+    - IndexError: If `index` is out of bounds.
+    """
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("index out of bounds")
+    return index
+
+
+def strided_slice(
+    data: tuple[T, ...],
+    start: int,
+    count: int,
+    step: int,
+) -> tuple[T, ...]:
+    """
+    Returns `count` elements of `data` taken every `step` positions,
+        beginning at `start`.
+
+    Arguments
+    - data: The flat buffer of elements.
+    - start: The position of the first element.
+    - count: The number of elements to take.
+    - step: The (possibly negative) distance between elements.
+    """
+    stop: int | None = start + count * step
+    if stop is not None and stop < 0:
+        stop = None
+    return data[start:stop:step]
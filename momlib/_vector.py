@@ -25,6 +25,16 @@ from collections.abc import (
 )
 
 from ._errors import DimensionMismatchError
+from ._policy import FloatPolicy, to_fractions
+from ._scaled import (
+    Scaled,
+    dot_products,
+    from_scaled,
+    scaled_operate,
+    to_integral,
+    to_scaled,
+)
+from ._storage import normalize_index, strided_slice
 
 __all__ = ("Vector",)
 
@@ -43,19 +53,28 @@ class Vector(
         Vectors are, therefore, hashable (using
         `hash(vector_instance)`).
 
+    Elements are stored in a flat tuple that is addressed with an
+        offset and a stride. Slices are views that share the buffer of
+        the vector they were taken from, so they are created without
+        copying any elements.
+
     [^1]: If you need to modify a `Vector`, look into the
         `vector_instance.elements` property.
     """
 
     __slots__ = (
         "_data",
+        "_offset",
+        "_stride",
         "_length",
         "_hash",
+        "_scaled",
     )
 
     def __init__(
         self,
         initializer: Iterable[float | Fraction],
+        float_policy: FloatPolicy | None = None,
     ) -> None:
         """
         Initializes a new instance of the `Vector` class.
@@ -63,16 +82,24 @@ class Vector(
         Arguments
         - initializer: An iterable that will be used to construct the
             vector.
+        - float_policy: How floats in the initializer are converted to
+            fractions, either 'exact', 'decimal' or a maximum
+            denominator (see `set_float_policy`).
+            Optional, defaults to the global float policy.
 
         Possible Errors
-        - ValueError: If the initializer has no elements.
+        - ValueError: If the initializer has no elements, or if the
+            float policy is not recognized.
         """
-        data = tuple(Fraction(item) for item in initializer)
+        data = tuple(to_fractions(initializer, float_policy))
         if len(data) <= 0:
             raise ValueError("vectors must have at least one element")
         self._data: Final[tuple[Fraction, ...]] = data
+        self._offset: Final[int] = 0
+        self._stride: Final[int] = 1
         self._length: Final[int] = len(data)
         self._hash: int | None = None
+        self._scaled: Scaled | None = to_integral(data)
 
     def __len__(
         self,
@@ -95,20 +122,36 @@ class Vector(
         key: int | slice,
     ) -> Fraction | Vector:
         """
-        Returns a copy of the items at given positions.
+        Returns the items at given positions.
 
         Arguments
         - key: The 0-indexed position of the desired elements.
 
         Possible Errors
-        - IndexError: If the slice would create a vector with zero
-            elements, or if an integer index is out of bounds.
+        - IndexError: If an integer index is out of bounds.
+        - ValueError: If the slice would create a vector with zero
+            elements.
+
+        Notes
+        - Slices are views that share the elements of this vector, no
+            elements are copied.
         """
         try:
             if isinstance(key, int):
-                return self._data[key]
+                return self._data[
+                    self._offset
+                    + normalize_index(key, self._length) * self._stride
+                ]
             else:
-                return Vector(self._data[key])
+                key_range = range(*key.indices(self._length))
+                if len(key_range) <= 0:
+                    raise ValueError("vectors must have at least one element")
+                return Vector._view(
+                    self._data,
+                    len(key_range),
+                    self._offset + key_range.start * self._stride,
+                    key_range.step * self._stride,
+                )
         except IndexError:
             raise IndexError(
                 f"index out of bounds, expected index in "
@@ -121,7 +164,7 @@ class Vector(
         """
         Returns an iterator over the items of this vector.
         """
-        return self._data.__iter__()
+        return self._items().__iter__()
 
     def __str__(
         self,
@@ -143,9 +186,7 @@ class Vector(
         Returns a reproduction string representation of this vector.
         """
         obj_name = self.__class__.__name__
-        initializer = "[{}]".format(
-            ", ".join(repr(item) for item in self._data)
-        )
+        initializer = "[{}]".format(", ".join(repr(item) for item in self))
         return f"{obj_name}(\n    initializer={initializer},\n)"
 
     def __matmul__(
@@ -173,13 +214,9 @@ class Vector(
                 f"left side length ({self._length}) "
                 f"does not match right side length ({other._length})"
             )
-        return sum(
-            (
-                self_item * other_item
-                for self_item, other_item in zip(self._data, other._data)
-            ),
-            start=Fraction(0),
-        )
+        self_scaled = self._scaled_form() or to_scaled(self._items(), None)
+        other_scaled = other._scaled_form() or to_scaled(other._items(), None)
+        return dot_products((self_scaled,), (other_scaled,))[0]  # type: ignore
 
     def __mul__(
         self,
@@ -401,13 +438,9 @@ class Vector(
         if self._hash is not None and other._hash is not None:
             if hash(self) != hash(other):
                 return False
-        length = self._length
-        if length != other._length:
+        if self._length != other._length:
             return False
-        for i in range(length):
-            if self._data[i] != other._data[i]:
-                return False
-        return True
+        return self._items() == other._items()
 
     def __hash__(
         self,
@@ -416,7 +449,7 @@ class Vector(
         Returns the hash of this vector.
         """
         if self._hash is None:
-            self._hash = hash(self._data)
+            self._hash = hash(self._items())
         return self._hash
 
     # PROPERTIES
@@ -425,10 +458,99 @@ class Vector(
     def elements(
         self,
     ) -> list[Fraction]:
-        return [item for item in self._data]
+        return list(self._items())
 
     # PRIVATE/PROTECTED METHODS
 
+    @classmethod
+    def _adopt(
+        cls,
+        data: tuple[Fraction, ...],
+    ) -> Vector:
+        """
+        Creates a vector that takes ownership of a non-empty tuple of
+            fractions without coercing or validating its elements.
+
+        Arguments
+        - data: The elements of the new vector, every one of which must
+            already be a `Fraction`.
+
+        Notes
+        - This is the fast construction path for results that are known
+            to be valid, such as the output of arithmetic on vectors.
+        - This is a private method not meant to be exposed.
+        """
+        return cls._view(data, len(data), 0, 1)
+
+    @classmethod
+    def _from_scaled(
+        cls,
+        scaled: Scaled,
+    ) -> Vector:
+        """
+        Creates a vector from integer numerators over a shared
+            denominator.
+
+        Arguments
+        - scaled: The numerators and their shared denominator.
+
+        Notes
+        - If the shared denominator is 1, the integers are kept so that
+            further arithmetic on the new vector can skip fractions.
+        - This is a private method not meant to be exposed.
+        """
+        vector = cls._adopt(from_scaled(*scaled))
+        if scaled[1] == 1:
+            vector._scaled = scaled
+        return vector
+
+    @classmethod
+    def _view(
+        cls,
+        data: tuple[Fraction, ...],
+        length: int,
+        offset: int,
+        stride: int,
+    ) -> Vector:
+        """
+        Creates a vector that addresses an existing flat buffer of
+            elements without copying or validating it.
+
+        Arguments
+        - data: The flat buffer of elements to share.
+        - length: The number of elements in the new vector.
+        - offset: The position in `data` of the first element.
+        - stride: The distance in `data` between consecutive elements.
+
+        Notes
+        - The caller is responsible for making sure that every position
+            addressed by `length`, `offset` and `stride` exists in
+            `data`.
+        - This is a private method not meant to be exposed.
+        """
+        view = cls.__new__(cls)
+        view._data = data
+        view._offset = offset
+        view._stride = stride
+        view._length = length
+        view._hash = None
+        view._scaled = None
+        return view
+
+    def _items(
+        self,
+    ) -> tuple[Fraction, ...]:
+        """
+        Returns the elements of this vector as a tuple, only copying
+            them if this vector is a view on part of its buffer.
+
+        Notes
+        - This is a private method not meant to be exposed.
+        """
+        return strided_slice(
+            self._data, self._offset, self._length, self._stride
+        )
+
     def _elwise_operate(
         self,
         other: Vector | float | Fraction,
@@ -456,6 +578,8 @@ class Vector(
             have the required shape.
 
         Notes
+        - A float operand is first converted with the global float
+            ingestion policy, see `set_float_policy`.
         - The operation specified in `operation` may raise errors. These
             will not be caught by this method.
         - This is a private method not meant to be exposed.
@@ -469,21 +593,54 @@ class Vector(
                     f"{order[0]} side length {self._length} "
                     f"does not equal {order[1]} side length {other._length}"
                 )
-            if self_side_left:
-                return Vector(
-                    operation(self_item, other_item)
-                    for self_item, other_item in zip(self._data, other._data)
+            self_scaled = self._scaled_form()
+            other_scaled = other._scaled_form()
+            if self_scaled is not None and other_scaled is not None:
+                scaled = (
+                    scaled_operate(self_scaled, other_scaled, operation)
+                    if self_side_left
+                    else scaled_operate(other_scaled, self_scaled, operation)
                 )
+                if scaled is not None:
+                    return Vector._from_scaled(scaled)
+            if self_side_left:
+                data = tuple(map(operation, self._items(), other._items()))
             else:
-                return Vector(
-                    operation(other_item, self_item)
-                    for self_item, other_item in zip(self._data, other._data)
-                )
+                data = tuple(map(operation, other._items(), self._items()))
         else:
+            if isinstance(other, float):
+                other = to_fractions((other,), None)[0]
+            self_scaled = self._scaled_form()
+            if self_scaled is not None and isinstance(other, (int, Fraction)):
+                other = Fraction(other)
+                scaled = (
+                    scaled_operate(self_scaled, other, operation)
+                    if self_side_left
+                    else scaled_operate(other, self_scaled, operation)
+                )
+                if scaled is not None:
+                    return Vector._from_scaled(scaled)
             if self_side_left:
-                return Vector(operation(item, other) for item in self._data)
+                data = tuple(operation(item, other) for item in self._items())
             else:
-                return Vector(operation(other, item) for item in self._data)
+                data = tuple(operation(other, item) for item in self._items())
+        return Vector._adopt(data)
+
+    def _scaled_form(
+        self,
+    ) -> Scaled | None:
+        """
+        Returns the elements of this vector as integer numerators over a
+            shared denominator, computing and caching them on first use.
+
+        Notes
+        - Returns `None` if the shared denominator is too large for the
+            integer representation to be worthwhile.
+        - This is a private method not meant to be exposed.
+        """
+        if self._scaled is None:
+            self._scaled = to_scaled(self._items()) or ((), 0)
+        return self._scaled if self._scaled[1] != 0 else None
 
     def _string_format(
         self,
@@ -513,7 +670,7 @@ class Vector(
             f"\u27E8 "
             + ", ".join(
                 (
-                    format_as_str(self._data[element], element)
+                    format_as_str(self[element], element)
                     for element in range(min(self._length, max_elements + 1))
                 )
             )
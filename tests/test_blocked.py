@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from momlib import Matrix, get_strassen_cutoff, set_strassen_cutoff
+from momlib._blocked import (
+    integer_gram,
+    integer_product,
+    integer_row_products,
+)
+from tests.helpers import rand_index, rand_mat
+
+
+def rand_int_rows(rows: int, cols: int, bits: int) -> list[list[int]]:
+    return [
+        [random.getrandbits(bits) - (1 << (bits - 1)) for _ in range(cols)]
+        for _ in range(rows)
+    ]
+
+
+def naive_product(left: list[list[int]], right: list[list[int]]):
+    return [
+        [sum(a * b for a, b in zip(row, col)) for col in zip(*right)]
+        for row in left
+    ]
+
+
+class TestBlocked(unittest.TestCase):
+    def setUp(self):
+        self.cutoff = get_strassen_cutoff()
+
+    def tearDown(self):
+        set_strassen_cutoff(self.cutoff)
+
+    def test_integer_product(self):
+        set_strassen_cutoff(2)
+        # small elements are multiplied by Kronecker substitution, and
+        # large ones by Strassen-Winograd recursion
+        for bits in (1, 12, 64, 600):
+            for _ in range(5):
+                size = (
+                    rand_index(2, 40),
+                    rand_index(2, 40),
+                    rand_index(16, 40),
+                )
+                left = rand_int_rows(size[0], size[1], bits)
+                right = rand_int_rows(size[1], size[2], bits)
+                self.assertEqual(
+                    integer_product(left, right), naive_product(left, right)
+                )
+
+    def test_integer_gram(self):
+        for count in (1, 5, 16, 40, 65, 150):
+            bits = random.choice((8, 600))
+            vectors = rand_int_rows(count, rand_index(1, 30), bits)
+            self.assertEqual(
+                integer_gram(vectors),
+                naive_product(vectors, list(zip(*vectors))),
+            )
+
+    def test_integer_row_products(self):
+        # rows of different magnitudes need differently packed columns
+        right = rand_int_rows(10, 20, 8)
+        left = [
+            row
+            for bits in (4, 40, 600, 4)
+            for row in rand_int_rows(3, 10, bits)
+        ]
+        self.assertEqual(
+            list(integer_row_products(iter(left), right)),
+            naive_product(left, right),
+        )
+
+    def test_matrix_product(self):
+        for _ in range(5):
+            size = (rand_index(4, 12), rand_index(4, 12), rand_index(4, 12))
+            mat1 = rand_mat(size[0], size[1])
+            mat2 = rand_mat(size[1], size[2])
+            mat3 = Matrix([[n.numerator for n in row] for row in mat1])
+            mat4 = Matrix([[n.numerator for n in row] for row in mat2])
+            set_strassen_cutoff(10**9)
+            expected1 = mat1 @ mat2
+            expected2 = mat3 @ mat4
+            set_strassen_cutoff(2)
+            self.assertEqual(mat1 @ mat2, expected1)
+            self.assertEqual(mat3 @ mat4, expected2)
+
+    def test_cutoff(self):
+        set_strassen_cutoff(16)
+        self.assertEqual(get_strassen_cutoff(), 16)
+        with self.assertRaises(ValueError):
+            set_strassen_cutoff(1)
+        self.assertEqual(get_strassen_cutoff(), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
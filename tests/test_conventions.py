@@ -64,6 +64,48 @@ class TestConventions(unittest.TestCase):
                     signature(item),
                     "momlib/_vector.py",
                 )
+        for name, item in momlib.FloatMatrix.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_float_matrix.py",
+                )
+        for name, item in momlib.FloatVector.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_float_vector.py",
+                )
+        for name, item in momlib.ModularMatrix.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_modular.py",
+                )
+        for name, item in momlib.MatrixStack.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_stack.py",
+                )
+        for name, item in momlib.EchelonForm.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_echelon.py",
+                )
+        for name, item in momlib.LUFactorization.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_lu.py",
+                )
         for name, item in momlib._linalg.__dict__.items():
             if isinstance(item, FunctionType) and name != "overload":
                 test_sig(
@@ -71,6 +113,27 @@ class TestConventions(unittest.TestCase):
                     signature(item),
                     "momlib/_linalg.py",
                 )
+        for name, item in momlib._policy.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_policy.py",
+                )
+        for name, item in momlib._blocked.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_blocked.py",
+                )
+        for name, item in momlib._elimination.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_sig(
+                    name,
+                    signature(item),
+                    "momlib/_elimination.py",
+                )
 
     def test_function_docstrings(self):
 
@@ -135,6 +198,48 @@ class TestConventions(unittest.TestCase):
                     item.__doc__,
                     "momlib/_vector.py",
                 )
+        for name, item in momlib.FloatMatrix.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_float_matrix.py",
+                )
+        for name, item in momlib.FloatVector.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_float_vector.py",
+                )
+        for name, item in momlib.ModularMatrix.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_modular.py",
+                )
+        for name, item in momlib.MatrixStack.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_stack.py",
+                )
+        for name, item in momlib.EchelonForm.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_echelon.py",
+                )
+        for name, item in momlib.LUFactorization.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_lu.py",
+                )
         for name, item in momlib._linalg.__dict__.items():
             if isinstance(item, FunctionType) and name != "overload":
                 test_doc(
@@ -142,6 +247,27 @@ class TestConventions(unittest.TestCase):
                     item.__doc__,
                     "momlib/_linalg.py",
                 )
+        for name, item in momlib._policy.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_policy.py",
+                )
+        for name, item in momlib._blocked.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_blocked.py",
+                )
+        for name, item in momlib._elimination.__dict__.items():
+            if isinstance(item, FunctionType) and name != "overload":
+                test_doc(
+                    name,
+                    item.__doc__,
+                    "momlib/_elimination.py",
+                )
 
 
 if __name__ == "__main__":
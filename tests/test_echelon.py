@@ -0,0 +1,107 @@
+import unittest
+from fractions import Fraction
+
+import momlib._linalg as linalg
+from momlib import (
+    EchelonForm,
+    Matrix,
+    Vector,
+)
+from tests.helpers import rand_index, rand_mat
+
+
+class TestEchelonForm(unittest.TestCase):
+    def test_init(self):
+        mat1 = Matrix([[0, 2, 4], [1, 1, 1], [2, 2, 2]])
+        reduced = linalg.row_reduce(mat1)
+        self.assertIsInstance(reduced, EchelonForm)
+        self.assertEqual(reduced, Matrix([[1, 0, -1], [0, 1, 2], [0, 0, 0]]))
+        self.assertEqual(reduced, EchelonForm(mat1))
+        self.assertEqual(reduced.form, "rref")
+        self.assertEqual(reduced.pivot_columns, (0, 1))
+        self.assertEqual(reduced.rank, 2)
+        self.assertIs(reduced.source, mat1)
+        upper = linalg.row_reduce(mat1, "ref")
+        self.assertEqual(upper.form, "ref")
+        self.assertEqual(upper, Matrix([[2, 2, 2], [0, 2, 4], [0, 0, 0]]))
+        self.assertEqual(upper.permutation, (2, 0, 1))
+        self.assertEqual(upper.sign, 1)
+        self.assertEqual(EchelonForm(mat1, "ref", "first").sign, -1)
+        # Operations on echelon forms give ordinary matrices
+        self.assertIs(type(reduced + reduced), Matrix)
+        self.assertIs(type(reduced[0:2, :]), Matrix)
+        with self.assertRaises(ValueError):
+            EchelonForm(mat1, "rref", "largest")  # type: ignore
+
+    def test_repr_hash(self):
+        mat1 = rand_mat(3, 4)
+        for form in ("rref", "ref"):
+            echelon = EchelonForm(mat1, form, "first")
+            copy = eval(repr(echelon))
+            self.assertEqual(copy, echelon)
+            self.assertEqual(copy.pivot_columns, echelon.pivot_columns)
+            self.assertEqual(hash(echelon), hash(Matrix(list(echelon))))
+
+    def test_sign(self):
+        for dim in range(2, 9):
+            mat1 = rand_mat(dim, dim)
+            upper = EchelonForm(mat1, "ref")
+            det = Fraction(upper.sign)
+            for item in upper.diagonal:
+                det *= item
+            self.assertEqual(det, linalg.determinant(mat1))
+
+    def test_spaces(self):
+        for _ in range(10):
+            rows = rand_index(2, 6)
+            cols = rand_index(2, 6)
+            mat1 = rand_mat(rows, cols)
+            # Make some rows depend on others
+            items = [list(row) for row in mat1]
+            items[-1] = [a - 2 * b for a, b in zip(items[0], items[-1])]
+            items.append([a + b for a, b in zip(items[0], items[-1])])
+            mat2 = Matrix(items)
+            rank = linalg.rank(mat2)
+            for form in ("rref", "ref"):
+                echelon = EchelonForm(mat2, form)
+                self.assertEqual(echelon.rank, rank)
+                self.assertEqual(linalg.rank(echelon), rank)
+                nullspace = echelon.nullspace()
+                self.assertEqual(len(nullspace), cols - rank)
+                for vector in nullspace:
+                    self.assertEqual(mat2 @ vector, Vector([0] * (rows + 1)))
+                if nullspace:
+                    self.assertEqual(
+                        linalg.rank(Matrix(nullspace)), cols - rank
+                    )
+                column_space = echelon.column_space()
+                self.assertEqual(len(column_space), rank)
+                self.assertEqual(
+                    linalg.rank(linalg.join_vectors(*column_space)), rank
+                )
+                row_space = echelon.row_space()
+                self.assertEqual(len(row_space), rank)
+                self.assertEqual(
+                    linalg.rank(
+                        Matrix(list(row_space) + list(mat2))  # type: ignore
+                    ),
+                    rank,
+                )
+
+    def test_is_consistent(self):
+        mat1 = Matrix([[1, 2], [2, 4]])
+        self.assertTrue(EchelonForm(mat1 | Matrix([[3], [6]])).is_consistent())
+        self.assertFalse(
+            EchelonForm(mat1 | Matrix([[3], [7]]), "ref").is_consistent()
+        )
+        echelon = EchelonForm(mat1 | Matrix([[3, 1], [6, 0]]))
+        self.assertFalse(echelon.is_consistent(2))
+        self.assertTrue(EchelonForm(echelon[:, :3]).is_consistent())
+        with self.assertRaises(ValueError):
+            echelon.is_consistent(0)
+        with self.assertRaises(ValueError):
+            echelon.is_consistent(4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from momlib import FloatMatrix, FloatVector, Matrix, DimensionMismatchError
+from tests.helpers import rand_index, rand_mat
+
+
+class TestFloatMatrix(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            FloatMatrix([])
+        with self.assertRaises(ValueError):
+            FloatMatrix([[1, 2], [3]])
+        mat = FloatMatrix([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(mat.shape, (2, 3))
+        self.assertEqual(len(mat), 6)
+        self.assertEqual(mat[1, 2], 6.0)
+        self.assertIsInstance(mat[1, 2], float)
+
+    def test_getitem(self):
+        mat = FloatMatrix([[1, 2, 3], [4, 5, 6]])
+        with self.assertRaises(IndexError):
+            mat[2, 0]
+        with self.assertRaises(ValueError):
+            mat[1:1, :]
+        self.assertEqual(mat[-1, -1], 6.0)
+        self.assertEqual(mat[:, 1], FloatMatrix([[2], [5]]))
+        self.assertEqual(mat[-1, ::-1], FloatMatrix([[6, 5, 4]]))
+        self.assertEqual(list(mat.diagonal), [1.0, 5.0])
+
+    def test_repr_hash(self):
+        for _ in range(10):
+            mat = FloatMatrix(rand_mat(rand_index(), rand_index()))
+            self.assertEqual(mat, eval(repr(mat)))
+            self.assertEqual(hash(mat), hash(FloatMatrix(mat.elements)))
+
+    def test_conversion(self):
+        for _ in range(10):
+            mat = rand_mat(rand_index(), rand_index())
+            float_mat = FloatMatrix(mat)
+            for row, float_row in zip(mat, float_mat):
+                self.assertEqual(list(map(float, row)), list(float_row))
+            self.assertEqual(FloatMatrix(Matrix(float_mat)), float_mat)
+
+    def test_matmul(self):
+        with self.assertRaises(DimensionMismatchError):
+            FloatMatrix([[1, 2]]) @ FloatMatrix([[1, 2]])
+        for _ in range(10):
+            size = (rand_index(), rand_index(), rand_index())
+            mat1 = rand_mat(size[0], size[1])
+            mat2 = rand_mat(size[1], size[2])
+            product = FloatMatrix(mat1) @ FloatMatrix(mat2)
+            self.assertEqual(product.shape, (size[0], size[2]))
+            for row, exact_row in zip(product, mat1 @ mat2):
+                for item, exact_item in zip(row, exact_row):
+                    self.assertAlmostEqual(item, float(exact_item))
+
+    def test_vector_product(self):
+        mat = FloatMatrix([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(mat @ FloatVector([1, 0, -1]), FloatVector([-2, -2]))
+        self.assertEqual(FloatVector([1, -1]) @ mat, FloatVector([-3] * 3))
+        with self.assertRaises(DimensionMismatchError):
+            mat @ FloatVector([1, 2])
+        with self.assertRaises(DimensionMismatchError):
+            FloatVector([1, 2, 3]) @ mat
+
+    def test_elementwise(self):
+        mat1 = FloatMatrix([[1, 2], [3, 4]])
+        mat2 = FloatMatrix([[4, 3], [2, 1]])
+        self.assertEqual(mat1 + mat2, FloatMatrix([[5, 5], [5, 5]]))
+        self.assertEqual(mat1 - mat2, FloatMatrix([[-3, -1], [1, 3]]))
+        self.assertEqual(mat1 * mat2, FloatMatrix([[4, 6], [6, 4]]))
+        self.assertEqual(mat1 / 2, FloatMatrix([[0.5, 1], [1.5, 2]]))
+        self.assertEqual(12 / mat1, FloatMatrix([[12, 6], [4, 3]]))
+        self.assertEqual(1 - mat1, -(mat1 - 1))
+        self.assertEqual(
+            mat1 | mat2, FloatMatrix([[1, 2, 4, 3], [3, 4, 2, 1]])
+        )
+        with self.assertRaises(DimensionMismatchError):
+            mat1 + FloatMatrix([[1, 2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from math import fsum
+
+from momlib import FloatVector, Vector, DimensionMismatchError
+from tests.helpers import rand_index, rand_vec
+
+
+class TestFloatVector(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            FloatVector([])
+        vec = FloatVector([1, 2, 3])
+        self.assertEqual(len(vec), 3)
+        self.assertEqual(list(vec), [1.0, 2.0, 3.0])
+        self.assertIsInstance(vec[0], float)
+
+    def test_getitem(self):
+        vec = FloatVector([1, 2, 3, 4])
+        with self.assertRaises(IndexError):
+            vec[4]
+        self.assertEqual(vec[-1], 4.0)
+        self.assertEqual(vec[::-2], FloatVector([4, 2]))
+        with self.assertRaises(ValueError):
+            vec[2:2]
+
+    def test_repr_hash(self):
+        for _ in range(10):
+            vec = FloatVector(rand_vec(rand_index()))
+            self.assertEqual(vec, eval(repr(vec)))
+            self.assertEqual(hash(vec), hash(FloatVector(vec.elements)))
+
+    def test_conversion(self):
+        for _ in range(10):
+            vec = rand_vec(rand_index())
+            float_vec = FloatVector(vec)
+            self.assertEqual(list(map(float, vec)), list(float_vec))
+            self.assertEqual(FloatVector(Vector(float_vec)), float_vec)
+
+    def test_dot(self):
+        with self.assertRaises(DimensionMismatchError):
+            FloatVector([1, 2]) @ FloatVector([1, 2, 3])
+        self.assertEqual(
+            FloatVector([1e100, 1, -1e100]) @ FloatVector([1] * 3), 1
+        )
+        for _ in range(10):
+            length = rand_index()
+            vec1 = FloatVector(rand_vec(length))
+            vec2 = FloatVector(rand_vec(length))
+            self.assertEqual(
+                vec1 @ vec2, fsum(a * b for a, b in zip(vec1, vec2))
+            )
+
+    def test_elementwise(self):
+        vec1 = FloatVector([1, 2])
+        vec2 = FloatVector([4, 8])
+        self.assertEqual(vec1 + vec2, FloatVector([5, 10]))
+        self.assertEqual(vec1 - vec2, FloatVector([-3, -6]))
+        self.assertEqual(vec1 * vec2, FloatVector([4, 16]))
+        self.assertEqual(vec2 / vec1, FloatVector([4, 4]))
+        self.assertEqual(2 * vec1, FloatVector([2, 4]))
+        self.assertEqual(-vec1, FloatVector([-1, -2]))
+        with self.assertRaises(DimensionMismatchError):
+            vec1 + FloatVector([1])
+
+
+if __name__ == "__main__":
+    unittest.main()
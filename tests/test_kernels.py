@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from momlib._kernels import (
+    KERNEL_MAX_SIZE,
+    adjugate_kernel,
+    determinant_kernel,
+    product_kernel,
+)
+
+
+def rand_ints(length: int) -> list[int]:
+    return [random.randint(-9, 9) for _ in range(length)]
+
+
+def naive_product(
+    left: list[int], right: list[int], rows: int, inner: int, cols: int
+) -> list[int]:
+    return [
+        sum(
+            left[row * inner + k] * right[k * cols + col] for k in range(inner)
+        )
+        for row in range(rows)
+        for col in range(cols)
+    ]
+
+
+class TestKernels(unittest.TestCase):
+    def test_product(self):
+        for _ in range(20):
+            size = [random.randint(1, KERNEL_MAX_SIZE) for _ in range(3)]
+            left = rand_ints(size[0] * size[1])
+            right = rand_ints(size[1] * size[2])
+            self.assertEqual(
+                list(product_kernel(*size)(left, right)),
+                naive_product(left, right, *size),
+            )
+        self.assertIs(product_kernel(2, 3, 4), product_kernel(2, 3, 4))
+
+    def test_adjugate_determinant(self):
+        for size in range(1, KERNEL_MAX_SIZE + 1):
+            items = rand_ints(size * size)
+            det, adjugate = adjugate_kernel(size)(items)
+            self.assertEqual(determinant_kernel(size)(items), det)
+            # a matrix times its adjugate is its determinant times the
+            # identity
+            self.assertEqual(
+                naive_product(items, list(adjugate), size, size, size),
+                [det * (i % (size + 1) == 0) for i in range(size * size)],
+            )
+        # swapping two rows negates the determinant
+        items = rand_ints(16)
+        swapped = items[4:8] + items[:4] + items[8:]
+        self.assertEqual(
+            determinant_kernel(4)(swapped), -determinant_kernel(4)(items)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,19 @@
 from typing import List
 import unittest
 from fractions import Fraction
+from random import getrandbits
+from sys import getsizeof
+from unittest.mock import patch
 
-from tests.helpers import rand_mat, rand_vec, rand_index
+from tests.helpers import rand_mat, rand_num, rand_vec, rand_index
 
 import momlib._linalg as linalg
+from momlib._kernels import KERNEL_MAX_SIZE, _kernels
 from momlib import (
+    FloatMatrix,
+    FloatVector,
     Matrix,
+    ModularMatrix,
     Vector,
     LinearDependenceError,
     RectangularMatrixError,
@@ -106,6 +113,18 @@ class TestLinalgTools(unittest.TestCase):
         mat2 = Matrix([[3, 0, 1], [1, 2, 5], [-1, 4, 2]])
         self.assertEqual(linalg.determinant(mat2), -42)
 
+        for dim in range(1, 8):
+            mat3 = Matrix(
+                [[rand_index(-9, 9) for _ in range(dim)] for _ in range(dim)]
+            )
+            det = linalg.determinant(mat3)
+            self.assertIsInstance(det, Fraction)
+            self.assertEqual(det, laplace_determinant(mat3))
+        mat4 = Matrix([[0, 1, 2, 3], [0, 4, 5, 6], [1, 7, 8, 9], [2, 0, 0, 1]])
+        self.assertEqual(linalg.determinant(mat4), laplace_determinant(mat4))
+        mat5 = Matrix([[1, 2, 3, 4], [2, 4, 6, 8], [0, 1, 1, 1], [5, 6, 7, 8]])
+        self.assertEqual(linalg.determinant(mat5), 0)
+
     def test_distance(self):
         vec1 = Vector([0, 3])
         vec2 = Vector([0, 5])
@@ -120,6 +139,29 @@ class TestLinalgTools(unittest.TestCase):
         with self.assertRaises(DimensionMismatchError):
             linalg.distance(rand_vec(3), rand_vec(2))
 
+    def test_gram(self):
+        for _ in range(10):
+            mat1 = rand_mat(rand_index(), rand_index())
+            mat2 = Matrix([[n.numerator for n in row] for row in mat1])
+            for mat in (mat1, mat2):
+                self.assertEqual(linalg.gram(mat), linalg.transpose(mat) @ mat)
+                self.assertEqual(
+                    linalg.gram(mat, "row"), mat @ linalg.transpose(mat)
+                )
+        # denominators too large for a shared one
+        mat3 = Matrix(
+            [[Fraction(1, 2**200 + 1), 1], [Fraction(1, 3**200), 2]]
+        )
+        self.assertEqual(linalg.gram(mat3), linalg.transpose(mat3) @ mat3)
+        float_mat = FloatMatrix([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(
+            linalg.gram(float_mat),
+            FloatMatrix([[17, 22, 27], [22, 29, 36], [27, 36, 45]]),
+        )
+        self.assertEqual(
+            linalg.gram(float_mat, "row"), FloatMatrix([[14, 32], [32, 77]])
+        )
+
     def test_homogenous(self):
         mat1 = linalg.homogenous((5, 5), 1)
         for i in range(5):
@@ -151,12 +193,12 @@ class TestLinalgTools(unittest.TestCase):
 
     def test_inverse(self):
         for _ in range(10):
-            for i in range(1, 7):
+            for i in range(1, 9):
                 mat1 = rand_mat(i, i)
                 try:
                     mat1_inv = linalg.inverse(mat1)
                     self.assertEqual(mat1 @ mat1_inv, linalg.identity(i))
-                except (LinearDependenceError):
+                except LinearDependenceError:
                     pass  # shouldn't happen often, just skip if it does
         with self.assertRaises(LinearDependenceError):
             vec1 = Vector([1, 2, 3])
@@ -222,6 +264,43 @@ class TestLinalgTools(unittest.TestCase):
         for item in linalg.limit_denominator(rand_vec(5), max_denom):
             self.assertLessEqual(item.denominator, max_denom)
 
+    def test_memory_saved(self):
+        mat1 = linalg.identity(10)
+        self.assertIs(mat1[0, 1], mat1[5, 3])
+        self.assertEqual(
+            linalg.memory_saved(mat1), 98 * getsizeof(Fraction(0))
+        )
+        mat2 = linalg.homogenous((2, 3), Fraction(1, 7))
+        self.assertEqual(linalg.memory_saved(mat2), 5 * getsizeof(mat2[0, 0]))
+        self.assertEqual(linalg.memory_saved(Vector([1, 2, 3])), 0)
+        # eliminated cells all share a single zero
+        mat3 = linalg.row_reduce(rand_mat(4, 4), "ref")
+        self.assertIs(mat3[3, 0], Vector([0])[0])
+        mat4 = Matrix([[1, 0], [0.0, Fraction(1)]])
+        self.assertIs(mat4[0, 0], mat4[1, 1])
+        self.assertIs(mat4[0, 1], mat4[1, 0])
+
+    def test_multi_dot(self):
+        with self.assertRaises(ValueError):
+            linalg.multi_dot()
+        with self.assertRaises(DimensionMismatchError):
+            linalg.multi_dot(rand_mat(2, 3), rand_mat(2, 3))
+        mat1 = rand_mat(3, 4)
+        self.assertIs(linalg.multi_dot(mat1), mat1)
+        for _ in range(10):
+            dims = [rand_index() for _ in range(rand_index(3, 7))]
+            mats = [rand_mat(*shape) for shape in zip(dims, dims[1:])]
+            product = mats[0]
+            for mat in mats[1:]:
+                product = product @ mat
+            self.assertEqual(linalg.multi_dot(*mats), product)
+        float_mats = [FloatMatrix(mat) for mat in mats]
+        float_product = linalg.multi_dot(*float_mats)
+        self.assertIsInstance(float_product, FloatMatrix)
+        for float_item, item in zip(float_product, product):
+            for float_num, num in zip(float_item, item):
+                self.assertAlmostEqual(float_num, float(num))
+
     def test_normalize_magnitude(self):
         for _ in range(10):
             vec = rand_vec(5)
@@ -252,6 +331,15 @@ class TestLinalgTools(unittest.TestCase):
             self.assertEqual(
                 linalg.matrix_power(mat, pow_), naive_power(mat, pow_)
             )
+        for i in range(1, 6):
+            mat = Matrix(
+                [[rand_index(-5, 5) for _ in range(i)] for _ in range(i)]
+            )
+            pow_ = rand_index()
+            self.assertEqual(
+                linalg.matrix_power(mat, pow_),
+                naive_power(mat * Fraction(1, 2), pow_) * (2**pow_),
+            )
 
     def test_orthogonalize(self):
         orthos1 = linalg.orthogonalize(
@@ -286,6 +374,292 @@ class TestLinalgTools(unittest.TestCase):
                     if pivot < size[1] - 1:
                         self.assertEqual(mat2[row, pivot], 1)
 
+    def test_fraction_free(self):
+        for dim in range(7, 10):
+            mat1 = rand_mat(dim, dim)
+            mat2 = rand_mat(dim, dim)
+            self.assertEqual(
+                linalg.determinant(mat1 @ mat2),
+                linalg.determinant(mat1) * linalg.determinant(mat2),
+            )
+            upper = linalg.row_reduce(mat1, "ref")
+            diagonal = Fraction(1)
+            for index in range(dim):
+                self.assertTrue(
+                    all(upper[index, col] == 0 for col in range(index))
+                )
+                diagonal *= upper[index, index]
+            self.assertEqual(abs(diagonal), abs(linalg.determinant(mat1)))
+            self.assertEqual(linalg.row_reduce(mat1), linalg.identity(dim))
+        mat3 = Matrix(
+            [
+                [0, 2, Fraction(1, 3), 4, 1],
+                [0, 4, Fraction(2, 3), 8, 2],
+                [1, Fraction(1, 2), 0, 0, 7],
+                [1, Fraction(5, 2), Fraction(1, 3), 4, 8],
+            ]
+        )
+        self.assertEqual(
+            linalg.row_reduce(mat3),
+            Matrix(
+                [
+                    [1, 0, Fraction(-1, 12), -1, Fraction(27, 4)],
+                    [0, 1, Fraction(1, 6), 2, Fraction(1, 2)],
+                    [0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0],
+                ]
+            ),
+        )
+        self.assertEqual(
+            linalg.row_reduce(mat3, "ref"),
+            Matrix(
+                [
+                    [1, Fraction(1, 2), 0, 0, 7],
+                    [0, 4, Fraction(2, 3), 8, 2],
+                    [0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0],
+                ]
+            ),
+        )
+        self.assertEqual(linalg.rank(mat3), 2)
+        mat4 = Matrix([[rand_num() for _ in range(8)] for _ in range(7)])
+        rows = list(mat4)
+        mat5 = Matrix(rows + [[a + b for a, b in zip(rows[0], rows[1])]])
+        self.assertEqual(linalg.determinant(mat5), 0)
+        self.assertEqual(linalg.rank(mat5), 7)
+
+    def test_pivoting(self):
+        strategies = ("partial", "first", "smallest")
+        for dim in range(7, 10):
+            mat1 = Matrix(
+                [
+                    [
+                        rand_index(-3, 3) if row % 2 else rand_num()
+                        for _ in range(dim)
+                    ]
+                    for row in range(dim)
+                ]
+            )
+            det = linalg.determinant(mat1)
+            reduced = linalg.row_reduce(mat1)
+            for pivoting in strategies:
+                self.assertEqual(linalg.determinant(mat1, pivoting), det)
+                self.assertEqual(
+                    linalg.row_reduce(mat1, "rref", pivoting), reduced
+                )
+                self.assertEqual(
+                    linalg.rank(mat1, pivoting=pivoting), linalg.rank(mat1)
+                )
+                if det != 0:
+                    self.assertEqual(
+                        linalg.inverse(mat1, pivoting) @ mat1,
+                        linalg.identity(dim),
+                    )
+        mat2 = Matrix([[1, 2], [3, 4], [0, 5]])
+        self.assertEqual(
+            linalg.row_reduce(mat2, "ref"),
+            Matrix([[3, 4], [0, 5], [0, 0]]),
+        )
+        self.assertEqual(
+            linalg.row_reduce(mat2, "ref", "first"),
+            Matrix([[1, 2], [0, -2], [0, 0]]),
+        )
+        self.assertEqual(
+            linalg.row_reduce(Matrix([[9, 1], [2, 1]]), "ref", "smallest"),
+            Matrix([[2, 1], [0, Fraction(-7, 2)]]),
+        )
+        float_mat = FloatMatrix([[1, 2], [3, 4]])
+        self.assertEqual(
+            linalg.row_reduce(float_mat, "ref", "first"),
+            FloatMatrix([[1, 2], [0, -2]]),
+        )
+        self.assertAlmostEqual(linalg.determinant(float_mat, "first"), -2)
+        with self.assertRaises(ValueError):
+            linalg.row_reduce(float_mat, "ref", "smallest")
+        with self.assertRaises(ValueError):
+            linalg.determinant(mat1, "largest")  # type: ignore
+
+    def test_float_tools(self):
+        for _ in range(10):
+            for i in range(1, 7):
+                mat1 = rand_mat(i, i)
+                float_mat1 = FloatMatrix(mat1)
+                self.assertAlmostEqual(
+                    linalg.determinant(float_mat1)
+                    / float(linalg.determinant(mat1)),
+                    1.0,
+                )
+                product = float_mat1 @ linalg.inverse(float_mat1)
+                for row in range(i):
+                    for col in range(i):
+                        self.assertAlmostEqual(
+                            product[row, col], 1.0 if row == col else 0.0
+                        )
+        mat2 = FloatMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(linalg.determinant(mat2), 0.0)
+        with self.assertRaises(LinearDependenceError):
+            linalg.inverse(mat2)
+        # small entries are not negligible when every entry is small
+        tiny = FloatMatrix([[1e-20, 0], [0, 1e-20]])
+        self.assertEqual(
+            linalg.inverse(tiny), FloatMatrix([[1e20, 0], [0, 1e20]])
+        )
+        self.assertEqual(linalg.rank(tiny), 2)
+        rref = linalg.row_reduce(mat2)
+        for row, exact_row in zip(rref, [[1, 0, -1], [0, 1, 2], [0, 0, 0]]):
+            for item, exact_item in zip(row, exact_row):
+                self.assertAlmostEqual(item, exact_item)
+        ref = linalg.row_reduce(mat2, "ref")
+        self.assertEqual(list(ref[2, :]), [(0.0, 0.0, 0.0)])
+        vec1 = FloatVector(rand_vec(5))
+        self.assertAlmostEqual(linalg.magnitude(linalg.normalize(vec1)), 1.0)
+        orthos = linalg.orthogonalize(
+            FloatVector([1, 1, 1]),
+            FloatVector([1, 1, 2]),
+            FloatVector([2, 1, 1]),
+        )
+        for i in range(3):
+            self.assertIsInstance(orthos[i], FloatVector)
+            for j in range(i):
+                self.assertAlmostEqual(orthos[i] @ orthos[j], 0.0)
+
+    def test_sparse_elimination(self):
+        blocks = [rand_mat(3, 3) for _ in range(6)]
+        items = [[Fraction(0)] * 18 for _ in range(18)]
+        for index, block in enumerate(blocks):
+            for row in range(3):
+                for col in range(3):
+                    items[3 * index + row][3 * index + col] = block[row, col]
+        # Scramble the rows, so that blocks are not already in order
+        items = items[1::2] + items[::2]
+        mat1 = Matrix(items)
+        det = linalg.determinant(mat1)
+        product = Fraction(1)
+        for block in blocks:
+            product *= linalg.determinant(block)
+        self.assertEqual(abs(det), abs(product))
+        self.assertEqual(linalg.row_reduce(mat1), linalg.identity(18))
+        self.assertEqual(linalg.inverse(mat1) @ mat1, linalg.identity(18))
+        for pivoting in ("partial", "first", "smallest", "markowitz"):
+            self.assertEqual(linalg.determinant(mat1, pivoting), det)
+            self.assertEqual(
+                linalg.row_reduce(mat1, "ref", pivoting)[17, :17],
+                Matrix([[0] * 17]),
+            )
+        # The node-edge incidence matrix of a cycle has a rank of one
+        # less than its number of nodes
+        mat2 = Matrix(
+            [
+                [
+                    1 if edge == node else -1 if edge == (node + 1) % 20 else 0
+                    for edge in range(20)
+                ]
+                for node in range(20)
+            ]
+        )
+        self.assertEqual(linalg.rank(mat2), 19)
+        self.assertEqual(linalg.determinant(mat2), 0)
+        reduced = linalg.row_reduce(mat2)
+        for pivoting in ("partial", "first", "smallest", "markowitz"):
+            self.assertEqual(
+                linalg.row_reduce(mat2, "rref", pivoting), reduced
+            )
+        self.assertEqual(reduced[:, 19], Matrix([[-1]] * 19 + [[0]]))
+
+    def test_product_rows(self):
+        with self.assertRaises(DimensionMismatchError):
+            linalg.product_rows(rand_mat(2, 3), rand_mat(2, 3))
+        for _ in range(10):
+            size = (rand_index(), rand_index(), rand_index(1, 20))
+            mat1 = rand_mat(size[0], size[1])
+            mat2 = rand_mat(size[1], size[2])
+            mat3 = Matrix([[n.numerator for n in row] for row in mat2])
+            for right in (mat2, mat3):
+                rows = linalg.product_rows(mat1, right)
+                self.assertEqual(
+                    linalg.join_vectors(*rows, orientation="row"),
+                    mat1 @ right,
+                )
+        # denominators too large for a shared one
+        mat4 = Matrix(
+            [[Fraction(1, 2**200 + 1), 1], [Fraction(1, 3**200), 2]]
+        )
+        self.assertEqual(
+            list(linalg.product_rows(mat4, mat4)),
+            list(linalg.split_vectors(mat4 @ mat4, "row")),
+        )
+
+    def test_rank_is_singular(self):
+        mat1 = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(linalg.rank(mat1), 2)
+        self.assertTrue(linalg.is_singular(mat1))
+        self.assertTrue(linalg.is_singular(mat1, "probabilistic"))
+        # the zero diagonal entry used to end the count early
+        mat2 = Matrix([[0, 1, 0], [0, 0, 1]])
+        self.assertEqual(linalg.rank(mat2), 2)
+        self.assertEqual(linalg.rank(ModularMatrix(mat1, 5)), 2)
+        self.assertEqual(linalg.rank(ModularMatrix([[2, 0], [0, 2]], 2)), 0)
+        with self.assertRaises(RectangularMatrixError):
+            linalg.is_singular(mat2)
+        for _ in range(10):
+            size = rand_index(2, 8)
+            mat3 = rand_mat(size, size)
+            self.assertEqual(linalg.rank(mat3), size)
+            self.assertEqual(linalg.rank(mat3, "probabilistic"), size)
+            self.assertFalse(linalg.is_singular(mat3))
+            rows = list(mat3)[: size - 1]
+            rows.append(tuple(a + b for a, b in zip(rows[0], rows[-1])))
+            mat4 = Matrix(rows)
+            self.assertEqual(linalg.rank(mat4), size - 1)
+            self.assertEqual(linalg.rank(mat4, "probabilistic"), size - 1)
+            self.assertTrue(linalg.is_singular(mat4))
+
+    def test_solve(self):
+        for _ in range(5):
+            for i in range(1, 9):
+                mat1 = rand_mat(i, i)
+                vec1 = rand_vec(i)
+                mat2 = rand_mat(i, 3)
+                try:
+                    self.assertEqual(mat1 @ linalg.solve(mat1, vec1), vec1)
+                    self.assertEqual(mat1 @ linalg.solve(mat1, mat2), mat2)
+                except LinearDependenceError:
+                    pass  # shouldn't happen often, just skip if it does
+        mat3 = Matrix(
+            [[Fraction(1, 2**200 + 1), 1], [Fraction(1, 3**200), 2]]
+        )
+        vec2 = Vector([1, 2])
+        self.assertEqual(mat3 @ linalg.solve(mat3, vec2), vec2)
+        float_vec = linalg.solve(
+            FloatMatrix([[2, 1], [1, 3]]), FloatVector([3, 5])
+        )
+        self.assertIsInstance(float_vec, FloatVector)
+        self.assertAlmostEqual(float_vec[0], 0.8)
+        self.assertAlmostEqual(float_vec[1], 1.4)
+        # a large right-hand side does not make the system look singular
+        float_mat = linalg.solve(
+            FloatMatrix([[1, 2], [3, 4]]), FloatMatrix([[1e18], [1e18]])
+        )
+        self.assertAlmostEqual(float_mat[0, 0] / 1e18, -1.0)
+        self.assertAlmostEqual(float_mat[1, 0] / 1e18, 1.0)
+        for side_len in (3, 8):
+            vec3 = Vector(range(1, side_len + 1))
+            mat4 = linalg.join_vectors(
+                *(vec3 * n for n in range(1, side_len + 1))
+            )
+            with self.assertRaises(LinearDependenceError):
+                linalg.solve(mat4, vec3)
+        # many right-hand sides share the kernel of a single inverse
+        mat5 = rand_mat(3, 3)
+        mat6 = rand_mat(3, 40)
+        self.assertEqual(mat5 @ linalg.solve(mat5, mat6), mat6)
+        for key in _kernels:
+            self.assertLessEqual(max(key[1:]), KERNEL_MAX_SIZE)
+        with self.assertRaises(RectangularMatrixError):
+            linalg.solve(rand_mat(2, 3), rand_vec(2))
+        with self.assertRaises(DimensionMismatchError):
+            linalg.solve(rand_mat(3, 3), rand_vec(2))
+
     def test_transpose(self):
         for i in range(1, 10):
             mat = rand_mat(i, 10 - i)
@@ -293,6 +667,76 @@ class TestLinalgTools(unittest.TestCase):
             for row in range(i):
                 for col in range(10 - i):
                     self.assertEqual(mat[row, col], tps[col, row])
+            self.assertEqual(linalg.transpose(tps), mat)
+            sub = mat[::-1, 1:] if 10 - i > 1 else mat[::-1, :]
+            sub_tps = linalg.transpose(sub)
+            self.assertEqual(sub_tps.shape, (sub.shape[1], sub.shape[0]))
+            for row in range(sub.shape[0]):
+                for col in range(sub.shape[1]):
+                    self.assertEqual(sub[row, col], sub_tps[col, row])
+
+    def test_verify(self):
+        for _ in range(10):
+            size = (rand_index(), rand_index(), rand_index())
+            mat1 = rand_mat(size[0], size[1])
+            mat2 = rand_mat(size[1], size[2])
+            product = mat1 @ mat2
+            self.assertTrue(linalg.verify_product(mat1, mat2, product))
+            wrong = product + Matrix(
+                [
+                    [int(row == col == 0) for col in range(size[2])]
+                    for row in range(size[0])
+                ]
+            )
+            self.assertFalse(linalg.verify_product(mat1, mat2, wrong))
+            self.assertFalse(
+                linalg.verify_product(mat1, mat2, rand_mat(size[0], 11))
+            )
+            mat3 = rand_mat(size[0], size[0])
+            try:
+                inverse = linalg.inverse(mat3)
+            except LinearDependenceError:
+                continue
+            self.assertTrue(linalg.verify_inverse(mat3, inverse))
+            self.assertFalse(linalg.verify_inverse(mat3, inverse * 2))
+        # denominators too large for a shared one
+        mat4 = Matrix(
+            [[Fraction(1, 2**200 + 1), 1], [Fraction(1, 3**200), 2]]
+        )
+        self.assertTrue(linalg.verify_inverse(mat4, linalg.inverse(mat4)))
+        self.assertFalse(linalg.verify_product(mat4, mat4, mat4))
+        # checking never multiplies matrices, even when every element
+        # has its own large denominator
+        mat5, mat6 = (
+            Matrix(
+                [
+                    [
+                        Fraction(rand_index(1, 99), getrandbits(200) | 1)
+                        for _ in range(16)
+                    ]
+                    for _ in range(16)
+                ]
+            )
+            for _ in range(2)
+        )
+        product = mat5 @ mat6
+        wrong = product * 2
+        self.assertIsNone(product._scaled_form())
+
+        def no_product(*args: object) -> None:
+            raise AssertionError("verification multiplied matrices")
+
+        with patch.object(Matrix, "__matmul__", no_product):
+            self.assertTrue(linalg.verify_product(mat5, mat6, product))
+            self.assertFalse(linalg.verify_product(mat5, mat6, wrong))
+        with self.assertRaises(DimensionMismatchError):
+            linalg.verify_product(
+                rand_mat(2, 3), rand_mat(2, 3), rand_mat(2, 3)
+            )
+        with self.assertRaises(RectangularMatrixError):
+            linalg.verify_inverse(rand_mat(2, 3), rand_mat(2, 3))
+        with self.assertRaises(ValueError):
+            linalg.verify_inverse(rand_mat(2, 2), rand_mat(2, 2), 0)
 
 
 if __name__ == "__main__":
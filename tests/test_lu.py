@@ -0,0 +1,114 @@
+import unittest
+from fractions import Fraction
+
+import momlib._linalg as linalg
+from momlib import (
+    DimensionMismatchError,
+    LinearDependenceError,
+    LUFactorization,
+    Matrix,
+    RectangularMatrixError,
+    Vector,
+)
+from tests.helpers import rand_index, rand_mat, rand_vec
+
+
+class TestLUFactorization(unittest.TestCase):
+    def test_init(self):
+        mat1 = Matrix([[0, 2, 4], [1, 1, 1], [2, 2, 3]])
+        factorization = linalg.lu(mat1, "partial")
+        self.assertIsInstance(factorization, LUFactorization)
+        self.assertIs(factorization.source, mat1)
+        self.assertEqual(factorization.pivoting, "partial")
+        self.assertEqual(factorization.permutation, (2, 0, 1))
+        self.assertEqual(factorization.sign, 1)
+        self.assertEqual(
+            factorization.lower,
+            Matrix([[1, 0, 0], [0, 1, 0], [Fraction(1, 2), 0, 1]]),
+        )
+        self.assertEqual(
+            factorization.upper,
+            Matrix([[2, 2, 3], [0, 2, 4], [0, 0, Fraction(-1, 2)]]),
+        )
+        self.assertEqual(LUFactorization(mat1, "first").sign, -1)
+        with self.assertRaises(RectangularMatrixError):
+            linalg.lu(rand_mat(2, 3))
+        with self.assertRaises(ValueError):
+            linalg.lu(mat1, "largest")  # type: ignore
+
+    def test_factors(self):
+        for _ in range(10):
+            side_len = rand_index(1, 12)
+            items = [list(row) for row in rand_mat(side_len, side_len)]
+            if side_len > 2 and rand_index(0, 1):
+                # Make the matrix singular
+                items[-1] = [a - 2 * b for a, b in zip(items[0], items[1])]
+            mat1 = Matrix(items)
+            for pivoting in (None, "partial", "first", "markowitz"):
+                factorization = LUFactorization(mat1, pivoting)
+                permutation = Matrix(
+                    [
+                        [int(col == origin) for col in range(side_len)]
+                        for origin in factorization.permutation
+                    ]
+                )
+                lower = factorization.lower
+                upper = factorization.upper
+                self.assertEqual(permutation @ mat1, lower @ upper)
+                for row in range(side_len):
+                    self.assertEqual(lower[row, row], 1)
+                    for col in range(row + 1, side_len):
+                        self.assertEqual(lower[row, col], 0)
+                        self.assertEqual(upper[col, row], 0)
+                self.assertEqual(
+                    factorization.determinant(), linalg.determinant(mat1)
+                )
+                self.assertEqual(
+                    factorization.is_singular(), linalg.rank(mat1) < side_len
+                )
+
+    def test_repr(self):
+        mat1 = rand_mat(3, 3)
+        factorization = LUFactorization(mat1, "first")
+        copy = eval(repr(factorization))
+        self.assertEqual(copy.source, mat1)
+        self.assertEqual(copy.pivoting, "first")
+        self.assertEqual(copy.upper, factorization.upper)
+
+    def test_solve(self):
+        for side_len in (1, 2, 5, 9, 16):
+            mat1 = rand_mat(side_len, side_len)
+            factorization = linalg.lu(mat1)
+            for _ in range(3):
+                vec1 = rand_vec(side_len)
+                solution = factorization.solve(vec1)
+                self.assertIsInstance(solution, Vector)
+                self.assertEqual(mat1 @ solution, vec1)
+            mat2 = rand_mat(side_len, 4)
+            self.assertEqual(mat1 @ factorization.solve(mat2), mat2)
+            self.assertEqual(
+                factorization.solve(mat2), linalg.solve(mat1, mat2)
+            )
+        with self.assertRaises(DimensionMismatchError):
+            factorization.solve(rand_vec(3))
+        mat3 = Matrix([[1, 2, 3], [2, 4, 6], [0, 1, 1]])
+        factorization = linalg.lu(mat3)
+        self.assertTrue(factorization.is_singular())
+        self.assertEqual(factorization.determinant(), 0)
+        with self.assertRaises(LinearDependenceError):
+            factorization.solve(Vector([1, 2, 3]))
+        with self.assertRaises(LinearDependenceError):
+            factorization.inverse()
+
+    def test_inverse(self):
+        for side_len in (1, 3, 7, 14):
+            mat1 = rand_mat(side_len, side_len)
+            factorization = LUFactorization(mat1)
+            inverse = factorization.inverse()
+            self.assertEqual(mat1 @ inverse, linalg.identity(side_len))
+            self.assertEqual(inverse, linalg.inverse(mat1))
+            self.assertIs(factorization.inverse(), inverse)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 from fractions import Fraction
 
-from momlib import Matrix, DimensionMismatchError
-from tests.helpers import rand_index, rand_mat, rand_num, maybe
+from momlib import Matrix, Vector, DimensionMismatchError, split_vectors
+from tests.helpers import rand_index, rand_mat, rand_num, rand_vec, maybe
 
 
 class TestMatrix(unittest.TestCase):
@@ -63,6 +63,43 @@ class TestMatrix(unittest.TestCase):
             mat1[2:2, 2:2]
         self.assertEqual(mat1, mat1[:, :])
 
+    def test_slice_views(self):
+        for _ in range(10):
+            size = (rand_index(2), rand_index(2))
+            mat1 = rand_mat(*size)
+            elements = mat1.elements
+            for key_r, key_c in (
+                (slice(1, None), slice(None, -1)),
+                (slice(None, None, -1), slice(None, None, 2)),
+                (slice(None), size[1] - 1),
+                (-1, slice(None, None, -2)),
+            ):
+                rows = (
+                    range(*key_r.indices(size[0]))
+                    if isinstance(key_r, slice)
+                    else [key_r % size[0]]
+                )
+                cols = (
+                    range(*key_c.indices(size[1]))
+                    if isinstance(key_c, slice)
+                    else [key_c % size[1]]
+                )
+                view = mat1[key_r, key_c]
+                self.assertEqual(
+                    view,
+                    Matrix([[elements[r][c] for c in cols] for r in rows]),
+                )
+                self.assertEqual(
+                    view.elements,
+                    [
+                        [view[r, c] for c in range(len(cols))]
+                        for r in range(len(rows))
+                    ],
+                )
+            self.assertEqual(
+                hash(mat1[1:, 1:]), hash(Matrix(mat1[1:, 1:].elements))
+            )
+
     def test_matmul(self):
         mat1 = rand_mat(5, 3)
         mat2 = rand_mat(3, 5)
@@ -72,6 +109,57 @@ class TestMatrix(unittest.TestCase):
         self.assertEqual(mat4.shape, (3, 3))
         with self.assertRaises(DimensionMismatchError):
             rand_mat(2, 3).__matmul__(rand_mat(2, 3))
+        for _ in range(10):
+            size = (rand_index(), rand_index(), rand_index())
+            mat5 = rand_mat(size[0], size[1])
+            mat6 = rand_mat(size[1], size[2])
+            mat7 = mat5 @ mat6
+            for i in range(size[0]):
+                for j in range(size[2]):
+                    self.assertEqual(
+                        mat7[i, j],
+                        sum(
+                            (mat5[i, k] * mat6[k, j] for k in range(size[1])),
+                            start=Fraction(0),
+                        ),
+                    )
+        # denominators too large to share, so each row and column is
+        # scaled on its own
+        mat8 = Matrix([[Fraction(1, 2**300), Fraction(1, 3**200)], [1, 2]])
+        mat9 = mat8 @ mat8
+        for i in range(2):
+            for j in range(2):
+                self.assertEqual(
+                    mat9[i, j],
+                    mat8[i, 0] * mat8[0, j] + mat8[i, 1] * mat8[1, j],
+                )
+
+    def test_vector_product(self):
+        with self.assertRaises(DimensionMismatchError):
+            rand_mat(2, 3) @ rand_vec(2)
+        with self.assertRaises(DimensionMismatchError):
+            rand_vec(3) @ rand_mat(2, 3)
+        for _ in range(10):
+            size = (rand_index(), rand_index(1, 20))
+            mat1 = rand_mat(*size)
+            mat2 = Matrix([[n.numerator for n in row] for row in mat1])
+            vec1 = rand_vec(size[1])
+            vec2 = rand_vec(size[0])
+            vec3 = Vector(n.numerator for n in vec2)
+            for mat in (mat1, mat2):
+                product1 = mat @ vec1
+                self.assertIsInstance(product1, Vector)
+                self.assertEqual(
+                    list(product1),
+                    [row @ vec1 for row in split_vectors(mat, "row")],
+                )
+                for vec in (vec2, vec3):
+                    product2 = vec @ mat
+                    self.assertIsInstance(product2, Vector)
+                    self.assertEqual(
+                        list(product2),
+                        [vec @ col for col in split_vectors(mat, "col")],
+                    )
 
     def test_multiply(self):
         for _ in range(10):
@@ -179,6 +267,23 @@ class TestMatrix(unittest.TestCase):
                 for j in range(size[1]):
                     self.assertEqual(neg_mat1[i, j], -mat1[i, j])
 
+    def test_result_elements(self):
+        mat1 = Matrix([[1, 2], [3, 4]])
+        for result in (
+            mat1 + mat1,
+            mat1 @ mat1,
+            mat1 * 0.5,
+            0.1 - mat1,
+            mat1 / 3,
+            -mat1,
+            mat1 | mat1,
+        ):
+            for row in result:
+                for item in row:
+                    self.assertIsInstance(item, Fraction)
+        self.assertEqual(mat1 * 0.5, Matrix([[0.5, 1.0], [1.5, 2.0]]))
+        self.assertEqual((0.1 - mat1)[0, 0], Fraction(0.1) - 1)
+
     def test_equality(self):
         for _ in range(10):
             size = (rand_index(), rand_index())
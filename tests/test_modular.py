@@ -0,0 +1,76 @@
+import unittest
+from fractions import Fraction
+
+from momlib import ModularMatrix, DimensionMismatchError
+from momlib._modular import is_prime, modular_rank, random_prime
+from tests.helpers import rand_index, rand_mat
+
+
+class TestModularMatrix(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            ModularMatrix([], 7)
+        with self.assertRaises(ValueError):
+            ModularMatrix([[1, 2], [3]], 7)
+        with self.assertRaises(ValueError):
+            ModularMatrix([[1]], 8)
+        with self.assertRaises(ZeroDivisionError):
+            ModularMatrix([[Fraction(1, 7)]], 7)
+        mat = ModularMatrix([[-1, Fraction(1, 2)], [9, 4]], 7)
+        self.assertEqual(mat.elements, [[6, 4], [2, 4]])
+        self.assertEqual(mat.shape, (2, 2))
+        self.assertEqual(mat.modulus, 7)
+        self.assertEqual(mat[-1, 0], 2)
+        with self.assertRaises(IndexError):
+            mat[2, 0]
+
+    def test_repr_hash(self):
+        mat = ModularMatrix([[1, 2, 3], [4, 5, 6]], 5)
+        self.assertEqual(mat, eval(repr(mat)))
+        self.assertEqual(hash(mat), hash(ModularMatrix(mat.elements, 5)))
+        self.assertNotEqual(mat, ModularMatrix(mat.elements, 7))
+
+    def test_arithmetic(self):
+        modulus = random_prime()
+        for _ in range(10):
+            size = (rand_index(), rand_index(), rand_index())
+            mat1 = rand_mat(size[0], size[1])
+            mat2 = rand_mat(size[1], size[2])
+            mod1 = ModularMatrix(mat1, modulus)
+            mod2 = ModularMatrix(mat2, modulus)
+            self.assertEqual(mod1 @ mod2, ModularMatrix(mat1 @ mat2, modulus))
+            self.assertEqual(mod1 + mod1, ModularMatrix(mat1 * 2, modulus))
+            self.assertEqual(
+                mod1 - 3 * mod1, ModularMatrix(-2 * mat1, modulus)
+            )
+            self.assertEqual(
+                -mod1 * mod1, ModularMatrix(-mat1 * mat1, modulus)
+            )
+        with self.assertRaises(DimensionMismatchError):
+            ModularMatrix([[1, 2]], 3) @ ModularMatrix([[1, 2]], 3)
+        with self.assertRaises(ValueError):
+            ModularMatrix([[1]], 3) + ModularMatrix([[1]], 5)
+
+    def test_primes(self):
+        primes = [n for n in range(50) if is_prime(n)]
+        self.assertEqual(
+            primes, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+        )
+        self.assertFalse(is_prime(561))  # Carmichael number
+        self.assertTrue(is_prime(2**61 - 1))
+        prime = random_prime(20)
+        self.assertTrue(is_prime(prime))
+        self.assertEqual(prime.bit_length(), 20)
+
+    def test_rank(self):
+        # singular over the rationals, and so modulo any prime
+        mat1 = ModularMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]], 101)
+        self.assertEqual(modular_rank(mat1), 2)
+        # invertible over the rationals, but not modulo 5
+        mat2 = ModularMatrix([[1, 2], [3, 1]], 5)
+        self.assertEqual(modular_rank(mat2), 1)
+        self.assertEqual(modular_rank(ModularMatrix([[1, 2], [3, 1]], 7)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from fractions import Fraction
+
+from momlib import Matrix, Vector, get_float_policy, set_float_policy
+
+
+class TestFloatPolicy(unittest.TestCase):
+    def tearDown(self):
+        set_float_policy("exact")
+
+    def test_per_call(self):
+        self.assertEqual(Vector([0.1]).elements, [Fraction(0.1)])
+        self.assertEqual(Vector([0.1], "decimal").elements, [Fraction(1, 10)])
+        self.assertEqual(
+            Matrix([[0.1, 1 / 3]], 10).elements,
+            [[Fraction(1, 10), Fraction(1, 3)]],
+        )
+        # exact values are never rounded
+        self.assertEqual(
+            Vector([Fraction(1, 11), 7], 10).elements,
+            [Fraction(1, 11), Fraction(7)],
+        )
+        with self.assertRaises(OverflowError):
+            Vector([float("inf")], "decimal")
+
+    def test_global(self):
+        self.assertEqual(get_float_policy(), "exact")
+        set_float_policy("decimal")
+        self.assertEqual(get_float_policy(), "decimal")
+        self.assertEqual(
+            Matrix([[0.25, 0.1]]), Matrix([[0.25, 0.1]], "decimal")
+        )
+        self.assertEqual(Vector([0.1], "exact").elements, [Fraction(0.1)])
+        for policy in (0, -3, "fast", True):
+            with self.assertRaises(ValueError):
+                set_float_policy(policy)
+            with self.assertRaises(ValueError):
+                Vector([0.5], policy)
+        self.assertEqual(get_float_policy(), "decimal")
+
+    def test_operands(self):
+        set_float_policy("decimal")
+        self.assertEqual(
+            Matrix([[1, 2]]) * 0.1, Matrix([[Fraction(1, 10), Fraction(1, 5)]])
+        )
+        self.assertEqual(0.1 + Vector([1]), Vector([Fraction(11, 10)]))
+        set_float_policy(10)
+        self.assertEqual(
+            Vector([3]) / (1 / 3), Vector([9])  # rounded back to 1/3
+        )
+
+    def test_float_subclass(self):
+        class Real(float):
+            pass
+
+        self.assertEqual(Vector([Real(0.1)], "decimal"), Vector([0.1], 10))
+        set_float_policy("decimal")
+        self.assertEqual(Matrix([[1]]) * Real(0.1), Matrix([[0.1]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
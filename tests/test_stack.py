@@ -0,0 +1,95 @@
+import unittest
+from fractions import Fraction
+
+import momlib._linalg as linalg
+from momlib import (
+    Matrix,
+    MatrixStack,
+    DimensionMismatchError,
+    LinearDependenceError,
+    RectangularMatrixError,
+)
+from tests.helpers import rand_index, rand_mat
+
+
+class TestMatrixStack(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            MatrixStack([])
+        with self.assertRaises(DimensionMismatchError):
+            MatrixStack([rand_mat(2, 2), rand_mat(2, 3)])
+        mats = [rand_mat(2, 3) for _ in range(4)]
+        stack = MatrixStack(mats)
+        self.assertEqual(len(stack), 4)
+        self.assertEqual(stack.shape, (2, 3))
+        self.assertEqual(list(stack), mats)
+        self.assertEqual(stack[-1], mats[-1])
+        self.assertEqual(list(stack[1:3]), mats[1:3])
+        with self.assertRaises(IndexError):
+            stack[4]
+        with self.assertRaises(ValueError):
+            stack[2:2]
+        self.assertEqual(
+            MatrixStack([[[1, 0.5]], [[2, 3]]]),
+            MatrixStack([Matrix([[1, Fraction(1, 2)]]), Matrix([[2, 3]])]),
+        )
+
+    def test_repr_hash(self):
+        stack = MatrixStack([rand_mat(2, 2) for _ in range(3)])
+        self.assertEqual(stack, eval(repr(stack)))
+        self.assertEqual(hash(stack), hash(MatrixStack(list(stack))))
+
+    def test_matmul(self):
+        for size in (3, 8):
+            mats1 = [rand_mat(size, 4) for _ in range(5)]
+            mats2 = [rand_mat(4, size) for _ in range(5)]
+            mats2[0] = Matrix(
+                [[Fraction(1, 2**200 + 1)] * size]
+                + [[Fraction(1, 3**200)] * size] * 3
+            )
+            stack1 = MatrixStack(mats1)
+            stack2 = MatrixStack(mats2)
+            self.assertEqual(
+                list(stack1 @ stack2),
+                [mat1 @ mat2 for mat1, mat2 in zip(mats1, mats2)],
+            )
+            self.assertEqual(
+                list(stack1 @ mats2[1]), [mat1 @ mats2[1] for mat1 in mats1]
+            )
+            self.assertEqual(
+                list(mats1[1] @ stack2), [mats1[1] @ mat2 for mat2 in mats2]
+            )
+        with self.assertRaises(DimensionMismatchError):
+            stack1 @ stack1
+        with self.assertRaises(DimensionMismatchError):
+            stack1 @ MatrixStack(mats2[:2])
+
+    def test_linalg(self):
+        for size in (rand_index(1, 6), rand_index(7, 9)):
+            mats = [rand_mat(size, size) for _ in range(5)]
+            stack = MatrixStack(mats)
+            self.assertEqual(
+                linalg.determinant(stack),
+                tuple(map(linalg.determinant, mats)),
+            )
+            self.assertEqual(
+                list(linalg.row_reduce(stack, "ref")),
+                [linalg.row_reduce(mat, "ref") for mat in mats],
+            )
+            self.assertEqual(
+                list(linalg.row_reduce(stack)),
+                [linalg.row_reduce(mat) for mat in mats],
+            )
+            try:
+                inverses = linalg.inverse(stack)
+            except LinearDependenceError:
+                continue  # shouldn't happen often, just skip if it does
+            self.assertEqual(list(inverses), list(map(linalg.inverse, mats)))
+        with self.assertRaises(LinearDependenceError):
+            linalg.inverse(MatrixStack([rand_mat(2, 2), Matrix([[1, 2]] * 2)]))
+        with self.assertRaises(RectangularMatrixError):
+            linalg.determinant(MatrixStack([rand_mat(2, 3)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
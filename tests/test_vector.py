@@ -48,6 +48,18 @@ class TestVector(unittest.TestCase):
         self.assertEqual(vec1 @ vec2, 0)
         with self.assertRaises(DimensionMismatchError):
             vec1.__matmul__(Vector([1, 2]))
+        for _ in range(10):
+            length = rand_index()
+            vec3 = rand_vec(length)
+            vec4 = rand_vec(length)
+            self.assertEqual(
+                vec3 @ vec4,
+                sum((vec3[i] * vec4[i] for i in range(length)), Fraction(0)),
+            )
+        vec5 = Vector([Fraction(1, 2**300), Fraction(1, 3**200), 5])
+        self.assertEqual(
+            vec5 @ vec5, sum((item * item for item in vec5), Fraction(0))
+        )
 
     def test_get_slice(self):
         vec1 = rand_vec(5)
@@ -58,6 +70,23 @@ class TestVector(unittest.TestCase):
             vec1[2:2]
         self.assertEqual(vec1, vec1[:])
 
+    def test_slice_views(self):
+        for _ in range(10):
+            length = rand_index(2)
+            vec1 = rand_vec(length)
+            elements = vec1.elements
+            for key in (
+                slice(1, None),
+                slice(None, None, -1),
+                slice(-1, 0, -2),
+                slice(None, None, 3),
+            ):
+                view = vec1[key]
+                self.assertEqual(view, Vector(elements[key]))
+                self.assertEqual(view.elements, elements[key])
+                self.assertEqual(hash(view), hash(Vector(elements[key])))
+                self.assertEqual(view[::-1], Vector(elements[key][::-1]))
+
     def test_multiply(self):
         for _ in range(10):
             length = rand_index()
@@ -143,6 +172,13 @@ class TestVector(unittest.TestCase):
             for i in range(length):
                 self.assertEqual(neg_vec1[i], -vec1[i])
 
+    def test_result_elements(self):
+        vec1 = Vector([1, 2, 3])
+        for result in (vec1 + vec1, vec1 * 0.5, 0.1 - vec1, vec1 / 3, -vec1):
+            for item in result:
+                self.assertIsInstance(item, Fraction)
+        self.assertEqual(vec1 * 0.5, Vector([0.5, 1.0, 1.5]))
+
     def test_equality(self):
         for _ in range(10):
             length = rand_index()
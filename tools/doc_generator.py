@@ -55,9 +55,30 @@ def main():
     with open(PATH + "vector.md", "w") as f:
         print("# Vector Object Instance Methods", file=f)
         print(gen_doc(momlib.Vector), file=f)
+    with open(PATH + "float_matrix.md", "w") as f:
+        print("# FloatMatrix Object Instance Methods", file=f)
+        print(gen_doc(momlib.FloatMatrix), file=f)
+    with open(PATH + "float_vector.md", "w") as f:
+        print("# FloatVector Object Instance Methods", file=f)
+        print(gen_doc(momlib.FloatVector), file=f)
+    with open(PATH + "modular_matrix.md", "w") as f:
+        print("# ModularMatrix Object Instance Methods", file=f)
+        print(gen_doc(momlib.ModularMatrix), file=f)
+    with open(PATH + "matrix_stack.md", "w") as f:
+        print("# MatrixStack Object Instance Methods", file=f)
+        print(gen_doc(momlib.MatrixStack), file=f)
+    with open(PATH + "echelon_form.md", "w") as f:
+        print("# EchelonForm Object Instance Methods", file=f)
+        print(gen_doc(momlib.EchelonForm), file=f)
+    with open(PATH + "lu_factorization.md", "w") as f:
+        print("# LUFactorization Object Instance Methods", file=f)
+        print(gen_doc(momlib.LUFactorization), file=f)
     with open(PATH + "linalg.md", "w") as f:
         print("# Linear Algebra Tools", file=f)
         print(gen_doc(momlib._linalg), file=f)  # type: ignore
+    with open(PATH + "policy.md", "w") as f:
+        print("# Float Ingestion Policy", file=f)
+        print(gen_doc(momlib._policy), file=f)  # type: ignore
 
 
 if __name__ == "__main__":